@@ -56,6 +56,7 @@ INSTALLED_APPS = [
     'mpcVoting',
     'minutesAnalysis',
     'mpcDiscussions',
+    'members',
 ]
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
@@ -174,4 +175,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Memory-mapped minutes analytics snapshots shared by all workers
+MINUTES_SNAPSHOT_DIR = BASE_DIR / 'var' / 'minutes_snapshots'
+
 STATICFILES_DIRS = [BASE_DIR / "static"]
\ No newline at end of file
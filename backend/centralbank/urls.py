@@ -22,6 +22,7 @@ urlpatterns = [
     path("api/mpcVoting/", include("mpcVoting.urls")),
     path("api/minutesAnalysis/", include("minutesAnalysis.urls")),
     path("api/mpcDiscussions/", include("mpcDiscussions.urls")),
+    path("api/members/", include("members.urls")),
     # for handling issue
     # re_path(r'^.*', TemplateView.as_view(template_name="index.html")),
 ]
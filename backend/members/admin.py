@@ -0,0 +1,24 @@
+from django.contrib import admin
+from .models import Member, MemberAlias, MemberProfile
+
+class MemberAliasInline(admin.TabularInline):
+    model = MemberAlias
+    extra = 0
+
+@admin.register(Member)
+class MemberAdmin(admin.ModelAdmin):
+    list_display = ['name', 'created_at']
+    search_fields = ['name', 'aliases__alias']
+    inlines = [MemberAliasInline]
+
+@admin.register(MemberAlias)
+class MemberAliasAdmin(admin.ModelAdmin):
+    list_display = ['alias', 'member']
+    search_fields = ['alias', 'member__name']
+    autocomplete_fields = ['member']
+
+@admin.register(MemberProfile)
+class MemberProfileAdmin(admin.ModelAdmin):
+    list_display = ['name', 'member_type', 'hikes', 'cuts', 'holds', 'discussions', 'dissent_count', 'updated_at']
+    search_fields = ['name']
+    readonly_fields = ['updated_at']
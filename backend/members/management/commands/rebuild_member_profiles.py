@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from members import profiles
+
+class Command(BaseCommand):
+    help = 'Recompute every member profile from voting records, discussions, roster and decisions'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding member profiles...')
+        rows = profiles.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {rows} member profiles')
+        )
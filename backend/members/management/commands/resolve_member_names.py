@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from members.models import Member
+from mpc.models import MPCMember
+from mpcDecision.models import MPCDecision
+from mpcDiscussions.models import MPCDiscussion
+from mpcVoting.models import MemberVoting
+
+class Command(BaseCommand):
+    help = 'Re-resolve member names in voting, discussions, roster and decisions to Member ids, e.g. after editing aliases'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Resolving member names...')
+        with transaction.atomic():
+            for model in (MemberVoting, MPCDiscussion, MPCMember):
+                names = list(model.objects.order_by().values_list('name', flat=True).distinct())
+                ids = Member.objects.ids_for(names)
+                for name in names:
+                    # Queryset update on the base manager, so MPCDiscussion's
+                    # derived-column handling is not re-run for every name
+                    model._base_manager.filter(name=name).update(member_id=ids.get(name))
+                self.stdout.write(f'  - {model._meta.verbose_name_plural}: {len(names)} names')
+
+            decisions = MPCDecision.objects.all()
+            for decision in decisions:
+                decision.sync_dissents()
+            self.stdout.write(f'  - decisions: {len(decisions)}')
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully resolved member names to {Member.objects.count()} members')
+        )
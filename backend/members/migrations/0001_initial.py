@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Member',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_index=True, help_text="Display name, e.g. 'Dr. Urjit R. Patel'", max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Member',
+                'verbose_name_plural': 'Members',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='MemberAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(help_text="Normalized name, e.g. 'urjit r patel'", max_length=100, unique=True)),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Member Alias',
+                'verbose_name_plural': 'Member Aliases',
+                'ordering': ['alias'],
+            },
+        ),
+    ]
@@ -0,0 +1,95 @@
+import re
+
+from django.db import migrations
+
+HONORIFICS = {'dr', 'shri', 'sri', 'smt', 'prof', 'mr', 'mrs', 'ms'}
+NAME_TOKEN_RE = re.compile(r'[a-z0-9]+')
+DISSENT_COUNT_RE = re.compile(r'^\s*\d+\s*:\s*\d+')
+
+
+# Frozen copies of members.models.normalize_name / short_name,
+# Member.objects.ids_for and mpcDecision.models.parse_dissenters
+
+def normalize_name(name):
+    tokens = NAME_TOKEN_RE.findall((name or '').lower())
+    return ' '.join(token for token in tokens if token not in HONORIFICS)
+
+
+def short_name(normalized):
+    tokens = normalized.split()
+    return f'{tokens[0]} {tokens[-1]}' if len(tokens) > 1 else normalized
+
+
+def parse_dissenters(explicit_dissenter):
+    names = DISSENT_COUNT_RE.sub('', explicit_dissenter or '')
+    return [
+        name.strip() for name in names.split(',')
+        if name.strip() and name.strip().upper() not in ('NA', 'N/A', 'NONE')
+    ]
+
+
+def ids_for(Member, MemberAlias, names):
+    keys = {name: normalize_name(name) for name in set(names) if normalize_name(name)}
+    aliases = dict(MemberAlias.objects.values_list('alias', 'member_id'))
+    ids = {}
+    for name, key in sorted(keys.items(), key=lambda item: -len(item[1])):
+        member_id = aliases.get(key) or aliases.get(short_name(key))
+        if member_id is None:
+            member_id = Member.objects.create(name=' '.join(name.split())).id
+        for alias in (key, short_name(key)):
+            if alias not in aliases:
+                MemberAlias.objects.create(alias=alias, member_id=member_id)
+                aliases[alias] = member_id
+        ids[name] = member_id
+    return ids
+
+
+def backfill_members(apps, schema_editor):
+    Member = apps.get_model('members', 'Member')
+    MemberAlias = apps.get_model('members', 'MemberAlias')
+    MemberVoting = apps.get_model('mpcVoting', 'MemberVoting')
+    MPCDiscussion = apps.get_model('mpcDiscussions', 'MPCDiscussion')
+    MPCMember = apps.get_model('mpc', 'MPCMember')
+    MPCDecision = apps.get_model('mpcDecision', 'MPCDecision')
+    DecisionDissent = apps.get_model('mpcDecision', 'DecisionDissent')
+
+    named_models = (MemberVoting, MPCDiscussion, MPCMember)
+    decisions = list(MPCDecision.objects.values_list('id', 'explicit_dissenter'))
+    names = {
+        name for model in named_models for name in model.objects.values_list('name', flat=True)
+    } | {name for _, dissenter in decisions for name in parse_dissenters(dissenter)}
+    ids = ids_for(Member, MemberAlias, names)
+
+    for model in named_models:
+        for name in model.objects.values_list('name', flat=True).distinct():
+            model.objects.filter(name=name).update(member_id=ids.get(name))
+    DecisionDissent.objects.bulk_create([
+        DecisionDissent(decision_id=decision_id, member_id=ids[name])
+        for decision_id, dissenter in decisions
+        for name in set(parse_dissenters(dissenter))
+        if name in ids
+    ], ignore_conflicts=True)
+
+
+def clear_members(apps, schema_editor):
+    apps.get_model('mpcDecision', 'DecisionDissent').objects.all().delete()
+    for app_label, model_name in (
+        ('mpcVoting', 'MemberVoting'), ('mpcDiscussions', 'MPCDiscussion'), ('mpc', 'MPCMember')
+    ):
+        apps.get_model(app_label, model_name).objects.update(member_id=None)
+    apps.get_model('members', 'Member').objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('mpc', '0002_member_fk'),
+        ('mpcDecision', '0002_decisiondissent'),
+        ('mpcDiscussions', '0005_member_fk'),
+        ('mpcVoting', '0003_member_fk'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_members, clear_members),
+    ]
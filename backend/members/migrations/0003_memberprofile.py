@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0002_backfill_members'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberProfile',
+            fields=[
+                ('member', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='profile', serialize=False, to='members.member')),
+                ('name', models.CharField(max_length=100)),
+                ('hikes', models.PositiveIntegerField(default=0)),
+                ('cuts', models.PositiveIntegerField(default=0)),
+                ('holds', models.PositiveIntegerField(default=0)),
+                ('tenure', models.CharField(blank=True, max_length=100, null=True)),
+                ('designation', models.CharField(blank=True, max_length=100, null=True)),
+                ('joined_date', models.DateField(blank=True, null=True)),
+                ('member_type', models.CharField(blank=True, max_length=10, null=True)),
+                ('discussions', models.PositiveIntegerField(default=0)),
+                ('average_analysis_score', models.FloatField(blank=True, null=True)),
+                ('first_period', models.DateField(blank=True, null=True)),
+                ('last_period', models.DateField(blank=True, null=True)),
+                ('forecast_errors', models.JSONField(default=dict, help_text="{variable: {count, mae, rmse, bias}} over all the member's discussions")),
+                ('dissent_count', models.PositiveIntegerField(default=0)),
+                ('dissent_history', models.JSONField(default=list, help_text='[{date, policy_change, voting_pattern}], newest first')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Member Profile',
+                'verbose_name_plural': 'Member Profiles',
+            },
+        ),
+    ]
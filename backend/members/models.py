@@ -0,0 +1,144 @@
+import re
+
+from django.db import models, transaction
+
+HONORIFICS = {'dr', 'shri', 'sri', 'smt', 'prof', 'mr', 'mrs', 'ms'}
+NAME_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def normalize_name(name):
+    """
+    Lowercase a member name and drop honorifics and punctuation:
+    'Dr. Urjit R. Patel' -> 'urjit r patel'
+    """
+    tokens = NAME_TOKEN_RE.findall((name or '').lower())
+    return ' '.join(token for token in tokens if token not in HONORIFICS)
+
+
+def short_name(normalized):
+    """First and last name of a normalized name: 'michael debabrata patra' -> 'michael patra'"""
+    tokens = normalized.split()
+    return f'{tokens[0]} {tokens[-1]}' if len(tokens) > 1 else normalized
+
+
+class MemberQuerySet(models.QuerySet):
+    def ids_for(self, names):
+        """
+        Map member names, as written anywhere in the data, to Member ids.
+        A name resolves through its normalized form, then its first and last
+        name; names matching neither create a new member.
+        """
+        keys = {name: normalize_name(name) for name in set(names) if normalize_name(name)}
+        lookups = set(keys.values()) | {short_name(key) for key in keys.values()}
+        aliases = dict(MemberAlias.objects.filter(alias__in=lookups).values_list('alias', 'member_id'))
+
+        ids = {}
+        with transaction.atomic(using=self.db):
+            for name, key in sorted(keys.items(), key=lambda item: -len(item[1])):
+                member_id = aliases.get(key) or aliases.get(short_name(key))
+                if member_id is None:
+                    member_id = self.create(name=' '.join(name.split())).id
+                new_aliases = [alias for alias in (key, short_name(key)) if alias not in aliases]
+                MemberAlias.objects.bulk_create(
+                    [MemberAlias(alias=alias, member_id=member_id) for alias in new_aliases],
+                    ignore_conflicts=True
+                )
+                for alias in new_aliases:
+                    aliases[alias] = member_id
+                ids[name] = member_id
+        return ids
+
+    def find(self, name):
+        """The Member id a name resolves to, without creating one; None if unknown"""
+        key = normalize_name(name)
+        if not key:
+            return None
+        aliases = dict(MemberAlias.objects.filter(alias__in={key, short_name(key)}).values_list('alias', 'member_id'))
+        return aliases.get(key) or aliases.get(short_name(key))
+
+    def resolve(self, name):
+        """The Member id for one name, or None for a blank name"""
+        return self.ids_for([name]).get(name)
+
+
+class Member(models.Model):
+    """
+    Canonical MPC member. Voting records, discussions, the roster and
+    decision dissents refer to members through this table; the spellings
+    used by each source are kept in MemberAlias.
+    """
+    name = models.CharField(max_length=100, db_index=True, help_text="Display name, e.g. 'Dr. Urjit R. Patel'")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = MemberQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['name']
+        verbose_name = "Member"
+        verbose_name_plural = "Members"
+
+    def __str__(self):
+        return self.name
+
+
+class MemberAlias(models.Model):
+    """Normalized spelling of a member name (see normalize_name) and the member it stands for"""
+    member = models.ForeignKey(Member, on_delete=models.CASCADE, related_name='aliases')
+    alias = models.CharField(max_length=100, unique=True, help_text="Normalized name, e.g. 'urjit r patel'")
+
+    class Meta:
+        ordering = ['alias']
+        verbose_name = "Member Alias"
+        verbose_name_plural = "Member Aliases"
+
+    def __str__(self):
+        return f"{self.alias} -> {self.member}"
+
+
+class MemberProfile(models.Model):
+    """
+    Denormalized member page: voting totals, roster details, discussion
+    scores, forecast errors and dissent history in one row. Kept current by
+    the signal handlers in members.signals, rebuilt with
+    `manage.py rebuild_member_profiles`.
+    """
+    member = models.OneToOneField(Member, on_delete=models.CASCADE, primary_key=True, related_name='profile')
+    name = models.CharField(max_length=100)
+
+    # Voting records
+    hikes = models.PositiveIntegerField(default=0)
+    cuts = models.PositiveIntegerField(default=0)
+    holds = models.PositiveIntegerField(default=0)
+    tenure = models.CharField(max_length=100, blank=True, null=True)
+
+    # Roster
+    designation = models.CharField(max_length=100, blank=True, null=True)
+    joined_date = models.DateField(blank=True, null=True)
+
+    # Discussions
+    member_type = models.CharField(max_length=10, blank=True, null=True)
+    discussions = models.PositiveIntegerField(default=0)
+    average_analysis_score = models.FloatField(blank=True, null=True)
+    first_period = models.DateField(blank=True, null=True)
+    last_period = models.DateField(blank=True, null=True)
+    forecast_errors = models.JSONField(
+        default=dict,
+        help_text="{variable: {count, mae, rmse, bias}} over all the member's discussions"
+    )
+
+    # Decisions
+    dissent_count = models.PositiveIntegerField(default=0)
+    dissent_history = models.JSONField(default=list, help_text="[{date, policy_change, voting_pattern}], newest first")
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Member Profile"
+        verbose_name_plural = "Member Profiles"
+
+    def __str__(self):
+        return f"Profile of {self.name}"
+
+    @property
+    def total_votes(self):
+        return self.hikes + self.cuts + self.holds
@@ -0,0 +1,88 @@
+"""
+Computation of the MemberProfile rows.
+
+Each source (voting records, roster, discussions, dissents) is read with
+one query per member, so refreshing the member touched by a write costs a
+handful of indexed lookups.
+"""
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Min, Sum
+
+from mpc.models import MPCMember
+from mpcDecision.models import DecisionDissent
+from mpcDiscussions import accuracy
+from mpcDiscussions.models import MPCDiscussion
+from mpcVoting.models import MemberVoting
+
+from .models import Member, MemberProfile
+
+
+def build(member):
+    """An unsaved MemberProfile for `member` from the current source rows"""
+    voting = MemberVoting.objects.filter(member=member).order_by().aggregate(
+        hikes=Sum('hikes'), cuts=Sum('cuts'), holds=Sum('holds')
+    )
+    tenure = MemberVoting.objects.filter(member=member).exclude(tenure=None).values_list('tenure', flat=True).first()
+    roster = MPCMember.objects.filter(member=member).order_by('-joined_date').values('designation', 'joined_date').first() or {}
+
+    discussions = MPCDiscussion.objects.filter(member=member)
+    scores = discussions.order_by().aggregate(
+        count=Count('id'),
+        average=Avg('analysis_score'),
+        first=Min('period'),
+        last=Max('period')
+    )
+    member_type = discussions.order_by('-period').values_list('member_type', flat=True).first()
+
+    dissents = list(
+        DecisionDissent.objects.filter(member=member).order_by('-decision__date').values_list(
+            'decision__date', 'decision__policy_change', 'decision__voting_pattern'
+        )
+    )
+
+    return MemberProfile(
+        member=member,
+        name=member.name,
+        hikes=voting['hikes'] or 0,
+        cuts=voting['cuts'] or 0,
+        holds=voting['holds'] or 0,
+        tenure=tenure,
+        designation=roster.get('designation'),
+        joined_date=roster.get('joined_date'),
+        member_type=member_type,
+        discussions=scores['count'],
+        average_analysis_score=scores['average'],
+        first_period=scores['first'],
+        last_period=scores['last'],
+        forecast_errors=accuracy.summarize(discussions) if scores['count'] else {},
+        dissent_count=len(dissents),
+        dissent_history=[
+            {'date': date.isoformat(), 'policy_change': policy_change, 'voting_pattern': voting_pattern}
+            for date, policy_change, voting_pattern in dissents
+        ],
+    )
+
+
+def refresh(member_ids):
+    """Recompute the profiles of the given members, skipping ids of deleted members"""
+    member_ids = {member_id for member_id in member_ids if member_id is not None}
+    with transaction.atomic():
+        for member in Member.objects.filter(pk__in=member_ids):
+            build(member).save()
+
+
+def build_missing():
+    """Build the profiles of members that have none yet, returning the number built"""
+    with transaction.atomic():
+        profiles = [build(member) for member in Member.objects.filter(profile__isnull=True)]
+        MemberProfile.objects.bulk_create(profiles)
+    return len(profiles)
+
+
+def rebuild():
+    """Recompute every profile, returning the number of rows"""
+    with transaction.atomic():
+        MemberProfile.objects.all().delete()
+        profiles = [build(member) for member in Member.objects.all()]
+        MemberProfile.objects.bulk_create(profiles)
+    return len(profiles)
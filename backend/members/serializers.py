@@ -0,0 +1,32 @@
+from rest_framework import serializers
+from .models import MemberProfile
+
+class MemberProfileSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source='member_id', read_only=True)
+    total_votes = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MemberProfile
+        fields = [
+            'id',
+            'name',
+            'member_type',
+            'tenure',
+            'designation',
+            'joined_date',
+            'hikes',
+            'cuts',
+            'holds',
+            'total_votes',
+            'discussions',
+            'average_analysis_score',
+            'first_period',
+            'last_period',
+            'forecast_errors',
+            'dissent_count',
+            'dissent_history',
+            'updated_at',
+        ]
+
+    def get_total_votes(self, obj):
+        return obj.total_votes
@@ -0,0 +1,74 @@
+"""
+Signal handlers keeping MemberProfile in step with its source rows.
+
+pre_save remembers which member a row pointed at before the write, so a
+row that moves to another member (a corrected name) refreshes both
+profiles. Queryset writes send no signals: the MPCDiscussion and MemberVote
+querysets refresh the profiles themselves; after queryset writes to the
+other sources run `manage.py rebuild_member_profiles`.
+
+Every member gets a profile when it is created, and after `migrate` the
+members that still have none (e.g. right after MemberProfile was added)
+are built, so the profile endpoint only ever reads.
+"""
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+
+from mpc.models import MPCMember
+from mpcDecision.models import DecisionDissent, MPCDecision
+from mpcDiscussions.models import MPCDiscussion
+from mpcVoting.models import MemberVoting
+
+from . import profiles
+from .models import Member
+
+
+@receiver(pre_save, sender=MemberVoting)
+@receiver(pre_save, sender=MPCDiscussion)
+@receiver(pre_save, sender=MPCMember)
+def remember_previous_member(sender, instance, raw=False, **kwargs):
+    if instance.pk is not None and not raw:
+        instance._previous_member_id = sender._base_manager.filter(pk=instance.pk).values_list(
+            'member_id', flat=True
+        ).first()
+
+
+@receiver(post_save, sender=MemberVoting)
+@receiver(post_save, sender=MPCDiscussion)
+@receiver(post_save, sender=MPCMember)
+@receiver(post_delete, sender=MemberVoting)
+@receiver(post_delete, sender=MPCDiscussion)
+@receiver(post_delete, sender=MPCMember)
+@receiver(post_delete, sender=DecisionDissent)
+def refresh_member_profile(sender, instance, raw=False, **kwargs):
+    if not raw:
+        profiles.refresh({instance.member_id, getattr(instance, '_previous_member_id', None)})
+
+
+@receiver(post_save, sender=Member)
+def refresh_own_profile(sender, instance, raw=False, **kwargs):
+    if not raw:
+        profiles.refresh([instance.pk])
+
+
+@receiver(post_migrate)
+def build_missing_profiles(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    if sender.name != 'members':
+        return
+    executor = MigrationExecutor(connections[using])
+    if executor.migration_plan(executor.loader.graph.leaf_nodes()):
+        # Partially migrated: the tables may not match the current models yet
+        return
+    profiles.build_missing()
+
+
+@receiver(post_save, sender=MPCDecision)
+def refresh_dissenter_profiles(sender, instance, raw=False, **kwargs):
+    # MPCDecision.save() syncs its DecisionDissent rows (bulk_create, no
+    # signals) after this handler runs, so read them once the save commits
+    if not raw:
+        transaction.on_commit(
+            lambda: profiles.refresh(instance.dissents.values_list('member_id', flat=True))
+        )
@@ -0,0 +1,69 @@
+from datetime import date
+
+from django.test import TestCase
+
+from mpcDecision.models import MPCDecision
+from mpcDiscussions.models import MPCDiscussion
+from mpcVoting.models import MemberVote, MemberVoting
+
+from . import profiles
+from .models import Member, MemberProfile
+
+
+class MemberProfileTests(TestCase):
+    def setUp(self):
+        self.member = Member.objects.get(pk=Member.objects.resolve('Dr. Ashima Goyal'))
+
+    def test_new_members_get_a_profile(self):
+        response = self.client.get(f'/api/members/{self.member.pk}/profile/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['name'], 'Dr. Ashima Goyal')
+
+    def test_profile_endpoint_does_not_build_profiles(self):
+        MemberProfile.objects.all().delete()
+
+        response = self.client.get(f'/api/members/{self.member.pk}/profile/')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(MemberProfile.objects.exists())
+        self.assertEqual(profiles.build_missing(), 1)
+        self.assertEqual(self.client.get(f'/api/members/{self.member.pk}/profile/').status_code, 200)
+
+    def test_discussion_queryset_writes_refresh_profiles(self):
+        for month_year in ('Jan 2024', 'Feb 2024'):
+            MPCDiscussion.objects.create(
+                month_year=month_year, name='Ashima Goyal', member_type='external', analysis_score=0.2
+            )
+
+        MPCDiscussion.objects.filter(month_year='Feb 2024').update(analysis_score=0.6)
+        self.assertAlmostEqual(MemberProfile.objects.get(pk=self.member.pk).average_analysis_score, 0.4)
+
+        MPCDiscussion.objects.filter(month_year='Jan 2024').delete()
+        profile = MemberProfile.objects.get(pk=self.member.pk)
+        self.assertEqual(profile.discussions, 1)
+        self.assertAlmostEqual(profile.average_analysis_score, 0.6)
+
+    def test_vote_bulk_create_refreshes_rollups_and_profiles(self):
+        decisions = [
+            MPCDecision.objects.create(
+                date=meeting_date,
+                policy_change=MPCDecision.RATE_HOLD,
+                voting_pattern='6-0 (Unanimous)',
+                explicit_dissenter='6:0 NA',
+                implicit_dissent_score='0.1 VADER'
+            )
+            for meeting_date in (date(2024, 2, 8), date(2024, 4, 5))
+        ]
+
+        MemberVote.objects.bulk_create([
+            MemberVote(decision=decision, member=self.member, vote=MPCDecision.RATE_HOLD)
+            for decision in decisions
+        ])
+
+        self.assertEqual(MemberVoting.objects.get(member=self.member).holds, 2)
+        self.assertEqual(MemberProfile.objects.get(pk=self.member.pk).holds, 2)
+
+        MemberVote.objects.filter(decision=decisions[0]).update(vote=MPCDecision.RATE_CUT)
+        profile = MemberProfile.objects.get(pk=self.member.pk)
+        self.assertEqual((profile.cuts, profile.holds), (1, 1))
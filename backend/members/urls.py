@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import member_profile
+
+urlpatterns = [
+    # Get the profile of a member
+    path('<int:pk>/profile/', member_profile, name='member-profile'),
+]
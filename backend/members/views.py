@@ -0,0 +1,17 @@
+from rest_framework import status
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from .models import MemberProfile
+from .serializers import MemberProfileSerializer
+
+@api_view(['GET'])
+def member_profile(request, pk):
+    """
+    GET /api/members/{id}/profile/
+    Returns the precomputed profile of a member: vote counts, tenure, roster
+    details, average analysis score, forecast errors and dissent history
+    """
+    profile = MemberProfile.objects.filter(pk=pk).first()
+    if profile is None:
+        return Response({'error': 'Member not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(MemberProfileSerializer(profile).data)
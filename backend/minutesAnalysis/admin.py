@@ -1,13 +1,23 @@
 from django.contrib import admin
-from .models import WordFrequency
+from .models import Vocabulary, WordFrequency, MinutesDocument, MinutesText, DistinctiveWord, WordAnomaly
+
+@admin.register(Vocabulary)
+class VocabularyAdmin(admin.ModelAdmin):
+    list_display = ('term',)
+    search_fields = ('term',)
+    ordering = ('term',)
+    list_per_page = 100
+
 
 @admin.register(WordFrequency)
 class WordFrequencyAdmin(admin.ModelAdmin):
     list_display = ('word', 'frequency', 'date', 'year', 'month')
     list_filter = ('date', 'frequency')  # Fixed: Use 'date' instead of 'date__year' and 'date__month'
-    search_fields = ('word', 'date')
+    search_fields = ('word__term', 'date')
     ordering = ('-date', '-frequency')
     date_hierarchy = 'date'  # This provides year/month filtering automatically
+    autocomplete_fields = ('word',)
+    list_select_related = ('word',)
     
     def year(self, obj):
         return obj.date.year
@@ -34,4 +44,43 @@ class WordFrequencyAdmin(admin.ModelAdmin):
             'date',
             'frequency',
             ('date', admin.DateFieldListFilter),  # This provides year/month filtering
-        ]
\ No newline at end of file
+        ]
+
+@admin.register(MinutesDocument)
+class MinutesDocumentAdmin(admin.ModelAdmin):
+    list_display = ('source', 'date', 'word_count', 'ingested_at')
+    search_fields = ('source', 'content_hash')
+    ordering = ('-date',)
+    date_hierarchy = 'date'
+    readonly_fields = ('content_hash', 'ingested_at')
+
+
+@admin.register(MinutesText)
+class MinutesTextAdmin(admin.ModelAdmin):
+    list_display = ('document', 'length')
+    search_fields = ('document__source',)
+    list_select_related = ('document',)
+    exclude = ('compressed',)
+    readonly_fields = ('document', 'length', 'preview')
+
+    def preview(self, obj):
+        return obj.text[:2000]
+    preview.short_description = 'Text (first 2000 characters)'
+
+@admin.register(DistinctiveWord)
+class DistinctiveWordAdmin(admin.ModelAdmin):
+    list_display = ('word', 'scope', 'year', 'date', 'rank', 'score', 'frequency')
+    list_filter = ('scope', 'year')
+    search_fields = ('word__term',)
+    ordering = ('scope', '-year', '-date', 'rank')
+    list_select_related = ('word',)
+    list_per_page = 100
+
+@admin.register(WordAnomaly)
+class WordAnomalyAdmin(admin.ModelAdmin):
+    list_display = ('word', 'date', 'frequency', 'baseline', 'score')
+    search_fields = ('word__term',)
+    ordering = ('-date', '-score')
+    date_hierarchy = 'date'
+    list_select_related = ('word',)
+    list_per_page = 100
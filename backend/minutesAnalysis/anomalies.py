@@ -0,0 +1,88 @@
+"""
+Word spike detection over the meeting history.
+
+For every meeting and word, the frequency is compared with the same word in
+the WINDOW preceding meetings using a robust z-score:
+
+    score = (frequency - median) / max(1.4826 * MAD, MIN_SCALE)
+
+Median and MAD are not dragged along by earlier spikes the way mean and
+standard deviation are. The scan is vectorized over sliding windows of an
+in-memory frequency matrix of every term (see matrix.read_matrix), a block of words at a time to bound memory.
+A change on one meeting date only affects that meeting and the WINDOW
+meetings after it, so refresh(since=...) rescans from that date onwards.
+"""
+import numpy as np
+from django.db import transaction
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .matrix import read_matrix
+from .models import Vocabulary, WordAnomaly
+
+WINDOW = 8
+THRESHOLD = 3.5
+MIN_FREQUENCY = 5
+MAD_SCALE = 1.4826  # makes the MAD comparable to a standard deviation
+MIN_SCALE = 1.0  # a word that never varied still needs a one-count margin
+WORD_BLOCK = 2048
+BATCH_SIZE = 1000
+
+
+def scan(counts, start_row=0, window=WINDOW, threshold=THRESHOLD, min_frequency=MIN_FREQUENCY):
+    """
+    Yield (row, column, frequency, baseline, score) for every flagged cell of
+    a dates x words count matrix, for rows from `start_row` on. Rows without
+    a full window of preceding meetings are not scored.
+    """
+    first = max(start_row, window)
+    if counts.shape[0] <= first:
+        return
+    for column in range(0, counts.shape[1], WORD_BLOCK):
+        block = np.asarray(counts[first - window:, column:column + WORD_BLOCK], dtype=np.float64)
+        # Window k covers the `window` meetings before target row k
+        history = sliding_window_view(block, window, axis=0)[:-1]
+        targets = block[window:]
+
+        baseline = np.median(history, axis=-1)
+        mad = np.median(np.abs(history - baseline[..., None]), axis=-1)
+        scores = (targets - baseline) / np.maximum(MAD_SCALE * mad, MIN_SCALE)
+
+        for row, offset in np.argwhere((scores >= threshold) & (targets >= min_frequency)):
+            yield (
+                first + int(row),
+                column + int(offset),
+                int(targets[row, offset]),
+                float(baseline[row, offset]),
+                float(scores[row, offset]),
+            )
+
+
+def refresh(since=None, matrix=None, **options):
+    """
+    Recompute WordAnomaly for meetings on or after `since` (all meetings when
+    None) from a read_matrix() result, read afresh when not given. Returns
+    the number of flagged rows.
+    """
+    if matrix is None:
+        matrix = read_matrix()
+    start_row = 0 if since is None else int(np.searchsorted(matrix.dates, np.datetime64(since, 'D')))
+    word_ids = dict(Vocabulary.objects.values_list('term', 'id'))
+
+    rows = [
+        WordAnomaly(
+            date=matrix.dates[row].item(),
+            word_id=word_ids[matrix.vocabulary[column]],
+            frequency=frequency,
+            baseline=baseline,
+            score=score,
+        )
+        for row, column, frequency, baseline, score in scan(matrix.counts, start_row, **options)
+    ]
+
+    with transaction.atomic():
+        stale = WordAnomaly.objects.all()
+        if since is not None:
+            stale = stale.filter(date__gte=since)
+        stale.delete()
+        WordAnomaly.objects.bulk_create(rows, batch_size=BATCH_SIZE)
+    return len(rows)
@@ -0,0 +1,186 @@
+"""
+Minutes text store and keyword-in-context (KWIC) search.
+
+The text of every ingested document is kept zlib-compressed in MinutesText.
+Alongside it, WordPosting holds a positional inverted index: for each token
+of each document, the token index and character offset of every occurrence,
+delta-encoded and compressed. Tokens are IndexTerm rows rather than
+Vocabulary words, so stop words and short words are indexed for phrase
+search without showing up among the counted words. A query is answered from
+the postings alone: phrase matches are intersections of token positions, and
+only the documents that produce the returned hits are decompressed to cut
+out their context.
+"""
+import zlib
+from collections import defaultdict
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count
+
+from .tokenizing import MAX_WORD_LENGTH, TOKEN_RE, normalize
+from .models import IndexTerm, MinutesDocument, MinutesText, WordPosting
+
+CHARS_PER_WORD = 24  # generous slice per context word before splitting
+BATCH_SIZE = 1000
+
+
+def index_term(token):
+    return token[:-2] if token.endswith("'s") else token
+
+
+def _lowered(text):
+    """Lower-cased text with the same character offsets as `text`"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+
+
+def encode_positions(tokens, offsets):
+    positions = np.array([tokens, offsets], dtype=np.int64)
+    positions[:, 1:] = np.diff(positions, axis=1)
+    return zlib.compress(positions.astype(np.uint32).tobytes())
+
+
+def decode_positions(blob):
+    """(token indexes, character offsets) arrays of a posting"""
+    positions = np.frombuffer(zlib.decompress(bytes(blob)), dtype=np.uint32).reshape(2, -1)
+    return np.cumsum(positions, axis=1, dtype=np.int64)
+
+
+def build_postings(text):
+    """{term: ([token index], [character offset])} for every word of a text"""
+    postings = defaultdict(lambda: ([], []))
+    for index, match in enumerate(TOKEN_RE.finditer(_lowered(text))):
+        term = index_term(match.group())
+        if len(term) <= MAX_WORD_LENGTH:
+            tokens, offsets = postings[term]
+            tokens.append(index)
+            offsets.append(match.start())
+    return postings
+
+
+def store_texts(documents, texts):
+    """
+    Store the text and postings of ingested documents; `documents` holds
+    (path, hash, date, words) as for ingestion.record_documents and `texts`
+    maps paths to text. Superseded documents of the same meeting dates
+    are dropped from the store.
+    """
+    digests = {digest for _, digest, _, _ in documents}
+    ids = dict(MinutesDocument.objects.filter(content_hash__in=digests).values_list('content_hash', 'id'))
+
+    with transaction.atomic():
+        superseded = MinutesDocument.objects.filter(
+            date__in={meeting_date for _, _, meeting_date, _ in documents}
+        ).exclude(content_hash__in=digests)
+        WordPosting.objects.filter(document__in=superseded).delete()
+        MinutesText.objects.filter(document__in=superseded).delete()
+
+        for path, digest, _, _ in documents:
+            text = texts[path]
+            document_id = ids[digest]
+            postings = build_postings(text)
+            term_ids = IndexTerm.objects.ids_for(postings)
+
+            WordPosting.objects.filter(document_id=document_id).delete()
+            WordPosting.objects.bulk_create(
+                [
+                    WordPosting(
+                        term_id=term_ids[term],
+                        document_id=document_id,
+                        count=len(tokens),
+                        positions=encode_positions(tokens, offsets),
+                    )
+                    for term, (tokens, offsets) in postings.items()
+                ],
+                batch_size=BATCH_SIZE,
+            )
+            MinutesText.objects.update_or_create(
+                document_id=document_id,
+                defaults={'compressed': zlib.compress(text.encode('utf-8')), 'length': len(text)},
+            )
+
+
+def _context(text, start, end, window):
+    left_start = max(0, start - window * CHARS_PER_WORD)
+    left = text[left_start:start].split()
+    if left_start > 0:
+        left = left[1:]  # may be cut mid-word
+    right_end = min(len(text), end + window * CHARS_PER_WORD)
+    right = text[end:right_end].split()
+    if right_end < len(text):
+        right = right[:-1]
+    return ' '.join(left[-window:]), ' '.join(text[start:end].split()), ' '.join(right[:window])
+
+
+def search(query, window=8, limit=50):
+    """
+    Find a word or phrase in the stored minutes. Returns (total matches, hits)
+    where hits are the first `limit` matches, newest meeting first, each
+    with `window` words of context on either side.
+    """
+    terms = [index_term(token) for token in TOKEN_RE.findall(normalize(query))]
+    if not terms:
+        raise ValueError('q must contain at least one word')
+
+    term_ids = dict(IndexTerm.objects.filter(term__in=set(terms)).values_list('term', 'id'))
+    if len(term_ids) < len(set(terms)):
+        return 0, []
+
+    # Documents that contain every word of the query
+    documents = list(
+        WordPosting.objects.filter(term_id__in=term_ids.values())
+        .values('document')
+        .annotate(terms=Count('term', distinct=True))
+        .filter(terms=len(term_ids))
+        .order_by('-document__date', 'document')
+        .values_list('document', flat=True)
+    )
+    postings = defaultdict(dict)
+    for document_id, term_id, blob in WordPosting.objects.filter(
+        document__in=documents, term_id__in=term_ids.values()
+    ).values_list('document', 'term', 'positions'):
+        postings[document_id][term_id] = decode_positions(blob)
+
+    total = 0
+    matches = []
+    for document_id in documents:
+        first_tokens, first_offsets = postings[document_id][term_ids[terms[0]]]
+        starts = first_tokens
+        for position, term in enumerate(terms[1:], start=1):
+            starts = np.intersect1d(starts, postings[document_id][term_ids[term]][0] - position, assume_unique=True)
+        total += len(starts)
+        if len(matches) < limit and len(starts):
+            last_tokens, last_offsets = postings[document_id][term_ids[terms[-1]]]
+            for start in starts[:limit - len(matches)]:
+                matches.append((
+                    document_id,
+                    int(first_offsets[np.searchsorted(first_tokens, start)]),
+                    int(last_offsets[np.searchsorted(last_tokens, start + len(terms) - 1)]),
+                ))
+
+    stored = {
+        row.document_id: row
+        for row in MinutesText.objects.filter(
+            document__in={document_id for document_id, _, _ in matches}
+        ).select_related('document')
+    }
+    texts = {}
+    hits = []
+    for document_id, start, last in matches:
+        if document_id not in texts:
+            texts[document_id] = stored[document_id].text
+        text = texts[document_id]
+        end = TOKEN_RE.match(_lowered(text[last:last + MAX_WORD_LENGTH + 2])).end() + last
+        left, match, right = _context(text, start, end, window)
+        document = stored[document_id].document
+        hits.append({
+            'date': document.date,
+            'source': document.source,
+            'left': left,
+            'match': match,
+            'right': right,
+        })
+    return total, hits
@@ -0,0 +1,104 @@
+"""
+Minutes ingestion pipeline: raw documents -> tokens -> per-date word counts.
+
+Documents are streamed (line by line for text, page by page for PDF), so
+memory use is bounded by the vocabulary of one meeting rather than by the
+size of the archive. Besides single words, phrases of up to MAX_NGRAM words
+are counted with a sliding window over the token stream; they are stored as
+space-separated terms in the same tables. Counts are upserted into WordFrequency in batches and
+every ingested document is recorded by content hash in MinutesDocument.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.db import transaction
+
+from .models import MinutesDocument, Vocabulary, WordFrequency
+# The tokenizing lives in a Django-free module the pool workers import
+from .tokenizing import (  # noqa: F401 (re-exported for the management commands)
+    MAX_NGRAM,
+    content_hash,
+    count_document,
+    iter_document_files,
+    meeting_date_from_path,
+    read_document,
+    word_total,
+)
+
+
+def _map_documents(function, paths, workers, chunk_size):
+    paths = list(paths)
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            yield path, function(path)
+        return
+
+    # Spawned rather than forked: the workers start clean, without the
+    # parent's database connections or app registry
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        yield from zip(paths, executor.map(function, paths, chunksize=max(1, chunk_size)))
+
+
+def count_documents(paths, workers=1, chunk_size=4, max_n=MAX_NGRAM):
+    """
+    Yield (path, Counter) for every path, in input order. With workers > 1
+    the CPU-bound tokenizing and counting is fanned out over a process pool,
+    `chunk_size` documents per task; the workers never touch the database.
+    """
+    yield from _map_documents(partial(count_document, max_n=max_n), paths, workers, chunk_size)
+
+
+def read_documents(paths, workers=1, chunk_size=4, max_n=MAX_NGRAM):
+    """Like count_documents, but yield (path, Counter, text) for the text store"""
+    for path, (counts, text) in _map_documents(partial(read_document, max_n=max_n), paths, workers, chunk_size):
+        yield path, counts, text
+
+
+def upsert_counts(meeting_date, counts, batch_size=500, changes=None):
+    """
+    Write the word counts of one meeting date. The documents are the source
+    of truth for the dates they cover, so words that no longer appear are
+    removed. When a `changes` Counter is given, the change of every count
+    (new minus previous) is added to it. Returns the number of rows written.
+    """
+    with transaction.atomic():
+        if changes is not None:
+            changes.update(counts)
+            changes.subtract(dict(
+                WordFrequency.objects.filter(date=meeting_date).values_list('word__term', 'frequency')
+            ))
+        word_ids = Vocabulary.objects.ids_for(counts)
+        WordFrequency.objects.filter(date=meeting_date).exclude(word__in=word_ids.values()).delete()
+        rows = [
+            WordFrequency(date=meeting_date, word_id=word_ids[word], frequency=frequency)
+            for word, frequency in counts.items()
+        ]
+        for start in range(0, len(rows), batch_size):
+            WordFrequency.objects.bulk_create(
+                rows[start:start + batch_size],
+                update_conflicts=True,
+                unique_fields=['date', 'word'],
+                update_fields=['frequency'],
+            )
+    return len(rows)
+
+
+def record_documents(documents):
+    """Remember ingested documents by content hash; `documents` holds (path, hash, date, words)"""
+    MinutesDocument.objects.bulk_create(
+        [
+            MinutesDocument(content_hash=digest, source=str(path)[:255], date=meeting_date, word_count=words)
+            for path, digest, meeting_date, words in documents
+        ],
+        update_conflicts=True,
+        unique_fields=['content_hash'],
+        update_fields=['source', 'date', 'word_count'],
+    )
+
+
+def seen_hashes(hashes):
+    return set(
+        MinutesDocument.objects.filter(content_hash__in=list(hashes)).values_list('content_hash', flat=True)
+    )
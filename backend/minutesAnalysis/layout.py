@@ -0,0 +1,123 @@
+"""
+Server-side word cloud layout.
+
+Words are placed largest first along an Archimedean spiral from the centre
+of the canvas. Occupied space is tracked in a coarse bitmap (one cell per
+CELL_SIZE pixels); a summed-area table of that bitmap lets every spiral
+position be tested for a collision at once with NumPy, so each word costs
+one vectorized pass instead of a Python loop over candidate positions.
+Text extents are estimated from average glyph proportions, not measured
+with a font, so the layout is deterministic and needs no font files.
+"""
+import math
+import zlib
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+CELL_SIZE = 2  # pixels per bitmap cell
+GLYPH_WIDTH = 0.6  # average glyph advance as a share of the font size
+LINE_HEIGHT = 1.0
+PADDING = 1  # cells kept free around each word
+SPIRAL_STEP = 0.05  # radians between spiral positions
+FONT_FAMILY = 'Arial, Helvetica, sans-serif'
+
+
+def font_sizes(frequencies, min_size, max_size):
+    """Font sizes scaled by the square root of the frequency"""
+    roots = np.sqrt(np.asarray(frequencies, dtype=np.float64))
+    if roots.size == 0:
+        return roots
+    low, high = roots.min(), roots.max()
+    if high == low:
+        return np.full(roots.shape, float(max_size))
+    return min_size + (max_size - min_size) * (roots - low) / (high - low)
+
+
+def rotation(word):
+    """Deterministic rotation: about a third of the words run vertically"""
+    return -90 if zlib.crc32(word.encode('utf-8')) % 3 == 0 else 0
+
+
+def _spiral(grid_width, grid_height):
+    """Cell offsets from the centre along a spiral covering the whole grid"""
+    radius = math.hypot(grid_width, grid_height) / 2
+    turns = np.arange(0, radius / 0.5, SPIRAL_STEP)
+    # 0.5 cells of radius per radian; stretched to the canvas aspect ratio
+    x = np.rint(0.5 * turns * np.cos(turns) * grid_width / grid_height).astype(np.int64)
+    y = np.rint(0.5 * turns * np.sin(turns)).astype(np.int64)
+    offsets = np.stack([x, y], axis=1)
+    _, first = np.unique(offsets, axis=0, return_index=True)
+    return offsets[np.sort(first)]
+
+
+def layout(words, width, height, min_size=None, max_size=None):
+    """
+    Place [(word, frequency)] (most frequent first) on a width x height canvas.
+    Returns the placed words as dicts with text, frequency, size, rotate and
+    the x/y centre in pixels; words that do not fit are left out.
+    """
+    max_size = max_size or max(12.0, height / 8)
+    min_size = min_size or max(10.0, max_size / 6)
+    grid_width, grid_height = max(1, width // CELL_SIZE), max(1, height // CELL_SIZE)
+    grid = np.zeros((grid_height, grid_width), dtype=bool)
+    spiral = _spiral(grid_width, grid_height)
+    centre_x, centre_y = grid_width // 2, grid_height // 2
+
+    placed = []
+    sizes = font_sizes([frequency for _, frequency in words], min_size, max_size)
+    for (word, frequency), size in zip(words, sizes):
+        rotate = rotation(word)
+        box_width = math.ceil(len(word) * size * GLYPH_WIDTH / CELL_SIZE) + 2 * PADDING
+        box_height = math.ceil(size * LINE_HEIGHT / CELL_SIZE) + 2 * PADDING
+        if rotate:
+            box_width, box_height = box_height, box_width
+        if box_width > grid_width or box_height > grid_height:
+            continue
+
+        x0 = centre_x + spiral[:, 0] - box_width // 2
+        y0 = centre_y + spiral[:, 1] - box_height // 2
+        inside = (x0 >= 0) & (y0 >= 0) & (x0 + box_width <= grid_width) & (y0 + box_height <= grid_height)
+        x0, y0 = x0[inside], y0[inside]
+        if not x0.size:
+            continue
+
+        # Summed-area table: occupied cells of every candidate box in one go
+        table = np.zeros((grid_height + 1, grid_width + 1), dtype=np.int32)
+        np.cumsum(np.cumsum(grid, axis=0, dtype=np.int32), axis=1, out=table[1:, 1:])
+        x1, y1 = x0 + box_width, y0 + box_height
+        occupied = table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+        free = np.flatnonzero(occupied == 0)
+        if not free.size:
+            continue
+
+        x, y = int(x0[free[0]]), int(y0[free[0]])
+        grid[y:y + box_height, x:x + box_width] = True
+        placed.append({
+            'text': word,
+            'frequency': int(frequency),
+            'size': round(float(size), 1),
+            'rotate': rotate,
+            'x': (x + box_width / 2) * CELL_SIZE,
+            'y': (y + box_height / 2) * CELL_SIZE,
+        })
+    return placed
+
+
+def to_svg(cloud):
+    """SVG document for a layout as returned by the layout endpoint"""
+    width, height = cloud.get('width', 0), cloud.get('height', 0)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" font-family="{FONT_FAMILY}" text-anchor="middle">'
+    ]
+    if 'error' in cloud:
+        parts.append(f'<text x="{width / 2}" y="{height / 2}">{escape(str(cloud["error"]))}</text>')
+    for word in cloud.get('words', []):
+        transform = f' transform="rotate({word["rotate"]} {word["x"]} {word["y"]})"' if word['rotate'] else ''
+        parts.append(
+            f'<text x="{word["x"]}" y="{word["y"]}" font-size="{word["size"]}" '
+            f'dominant-baseline="central"{transform}>{escape(word["text"])}</text>'
+        )
+    parts.append('</svg>')
+    return '\n'.join(parts)
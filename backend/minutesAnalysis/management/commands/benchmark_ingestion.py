@@ -0,0 +1,91 @@
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from minutesAnalysis import ingestion
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark minutes tokenization/counting throughput against worker count '
+        'on a synthetic corpus. Nothing is written to the database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--documents',
+            type=int,
+            default=200,
+            help='Number of synthetic documents (default: 200)'
+        )
+        parser.add_argument(
+            '--words-per-document',
+            type=int,
+            default=20000,
+            help='Words in each synthetic document (default: 20000)'
+        )
+        parser.add_argument(
+            '--workers',
+            default='1,2,4,8',
+            help='Comma separated worker counts to measure (default: 1,2,4,8)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=4,
+            help='Documents handed to a worker per task (default: 4)'
+        )
+        parser.add_argument(
+            '--max-ngram',
+            type=int,
+            default=ingestion.MAX_NGRAM,
+            help=f'Count phrases of up to this many words (default: {ingestion.MAX_NGRAM})'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed for the corpus (default: 42)'
+        )
+
+    def handle(self, *args, **options):
+        worker_counts = [int(value) for value in options['workers'].split(',') if value.strip()]
+        rng = random.Random(options['seed'])
+
+        # Zipf-like vocabulary: a few policy words dominate, a long tail of filler
+        vocabulary = [
+            'monetary', 'policy', 'inflation', 'rate', 'growth', 'committee', 'liquidity',
+            'repo', 'reverse', 'accommodation', 'stance', 'withdrawal', 'the', 'and', 'of',
+        ] + [f'term{index}' for index in range(5000)]
+        weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(options['documents']):
+                words = rng.choices(vocabulary, weights=weights, k=options['words_per_document'])
+                path = Path(directory) / f'minutes_{index:05d}.txt'
+                lines = (' '.join(words[start:start + 12]) for start in range(0, len(words), 12))
+                path.write_text('\n'.join(lines))
+                paths.append(path)
+
+            corpus_mb = sum(os.path.getsize(path) for path in paths) / (1024 * 1024)
+            self.stdout.write(
+                f'Synthetic corpus: {len(paths)} documents, {corpus_mb:.1f} MB, '
+                f'{os.cpu_count()} CPUs available'
+            )
+            self.stdout.write(f'{"workers":>8} {"seconds":>9} {"docs/s":>9} {"MB/s":>8} {"speedup":>8}')
+
+            baseline = None
+            for workers in worker_counts:
+                started = time.perf_counter()
+                for _ in ingestion.count_documents(
+                    paths, workers=workers, chunk_size=options['chunk_size'], max_n=options['max_ngram']
+                ):
+                    pass
+                elapsed = time.perf_counter() - started
+                baseline = baseline or elapsed
+                self.stdout.write(
+                    f'{workers:>8} {elapsed:>9.2f} {len(paths) / elapsed:>9.1f} '
+                    f'{corpus_mb / elapsed:>8.1f} {baseline / elapsed:>7.2f}x'
+                )
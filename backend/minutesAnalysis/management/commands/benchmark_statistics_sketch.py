@@ -0,0 +1,79 @@
+import random
+import time
+from collections import Counter
+from django.core.management.base import BaseCommand
+from minutesAnalysis import sketches
+
+class Command(BaseCommand):
+    help = (
+        'Measure the error of the HyperLogLog distinct count and the Space-Saving '
+        'top-K against exact counts on synthetic Zipf-distributed word streams. '
+        'Nothing is written to the database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--vocabulary',
+            default='1000,10000,100000',
+            help='Comma separated vocabulary sizes to measure (default: 1000,10000,100000)'
+        )
+        parser.add_argument(
+            '--meetings',
+            type=int,
+            default=200,
+            help='Meeting batches folded into the sketches (default: 200)'
+        )
+        parser.add_argument(
+            '--words-per-meeting',
+            type=int,
+            default=20000,
+            help='Words drawn per meeting (default: 20000)'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=50,
+            help='K for the top-K precision check (default: 50)'
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42,
+            help='Random seed (default: 42)'
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        top = options['top']
+        self.stdout.write(
+            f'{"vocab":>8} {"distinct":>9} {"hll":>9} {"hll err":>8} '
+            f'{"top-K":>6} {"max cnt err":>12} {"seconds":>8}'
+        )
+
+        for size in [int(value) for value in options['vocabulary'].split(',') if value.strip()]:
+            vocabulary = [f'term{index}' for index in range(size)]
+            weights = [1 / (rank + 1) for rank in range(size)]
+            exact = Counter()
+            distinct = sketches.HyperLogLog()
+            heavy = sketches.SpaceSaving()
+
+            started = time.perf_counter()
+            for _ in range(options['meetings']):
+                batch = Counter(rng.choices(vocabulary, weights=weights, k=options['words_per_meeting']))
+                exact.update(batch)
+                distinct.add_many(batch)
+                heavy.update(batch)
+            elapsed = time.perf_counter() - started
+
+            estimate = distinct.count()
+            true_top = {term for term, _ in exact.most_common(top)}
+            sketch_top = heavy.top(top)
+            precision = len(true_top & {term for term, _, _ in sketch_top}) / max(1, len(true_top))
+            count_error = max(
+                ((count - exact[term]) / exact[term] for term, count, _ in sketch_top),
+                default=0.0
+            )
+            self.stdout.write(
+                f'{size:>8} {len(exact):>9} {estimate:>9} {(estimate - len(exact)) / len(exact):>+8.2%} '
+                f'{precision:>6.0%} {count_error:>+12.3%} {elapsed:>8.2f}'
+            )
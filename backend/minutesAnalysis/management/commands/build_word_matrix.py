@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from minutesAnalysis import matrix
+
+class Command(BaseCommand):
+    help = (
+        'Build the memory-mapped single-word matrix snapshot for the current data version. '
+        'Run after changing WordFrequency outside ingest_minutes (admin, test data commands); '
+        'until then the views read the rollup tables'
+    )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Building word matrix snapshot...')
+        path = matrix.build_snapshot()
+        self.stdout.write(self.style.SUCCESS(f'Successfully built {path}'))
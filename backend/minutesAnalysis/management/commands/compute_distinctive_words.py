@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from minutesAnalysis import distinctiveness
+
+class Command(BaseCommand):
+    help = 'Recompute the distinctive words of every meeting and year from WordFrequency'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=distinctiveness.DEFAULT_TOP,
+            help=f'Words to keep per meeting and per year (default: {distinctiveness.DEFAULT_TOP})'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Computing distinctive words...')
+        rows = distinctiveness.refresh(top=options['top'])
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully stored {rows} distinctive word scores')
+        )
@@ -1,7 +1,7 @@
 import random
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
-from minutesAnalysis.models import WordFrequency
+from minutesAnalysis.models import Vocabulary, WordFrequency
 
 class Command(BaseCommand):
     help = 'Create fake word frequency data for testing'
@@ -62,6 +62,13 @@ class Command(BaseCommand):
             ('gradual', (2, 14)),
             ('prudent', (1, 9)),
             
+            # Policy phrases (counted as bigrams/trigrams)
+            ('repo rate', (4, 20)),
+            ('reverse repo', (2, 12)),
+            ('policy repo rate', (2, 10)),
+            ('withdrawal of accommodation', (1, 8)),
+            ('standing deposit facility', (1, 6)),
+            
             # Economic indicators
             ('gdp', (8, 35)),
             ('cpi', (6, 30)),
@@ -118,6 +125,7 @@ class Command(BaseCommand):
         # Clear existing data
         self.stdout.write('Clearing existing word frequency data...')
         WordFrequency.objects.all().delete()
+        word_ids = Vocabulary.objects.ids_for(word for word, _ in monetary_words)
         
         # Generate data for specified years
         current_year = datetime.now().year
@@ -182,7 +190,7 @@ class Command(BaseCommand):
                         # Create the word frequency entry
                         WordFrequency.objects.create(
                             date=meeting_date,
-                            word=word,
+                            word_id=word_ids[word],
                             frequency=final_frequency
                         )
                         total_created += 1
@@ -206,10 +214,10 @@ class Command(BaseCommand):
         
         # Show top 10 most frequent words
         from django.db.models import Sum
-        top_words = WordFrequency.objects.values('word').annotate(
+        top_words = WordFrequency.objects.values('word__term').annotate(
             total_frequency=Sum('frequency')
         ).order_by('-total_frequency')[:10]
         
         self.stdout.write(f'\nTop 10 most frequent words:')
         for i, word_data in enumerate(top_words, 1):
-            self.stdout.write(f'  {i}. {word_data["word"]}: {word_data["total_frequency"]}')
\ No newline at end of file
+            self.stdout.write(f'  {i}. {word_data["word__term"]}: {word_data["total_frequency"]}')
\ No newline at end of file
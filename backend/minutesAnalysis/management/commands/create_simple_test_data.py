@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
-from minutesAnalysis.models import WordFrequency
+from minutesAnalysis.models import Vocabulary, WordFrequency
 
 class Command(BaseCommand):
     help = 'Create simple test data for word frequency analysis'
@@ -59,12 +59,13 @@ class Command(BaseCommand):
             ('2024-02-15', 'assessment', 10),
         ]
         
+        word_ids = Vocabulary.objects.ids_for(word for _, word, _ in test_data)
         created_count = 0
         for date_str, word, frequency in test_data:
             date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
             WordFrequency.objects.create(
                 date=date_obj,
-                word=word,
+                word_id=word_ids[word],
                 frequency=frequency
             )
             created_count += 1
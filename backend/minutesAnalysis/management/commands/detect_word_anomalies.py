@@ -0,0 +1,52 @@
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from minutesAnalysis import anomalies
+
+class Command(BaseCommand):
+    help = (
+        'Flag meetings where a word spiked against the preceding meetings '
+        '(robust rolling z-score) and store them in WordAnomaly'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--since',
+            help='Only rescan meetings on or after this date (YYYY-MM-DD); default: all meetings'
+        )
+        parser.add_argument(
+            '--window',
+            type=int,
+            default=anomalies.WINDOW,
+            help=f'Number of preceding meetings used as the baseline (default: {anomalies.WINDOW})'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=anomalies.THRESHOLD,
+            help=f'Minimum robust z-score to flag (default: {anomalies.THRESHOLD})'
+        )
+        parser.add_argument(
+            '--min-frequency',
+            type=int,
+            default=anomalies.MIN_FREQUENCY,
+            help=f'Ignore spikes below this frequency (default: {anomalies.MIN_FREQUENCY})'
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options['since']:
+            try:
+                since = datetime.strptime(options['since'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError(f"Invalid --since '{options['since']}', expected YYYY-MM-DD")
+        if options['window'] < 1:
+            raise CommandError('--window must be at least 1')
+
+        self.stdout.write('Scanning word frequencies for anomalies...')
+        flagged = anomalies.refresh(
+            since=since,
+            window=options['window'],
+            threshold=options['threshold'],
+            min_frequency=options['min_frequency'],
+        )
+        self.stdout.write(self.style.SUCCESS(f'Successfully flagged {flagged} word anomalies'))
@@ -0,0 +1,175 @@
+from collections import Counter, defaultdict
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from minutesAnalysis import anomalies, concordance, distinctiveness, ingestion, matrix, sketches
+from minutesAnalysis.models import DataVersion, WordFrequency
+
+class Command(BaseCommand):
+    help = (
+        'Ingest MPC meeting minutes (plain text or PDF) into WordFrequency. '
+        'The meeting date is read from the file name (e.g. minutes_2023-02-08.pdf) '
+        'unless --date is given. Documents already ingested (same content hash) are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='+',
+            help='Files or directories (searched recursively) containing minutes'
+        )
+        parser.add_argument(
+            '--date',
+            help='Meeting date (YYYY-MM-DD) to use for every document'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Rows per bulk upsert (default: 500)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Processes used to tokenize and count documents (default: 1)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=4,
+            help='Documents handed to a worker per task (default: 4)'
+        )
+        parser.add_argument(
+            '--transaction-size',
+            type=int,
+            default=50,
+            help='Meeting dates written per database transaction (default: 50)'
+        )
+        parser.add_argument(
+            '--max-ngram',
+            type=int,
+            default=ingestion.MAX_NGRAM,
+            help=f'Count phrases of up to this many words, 1 for single words only (default: {ingestion.MAX_NGRAM})'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-ingest documents even if their content hash was seen before'
+        )
+
+    def handle(self, *args, **options):
+        if not 1 <= options['max_ngram'] <= ingestion.MAX_NGRAM:
+            raise CommandError(f'--max-ngram must be between 1 and {ingestion.MAX_NGRAM}')
+
+        forced_date = None
+        if options['date']:
+            try:
+                forced_date = datetime.strptime(options['date'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError(f"Invalid --date '{options['date']}', expected YYYY-MM-DD")
+
+        # Group documents by meeting date: a date is re-counted as a whole
+        # whenever one of its documents is new or changed
+        documents = defaultdict(list)
+        for path in ingestion.iter_document_files(options['paths']):
+            meeting_date = forced_date or ingestion.meeting_date_from_path(path)
+            if meeting_date is None:
+                self.stderr.write(f'Skipping {path}: no meeting date in file name')
+                continue
+            documents[meeting_date].append((path, ingestion.content_hash(path)))
+
+        if not documents:
+            raise CommandError('No minutes documents found')
+
+        all_hashes = {digest for docs in documents.values() for _, digest in docs}
+        seen = set() if options['force'] else ingestion.seen_hashes(all_hashes)
+        dirty_dates = sorted(
+            meeting_date for meeting_date, docs in documents.items()
+            if any(digest not in seen for _, digest in docs)
+        )
+        skipped = sum(len(docs) for docs in documents.values()) - sum(len(documents[d]) for d in dirty_dates)
+        self.stdout.write(f'{len(dirty_dates)} meeting dates to ingest, {skipped} unchanged documents skipped')
+
+        queue = [
+            (meeting_date, path, digest)
+            for meeting_date in dirty_dates
+            for path, digest in documents[meeting_date]
+        ]
+        digests = {path: digest for _, path, digest in queue}
+        dates = {path: meeting_date for meeting_date, path, _ in queue}
+        remaining = {meeting_date: len(documents[meeting_date]) for meeting_date in dirty_dates}
+
+        # Partial counters from the workers are merged per meeting date and a
+        # date is written once all of its documents are counted
+        merged = defaultdict(Counter)
+        ingested = defaultdict(list)
+        texts = {}
+        pending = []
+        total_rows = 0
+        try:
+            counted = ingestion.read_documents(
+                [path for _, path, _ in queue],
+                workers=options['workers'],
+                chunk_size=options['chunk_size'],
+                max_n=options['max_ngram']
+            )
+            for path, document_counts, text in counted:
+                meeting_date = dates[path]
+                merged[meeting_date].update(document_counts)
+                texts[path] = text
+                ingested[meeting_date].append((path, digests[path], meeting_date, ingestion.word_total(document_counts)))
+                remaining[meeting_date] -= 1
+                if remaining[meeting_date] == 0:
+                    pending.append(meeting_date)
+                if len(pending) >= options['transaction_size']:
+                    total_rows += self.write(pending, merged, ingested, texts, options['batch_size'])
+                    pending = []
+        except Exception as e:
+            raise CommandError(f'Failed to ingest minutes: {e}')
+        total_rows += self.write(pending, merged, ingested, texts, options['batch_size'])
+
+        if dirty_dates:
+            # Build the analytics snapshot the views read, rescore the
+            # distinctive words of the years that changed against the new
+            # corpus and rescan for spikes from the earliest meeting that changed
+            matrix.build_snapshot()
+            corpus = matrix.read_matrix()
+            distinctiveness.refresh(matrix=corpus, years={meeting_date.year for meeting_date in dirty_dates})
+            anomalies.refresh(since=min(dirty_dates), matrix=corpus)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully ingested {len(dirty_dates)} meeting dates ({total_rows} word frequency rows)'
+            )
+        )
+
+    def write(self, meeting_dates, merged, ingested, texts, batch_size):
+        """Write the merged counts and texts of several meeting dates in one transaction"""
+        rows = 0
+        # The snapshot is built once, after the last batch
+        with matrix.rebuild_deferred(), transaction.atomic():
+            version = DataVersion.current()
+            # The statistics count single-word rows only
+            single_words = WordFrequency.objects.filter(word__ngram_size=1)
+            before = single_words.filter(date__in=meeting_dates).count()
+            changes = Counter()
+            for meeting_date in meeting_dates:
+                rows += ingestion.upsert_counts(
+                    meeting_date, merged[meeting_date], batch_size=batch_size, changes=changes
+                )
+                ingestion.record_documents(ingested[meeting_date])
+                concordance.store_texts(ingested[meeting_date], texts)
+            sketches.update(
+                changes,
+                entries_delta=single_words.filter(date__in=meeting_dates).count() - before,
+                base_version=version
+            )
+        for meeting_date in meeting_dates:
+            for path, _, _, _ in ingested[meeting_date]:
+                texts.pop(path, None)
+            self.stdout.write(
+                f'  {meeting_date}: {len(merged.pop(meeting_date))} words '
+                f'from {len(ingested.pop(meeting_date))} document(s)'
+            )
+        return rows
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from minutesAnalysis import sketches
+
+class Command(BaseCommand):
+    help = 'Recompute the approximate word statistics sketches from the word rollups'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding statistics sketch...')
+        sketch = sketches.rebuild()
+        stats = sketches.statistics()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully rebuilt sketch: {sketch.entries} entries, '
+                f'~{stats["unique_words"]} distinct words, heaviest "{stats["most_frequent_word"]}"'
+            )
+        )
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from minutesAnalysis import rollups
+
+class Command(BaseCommand):
+    help = 'Recompute the yearly and monthly word rollup tables from WordFrequency'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding word rollups...')
+        monthly, yearly = rollups.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully rebuilt {monthly} monthly and {yearly} yearly word totals'
+            )
+        )
@@ -0,0 +1,308 @@
+"""
+Read-only analytics engine over WordFrequency.
+
+The single-word rows of the table are loaded into a dense NumPy matrix of
+meeting dates x vocabulary ids and saved as a snapshot (.npy counts, .npy
+cumulative sums over the date axis, .json labels) under
+settings.MINUTES_SNAPSHOT_DIR. Every process opens the snapshot with
+mmap_mode='r', so all gunicorn workers share one copy through the page
+cache. A snapshot is tied to the global DataVersion. It is built by
+ingest_minutes, `manage.py build_word_matrix` and, after any other write
+that bumps the version, once that transaction commits (DataVersion.bump
+calls rebuild_after_commit). It is never built by a read: until the
+snapshot of the current version exists, get_matrix() returns None and the
+views answer from the rollup tables.
+
+Offline jobs that also need phrases (distinctive words, anomalies) load an
+in-memory matrix of every term with read_matrix().
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+
+from .models import DataVersion, Vocabulary, WordFrequency
+
+COUNT_DTYPE = np.uint32
+ITERATOR_CHUNK_SIZE = 5000
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_loaded = None
+_missing = None  # last version found without a snapshot, logged once
+_deferred = threading.local()
+
+
+def snapshot_dir():
+    return Path(getattr(settings, 'MINUTES_SNAPSHOT_DIR', Path(settings.BASE_DIR) / 'var' / 'minutes_snapshots'))
+
+
+def _prefix():
+    # Versions are per database, so keep snapshots of different databases
+    # (e.g. the test database) apart
+    database = str(connection.settings_dict['NAME'])
+    return 'word-matrix-' + hashlib.sha1(database.encode()).hexdigest()[:10]
+
+
+def _paths(version):
+    base = snapshot_dir() / f'{_prefix()}-v{version}'
+    return base.with_suffix('.npy'), base.with_suffix('.json'), base.with_name(base.name + '-cumsum.npy')
+
+
+class FrequencyMatrix:
+    """Dates x vocabulary frequency counts with the lookups the views need"""
+
+    def __init__(self, version, dates, vocabulary, counts, entries, cumulative=None):
+        self.version = version
+        self.entries = entries
+        self.dates = np.asarray(dates, dtype='datetime64[D]')
+        self.vocabulary = list(vocabulary)
+        self.counts = counts
+        self._cumulative = cumulative
+        self.word_index = {word: index for index, word in enumerate(self.vocabulary)}
+        self.ngram_sizes = np.fromiter(
+            (word.count(' ') + 1 for word in self.vocabulary), dtype=np.int8, count=len(self.vocabulary)
+        )
+
+        months = self.dates.astype('datetime64[M]').astype(np.int64)
+        self.years = months // 12 + 1970
+        self.months = months % 12 + 1
+
+    # -- selection helpers -------------------------------------------------
+
+    def year_rows(self, year):
+        """Slice of the (sorted) date axis that falls in `year`"""
+        start = np.searchsorted(self.years, year, side='left')
+        stop = np.searchsorted(self.years, year, side='right')
+        return slice(start, stop)
+
+    def columns(self, words):
+        """Column ids for the words that exist in the vocabulary"""
+        return [self.word_index[word] for word in words if word in self.word_index]
+
+    def ngram_mask(self, n):
+        """Boolean mask of the columns holding n-word terms"""
+        return self.ngram_sizes == n
+
+    def totals(self, rows=slice(None)):
+        """Per-word totals over a block of dates"""
+        return self.counts[rows].sum(axis=0, dtype=np.int64)
+
+    @property
+    def cumulative(self):
+        """Prefix sums over the date axis: row i holds the totals of dates[:i]"""
+        if self._cumulative is None:
+            self._cumulative = cumulative_counts(self.counts)
+        return self._cumulative
+
+    def date_rows(self, start, end):
+        """Slice of the date axis between two dates, both inclusive"""
+        start = np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left')
+        stop = np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right')
+        return slice(start, max(start, stop))
+
+    def range_totals(self, start, end):
+        """Per-word totals between two dates, from two rows of the prefix sums"""
+        rows = self.date_rows(start, end)
+        return self.cumulative[rows.stop] - self.cumulative[rows.start]
+
+    # -- aggregations ------------------------------------------------------
+
+    def ranked_words(self, year, limit=None, n=1, minimum=1):
+        """[(term, total)] of n-word terms for a year, most frequent first, totals below `minimum` dropped"""
+        totals = self.totals(self.year_rows(year))
+        nonzero = np.flatnonzero((totals >= max(minimum, 1)) & self.ngram_mask(n))
+        order = nonzero[np.argsort(-totals[nonzero], kind='stable')]
+        if limit is not None:
+            order = order[:limit]
+        return [(self.vocabulary[index], int(totals[index])) for index in order]
+
+    def monthly(self, year, words):
+        """{word: [jan, ..., dec]} totals for the given words in a year"""
+        rows = self.year_rows(year)
+        series = {word: [0] * 12 for word in words}
+        columns = self.columns(words)
+        if not columns:
+            return series
+
+        by_month = np.zeros((12, len(columns)), dtype=np.int64)
+        np.add.at(by_month, self.months[rows] - 1, self.counts[rows][:, columns])
+        for position, word in enumerate(word for word in words if word in self.word_index):
+            series[word] = by_month[:, position].tolist()
+        return series
+
+    def month_totals(self):
+        """{(year, month): total of every word} for the months with meetings"""
+        keys = self.years * 12 + self.months - 1
+        months, inverse = np.unique(keys, return_inverse=True)
+        totals = np.zeros(months.size, dtype=np.int64)
+        np.add.at(totals, inverse, self.counts.sum(axis=1, dtype=np.int64))
+        return {(int(key // 12), int(key % 12) + 1): int(total) for key, total in zip(months, totals)}
+
+    def statistics(self):
+        # Phrases are left out of every figure; the snapshot, and so
+        # `entries`, only holds single words
+        words = self.ngram_mask(1)
+        totals = self.totals() * words
+        most_frequent = int(np.argmax(totals)) if totals.size else None
+        return {
+            'total_entries': self.entries,
+            'unique_words': int(words.sum()),
+            'years_covered': int(np.unique(self.years).size),
+            'most_frequent_word': self.vocabulary[most_frequent] if most_frequent is not None else None,
+            'highest_frequency': int(totals[most_frequent]) if most_frequent is not None else 0,
+        }
+
+
+def cumulative_counts(counts):
+    cumulative = np.zeros((counts.shape[0] + 1, counts.shape[1]), dtype=np.int64)
+    np.cumsum(counts, axis=0, dtype=np.int64, out=cumulative[1:])
+    return cumulative
+
+
+def _read(ngram_size=None):
+    """(dates, vocabulary, counts, rows) of WordFrequency, limited to n-word terms when given"""
+    rows = WordFrequency.objects.order_by()
+    if ngram_size is not None:
+        rows = rows.filter(word__ngram_size=ngram_size)
+    rows = rows.values_list('date', 'word', 'frequency')
+    dates, columns, cells = {}, {}, []
+    for meeting_date, word_id, frequency in rows.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        dates.setdefault(meeting_date, None)
+        columns.setdefault(word_id, len(columns))
+        cells.append((meeting_date, columns[word_id], frequency))
+    terms = dict(Vocabulary.objects.filter(id__in=list(columns)).values_list('id', 'term'))
+    vocabulary = [terms[word_id] for word_id in columns]
+
+    ordered_dates = sorted(dates)
+    date_index = {meeting_date: index for index, meeting_date in enumerate(ordered_dates)}
+    counts = np.zeros((len(ordered_dates), len(vocabulary)), dtype=COUNT_DTYPE)
+    if cells:
+        row_ids = np.fromiter((date_index[cell[0]] for cell in cells), dtype=np.int64, count=len(cells))
+        col_ids = np.fromiter((cell[1] for cell in cells), dtype=np.int64, count=len(cells))
+        values = np.fromiter((cell[2] for cell in cells), dtype=COUNT_DTYPE, count=len(cells))
+        counts[row_ids, col_ids] = values
+    return ordered_dates, vocabulary, counts, len(cells)
+
+
+def read_matrix():
+    """In-memory matrix of every term, phrases included, for offline jobs"""
+    return FrequencyMatrix(DataVersion.current(), *_read())
+
+
+def build_snapshot(version=None):
+    """Write the single-word rows of WordFrequency as snapshot `version` (default: the current one)"""
+    if version is None:
+        version = DataVersion.current()
+    ordered_dates, vocabulary, counts, entries = _read(ngram_size=1)
+
+    counts_path, meta_path, cumulative_path = _paths(version)
+    counts_path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        'version': version,
+        'entries': entries,
+        'dates': [meeting_date.isoformat() for meeting_date in ordered_dates],
+        'vocabulary': vocabulary,
+    }
+
+    # Write to temporary files and rename, so concurrent builders and
+    # readers never see a partial snapshot
+    for path, write in (
+        (counts_path, lambda handle: np.save(handle, counts)),
+        (cumulative_path, lambda handle: np.save(handle, cumulative_counts(counts))),
+        (meta_path, lambda handle: handle.write(json.dumps(meta).encode())),
+    ):
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as handle:
+            write(handle)
+        os.replace(tmp, path)
+
+    _remove_stale_snapshots(version)
+    return counts_path
+
+
+def _remove_stale_snapshots(version):
+    keep = set(_paths(version))
+    for path in snapshot_dir().glob(f'{_prefix()}-v*'):
+        if path not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def load_snapshot(version):
+    """Snapshot `version`, or None when it is missing: not built yet, or replaced by a newer one"""
+    counts_path, meta_path, cumulative_path = _paths(version)
+    try:
+        meta = json.loads(meta_path.read_text())
+        counts = np.load(counts_path, mmap_mode='r')
+        cumulative = np.load(cumulative_path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+    return FrequencyMatrix(
+        version,
+        [date.fromisoformat(value) for value in meta['dates']],
+        meta['vocabulary'],
+        counts,
+        meta['entries'],
+        cumulative,
+    )
+
+
+def rebuild_after_commit():
+    """
+    Rebuild the snapshot of the new data version once the current
+    transaction commits; called by DataVersion.bump
+    """
+    if not getattr(_deferred, 'depth', 0):
+        transaction.on_commit(_rebuild_if_missing)
+
+
+def _rebuild_if_missing():
+    version = DataVersion.current()
+    # The metadata is written last, so it marks a complete snapshot
+    if _paths(version)[1].exists():
+        return
+    try:
+        build_snapshot(version)
+    except Exception:
+        logger.exception(
+            'Failed to rebuild the word matrix snapshot for data version %s; '
+            'the views read the rollups until build_word_matrix is run', version
+        )
+
+
+@contextmanager
+def rebuild_deferred():
+    """Skip the rebuilds after commit, for writers that build the snapshot once they are done"""
+    _deferred.depth = getattr(_deferred, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _deferred.depth -= 1
+
+
+def get_matrix():
+    """The single-word matrix of the current data version, cached per process; None until it is built"""
+    global _loaded, _missing
+    version = DataVersion.current()
+    if _loaded is not None and _loaded.version == version:
+        return _loaded
+    with _lock:
+        if _loaded is None or _loaded.version != version:
+            _loaded = load_snapshot(version)
+        if _loaded is None and _missing != version:
+            _missing = version
+            logger.warning('No word matrix snapshot for data version %s; answering from the rollups', version)
+        return _loaded
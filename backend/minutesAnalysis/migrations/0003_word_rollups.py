@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:10
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_rollups(apps, schema_editor):
+    WordFrequency = apps.get_model('minutesAnalysis', 'WordFrequency')
+    WordMonthlyTotal = apps.get_model('minutesAnalysis', 'WordMonthlyTotal')
+    WordYearlyTotal = apps.get_model('minutesAnalysis', 'WordYearlyTotal')
+
+    monthly = WordFrequency.objects.order_by().values('word', 'date__year', 'date__month').annotate(
+        total=Sum('frequency'),
+        rows=Count('id')
+    )
+    WordMonthlyTotal.objects.bulk_create([
+        WordMonthlyTotal(
+            word=row['word'],
+            year=row['date__year'],
+            month=row['date__month'],
+            frequency=row['total'],
+            entries=row['rows']
+        )
+        for row in monthly
+    ], batch_size=1000)
+
+    yearly = WordMonthlyTotal.objects.order_by().values('word', 'year').annotate(
+        total=Sum('frequency'),
+        rows=Sum('entries')
+    )
+    WordYearlyTotal.objects.bulk_create([
+        WordYearlyTotal(word=row['word'], year=row['year'], frequency=row['total'], entries=row['rows'])
+        for row in yearly
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0002_remove_wordfrequency_unique_word_per_date_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordMonthlyTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=100)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('frequency', models.PositiveBigIntegerField(default=0, help_text='Sum of frequencies for the month')),
+                ('entries', models.PositiveIntegerField(default=0, help_text='Number of WordFrequency rows summed')),
+            ],
+            options={
+                'verbose_name': 'Word Monthly Total',
+                'verbose_name_plural': 'Word Monthly Totals',
+                'ordering': ['-year', 'month', '-frequency'],
+                'indexes': [models.Index(fields=['year', 'month'], name='word_month_period_idx')],
+                'unique_together': {('word', 'year', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='WordYearlyTotal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('word', models.CharField(max_length=100)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('frequency', models.PositiveBigIntegerField(default=0, help_text='Sum of frequencies for the year')),
+                ('entries', models.PositiveIntegerField(default=0, help_text='Number of WordFrequency rows summed')),
+            ],
+            options={
+                'verbose_name': 'Word Yearly Total',
+                'verbose_name_plural': 'Word Yearly Totals',
+                'ordering': ['-year', '-frequency'],
+                'indexes': [models.Index(fields=['year', '-frequency'], name='word_year_frequency_idx')],
+                'unique_together': {('word', 'year')},
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0003_word_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MinutesDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(help_text='SHA-256 of the file content', max_length=64, unique=True)),
+                ('source', models.CharField(help_text='Path the document was ingested from', max_length=255)),
+                ('date', models.DateField(help_text='Date of the MPC meeting')),
+                ('word_count', models.PositiveIntegerField(default=0, help_text='Number of counted words')),
+                ('ingested_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Minutes Document',
+                'verbose_name_plural': 'Minutes Documents',
+                'ordering': ['-date'],
+            },
+        ),
+    ]
@@ -0,0 +1,194 @@
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_vocabulary(apps, schema_editor):
+    Vocabulary = apps.get_model('minutesAnalysis', 'Vocabulary')
+    WordFrequency = apps.get_model('minutesAnalysis', 'WordFrequency')
+
+    terms = WordFrequency.objects.order_by().values_list('word', flat=True).distinct()
+    Vocabulary.objects.bulk_create([Vocabulary(term=term) for term in terms], batch_size=1000)
+    for vocabulary_id, term in Vocabulary.objects.values_list('id', 'term'):
+        WordFrequency.objects.filter(word=term).update(term_id=vocabulary_id)
+
+
+def restore_words(apps, schema_editor):
+    Vocabulary = apps.get_model('minutesAnalysis', 'Vocabulary')
+    WordFrequency = apps.get_model('minutesAnalysis', 'WordFrequency')
+
+    for vocabulary_id, term in Vocabulary.objects.values_list('id', 'term'):
+        WordFrequency.objects.filter(term_id=vocabulary_id).update(word=term)
+
+
+def clear_rollups(apps, schema_editor):
+    apps.get_model('minutesAnalysis', 'WordMonthlyTotal').objects.all().delete()
+    apps.get_model('minutesAnalysis', 'WordYearlyTotal').objects.all().delete()
+
+
+def restore_rollups(apps, schema_editor):
+    """Refill the string-keyed rollups of 0005 when migrating back"""
+    WordFrequency = apps.get_model('minutesAnalysis', 'WordFrequency')
+    WordMonthlyTotal = apps.get_model('minutesAnalysis', 'WordMonthlyTotal')
+    WordYearlyTotal = apps.get_model('minutesAnalysis', 'WordYearlyTotal')
+
+    monthly = WordFrequency.objects.order_by().values('word__term', 'date__year', 'date__month').annotate(
+        total=Sum('frequency'),
+        rows=Count('id')
+    )
+    WordMonthlyTotal.objects.bulk_create([
+        WordMonthlyTotal(
+            word=row['word__term'],
+            year=row['date__year'],
+            month=row['date__month'],
+            frequency=row['total'],
+            entries=row['rows']
+        )
+        for row in monthly
+    ], batch_size=1000)
+
+    yearly = WordMonthlyTotal.objects.order_by().values('word', 'year').annotate(
+        total=Sum('frequency'),
+        rows=Sum('entries')
+    )
+    WordYearlyTotal.objects.bulk_create([
+        WordYearlyTotal(word=row['word'], year=row['year'], frequency=row['total'], entries=row['rows'])
+        for row in yearly
+    ], batch_size=1000)
+
+
+def populate_rollups(apps, schema_editor):
+    WordFrequency = apps.get_model('minutesAnalysis', 'WordFrequency')
+    WordMonthlyTotal = apps.get_model('minutesAnalysis', 'WordMonthlyTotal')
+    WordYearlyTotal = apps.get_model('minutesAnalysis', 'WordYearlyTotal')
+
+    monthly = WordFrequency.objects.order_by().values('word', 'date__year', 'date__month').annotate(
+        total=Sum('frequency'),
+        rows=Count('id')
+    )
+    WordMonthlyTotal.objects.bulk_create([
+        WordMonthlyTotal(
+            word_id=row['word'],
+            year=row['date__year'],
+            month=row['date__month'],
+            frequency=row['total'],
+            entries=row['rows']
+        )
+        for row in monthly
+    ], batch_size=1000)
+
+    yearly = WordMonthlyTotal.objects.order_by().values('word', 'year').annotate(
+        total=Sum('frequency'),
+        rows=Sum('entries')
+    )
+    WordYearlyTotal.objects.bulk_create([
+        WordYearlyTotal(word_id=row['word'], year=row['year'], frequency=row['total'], entries=row['rows'])
+        for row in yearly
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0005_dataversion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Vocabulary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(help_text='Word from the meeting minutes', max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Vocabulary Word',
+                'verbose_name_plural': 'Vocabulary',
+                'ordering': ['term'],
+            },
+        ),
+
+        # WordFrequency.word: string -> vocabulary id
+        migrations.AddField(
+            model_name='wordfrequency',
+            name='term',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, to='minutesAnalysis.vocabulary'),
+        ),
+        # Nullable while both columns exist, so that migrating back can
+        # re-add the string column empty and fill it before it is required
+        migrations.AlterField(
+            model_name='wordfrequency',
+            name='word',
+            field=models.CharField(help_text='Word from the meeting minutes', max_length=100, null=True),
+        ),
+        migrations.RunPython(backfill_vocabulary, restore_words),
+        migrations.AlterUniqueTogether(
+            name='wordfrequency',
+            unique_together=set(),
+        ),
+        migrations.RemoveField(
+            model_name='wordfrequency',
+            name='word',
+        ),
+        migrations.RenameField(
+            model_name='wordfrequency',
+            old_name='term',
+            new_name='word',
+        ),
+        migrations.AlterField(
+            model_name='wordfrequency',
+            name='word',
+            field=models.ForeignKey(help_text='Word from the meeting minutes', on_delete=django.db.models.deletion.PROTECT, related_name='frequencies', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordfrequency',
+            unique_together={('date', 'word')},
+        ),
+
+        # Rollups are derived data: empty them, switch the column and refill
+        migrations.RunPython(clear_rollups, restore_rollups),
+        migrations.AlterUniqueTogether(
+            name='wordmonthlytotal',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordyearlytotal',
+            unique_together=set(),
+        ),
+        migrations.RemoveField(
+            model_name='wordmonthlytotal',
+            name='word',
+        ),
+        migrations.RemoveField(
+            model_name='wordyearlytotal',
+            name='word',
+        ),
+        migrations.AddField(
+            model_name='wordmonthlytotal',
+            name='word',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='monthly_totals', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.AddField(
+            model_name='wordyearlytotal',
+            name='word',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='yearly_totals', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.RunPython(populate_rollups, clear_rollups),
+        migrations.AlterField(
+            model_name='wordmonthlytotal',
+            name='word',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_totals', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.AlterField(
+            model_name='wordyearlytotal',
+            name='word',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='yearly_totals', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordmonthlytotal',
+            unique_together={('word', 'year', 'month')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordyearlytotal',
+            unique_together={('word', 'year')},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0006_vocabulary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='wordfrequency',
+            index=models.Index(fields=['-date', '-frequency', '-id'], name='word_freq_keyset_idx'),
+        ),
+    ]
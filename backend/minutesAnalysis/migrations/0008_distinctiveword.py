@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0007_wordfrequency_keyset_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DistinctiveWord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(choices=[('meeting', 'Meeting'), ('year', 'Year')], max_length=10)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('date', models.DateField(blank=True, help_text='Meeting date; empty for yearly scores', null=True)),
+                ('frequency', models.PositiveIntegerField(help_text='Frequency of the word in the period')),
+                ('score', models.FloatField(help_text='Log-odds z-score against the rest of the corpus')),
+                ('rank', models.PositiveIntegerField(help_text='1 for the most distinctive word of the period')),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='distinctive_scores', to='minutesAnalysis.vocabulary')),
+            ],
+            options={
+                'verbose_name': 'Distinctive Word',
+                'verbose_name_plural': 'Distinctive Words',
+                'ordering': ['scope', '-year', '-date', 'rank'],
+                'indexes': [models.Index(fields=['scope', 'year', 'rank'], name='distinctive_year_rank_idx'), models.Index(fields=['scope', 'date', 'rank'], name='distinctive_date_rank_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0008_distinctiveword'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordAnomaly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Date of the MPC meeting')),
+                ('frequency', models.PositiveIntegerField(help_text='Frequency of the word in the meeting')),
+                ('baseline', models.FloatField(help_text='Median frequency over the preceding meetings')),
+                ('score', models.FloatField(help_text='Robust z-score (median / MAD) against the preceding meetings')),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='anomalies', to='minutesAnalysis.vocabulary')),
+            ],
+            options={
+                'verbose_name': 'Word Anomaly',
+                'verbose_name_plural': 'Word Anomalies',
+                'ordering': ['-date', '-score'],
+                'indexes': [models.Index(fields=['-date', '-score'], name='word_anomaly_date_score_idx')],
+                'unique_together': {('date', 'word')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0009_wordanomaly'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vocabulary',
+            name='ngram_size',
+            field=models.PositiveSmallIntegerField(db_index=True, default=1, help_text='Number of words in the term'),
+        ),
+        migrations.AlterField(
+            model_name='vocabulary',
+            name='term',
+            field=models.CharField(help_text='Word or space-separated phrase from the meeting minutes', max_length=100, unique=True),
+        ),
+    ]
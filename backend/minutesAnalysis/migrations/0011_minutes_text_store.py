@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0010_vocabulary_ngram_size'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MinutesText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('compressed', models.BinaryField(help_text='zlib-compressed UTF-8 text')),
+                ('length', models.PositiveIntegerField(default=0, help_text='Length of the text in characters')),
+                ('document', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='text', to='minutesAnalysis.minutesdocument')),
+            ],
+            options={
+                'verbose_name': 'Minutes Text',
+                'verbose_name_plural': 'Minutes Texts',
+            },
+        ),
+        migrations.CreateModel(
+            name='WordPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('count', models.PositiveIntegerField(default=0, help_text='Occurrences of the word in the document')),
+                ('positions', models.BinaryField(help_text='zlib-compressed, delta-encoded uint32 positions')),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='minutesAnalysis.minutesdocument')),
+                ('word', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='minutesAnalysis.vocabulary')),
+            ],
+            options={
+                'verbose_name': 'Word Posting',
+                'verbose_name_plural': 'Word Postings',
+                'unique_together': {('word', 'document')},
+            },
+        ),
+    ]
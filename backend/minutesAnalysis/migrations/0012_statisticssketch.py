@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0011_minutes_text_store'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StatisticsSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('entries', models.PositiveBigIntegerField(default=0, help_text='WordFrequency rows')),
+                ('years', models.JSONField(default=list, help_text='Years with data')),
+                ('distinct_words', models.BinaryField(default=b'', help_text='HyperLogLog registers')),
+                ('heavy_hitters', models.JSONField(default=dict, help_text='Space-Saving counters')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Statistics Sketch',
+                'verbose_name_plural': 'Statistics Sketches',
+            },
+        ),
+    ]
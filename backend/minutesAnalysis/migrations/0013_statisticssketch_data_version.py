@@ -0,0 +1,76 @@
+import hashlib
+
+from django.db import migrations, models
+from django.db.models import Sum
+
+# Frozen copy of the sketch parameters and builders in sketches.py
+HLL_PRECISION = 14
+SPACE_SAVING_CAPACITY = 1000
+SKETCH_NAME = 'word_statistics'
+
+
+def _hll_registers(terms):
+    low_bits = 64 - HLL_PRECISION
+    mask = (1 << low_bits) - 1
+    registers = bytearray(1 << HLL_PRECISION)
+    for term in terms:
+        value = int.from_bytes(hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest(), 'big')
+        index = value >> low_bits
+        rank = low_bits - (value & mask).bit_length() + 1
+        if rank > registers[index]:
+            registers[index] = rank
+    return bytes(registers)
+
+
+def _heavy_hitters(totals):
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    floor = ranked[SPACE_SAVING_CAPACITY][1] if len(ranked) > SPACE_SAVING_CAPACITY else 0
+    return {
+        'capacity': SPACE_SAVING_CAPACITY,
+        'floor': floor,
+        'items': [[term, total, 0] for term, total in ranked[:SPACE_SAVING_CAPACITY]],
+    }
+
+
+def build_sketch(apps, schema_editor):
+    """Seed the sketch from the yearly rollup, as of the current data version"""
+    StatisticsSketch = apps.get_model('minutesAnalysis', 'StatisticsSketch')
+    WordYearlyTotal = apps.get_model('minutesAnalysis', 'WordYearlyTotal')
+    DataVersion = apps.get_model('minutesAnalysis', 'DataVersion')
+
+    totals = dict(
+        WordYearlyTotal.objects.filter(word__ngram_size=1)
+        .values('word__term')
+        .annotate(total=Sum('frequency'))
+        .values_list('word__term', 'total')
+    )
+    entries = WordYearlyTotal.objects.filter(word__ngram_size=1).aggregate(entries=Sum('entries'))['entries'] or 0
+    years = WordYearlyTotal.objects.order_by().values_list('year', flat=True).distinct()
+    version = DataVersion.objects.filter(scope='all').values_list('version', flat=True).first() or 0
+
+    StatisticsSketch.objects.update_or_create(
+        name=SKETCH_NAME,
+        defaults={
+            'distinct_words': _hll_registers(totals),
+            'heavy_hitters': _heavy_hitters(totals),
+            'entries': entries,
+            'years': sorted(years),
+            'data_version': version,
+        }
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0012_statisticssketch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statisticssketch',
+            name='data_version',
+            field=models.PositiveBigIntegerField(default=0, help_text='DataVersion the sketches reflect'),
+        ),
+        migrations.RunPython(build_sketch, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def move_postings(apps, schema_editor):
+    """
+    Point the postings at index terms and drop the vocabulary entries that
+    only the postings created (stop words and short words never counted)
+    """
+    IndexTerm = apps.get_model('minutesAnalysis', 'IndexTerm')
+    Vocabulary = apps.get_model('minutesAnalysis', 'Vocabulary')
+    WordPosting = apps.get_model('minutesAnalysis', 'WordPosting')
+
+    terms = dict(Vocabulary.objects.filter(postings__isnull=False).distinct().values_list('id', 'term'))
+    IndexTerm.objects.bulk_create([IndexTerm(term=term) for term in terms.values()], ignore_conflicts=True)
+    term_ids = dict(IndexTerm.objects.values_list('term', 'id'))
+    for word_id, term in terms.items():
+        WordPosting.objects.filter(word_id=word_id).update(term_id=term_ids[term], word=None)
+
+    Vocabulary.objects.filter(
+        id__in=terms,
+        frequencies__isnull=True,
+        monthly_totals__isnull=True,
+        yearly_totals__isnull=True,
+        distinctive_scores__isnull=True,
+        anomalies__isnull=True,
+    ).delete()
+
+
+def restore_postings(apps, schema_editor):
+    IndexTerm = apps.get_model('minutesAnalysis', 'IndexTerm')
+    Vocabulary = apps.get_model('minutesAnalysis', 'Vocabulary')
+    WordPosting = apps.get_model('minutesAnalysis', 'WordPosting')
+
+    terms = dict(IndexTerm.objects.filter(postings__isnull=False).distinct().values_list('id', 'term'))
+    Vocabulary.objects.bulk_create(
+        [Vocabulary(term=term, ngram_size=1) for term in terms.values()], ignore_conflicts=True
+    )
+    word_ids = dict(Vocabulary.objects.filter(term__in=terms.values()).values_list('term', 'id'))
+    for term_id, term in terms.items():
+        WordPosting.objects.filter(term_id=term_id).update(word_id=word_ids[term])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('minutesAnalysis', '0013_statisticssketch_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndexTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(help_text='Token from the stored minutes text', max_length=100, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Index Term',
+                'verbose_name_plural': 'Index Terms',
+                'ordering': ['term'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordposting',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='wordposting',
+            name='term',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='minutesAnalysis.indexterm'),
+        ),
+        migrations.AlterField(
+            model_name='wordposting',
+            name='word',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='minutesAnalysis.vocabulary'),
+        ),
+        migrations.RunPython(move_postings, restore_postings),
+        migrations.RemoveField(
+            model_name='wordposting',
+            name='word',
+        ),
+        migrations.AlterField(
+            model_name='wordposting',
+            name='term',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='postings', to='minutesAnalysis.indexterm'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='wordposting',
+            unique_together={('term', 'document')},
+        ),
+    ]
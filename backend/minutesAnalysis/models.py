@@ -1,22 +1,149 @@
-from django.db import models
+import zlib
+
+from django.db import models, transaction
+from django.utils import timezone
+
+class VocabularyQuerySet(models.QuerySet):
+    def ids_for(self, terms):
+        """Map terms to vocabulary ids, creating the missing entries"""
+        terms = set(terms)
+        ids = dict(self.filter(term__in=terms).values_list('term', 'id'))
+        missing = terms - ids.keys()
+        if missing:
+            self.bulk_create(
+                [Vocabulary(term=term, ngram_size=term.count(' ') + 1) for term in missing],
+                ignore_conflicts=True
+            )
+            ids.update(self.filter(term__in=missing).values_list('term', 'id'))
+        return ids
+
+
+class Vocabulary(models.Model):
+    """
+    A distinct word or phrase from the meeting minutes. Frequency and rollup
+    rows refer to words by integer id instead of repeating the string on every row
+    """
+    term = models.CharField(max_length=100, unique=True, help_text="Word or space-separated phrase from the meeting minutes")
+    ngram_size = models.PositiveSmallIntegerField(default=1, db_index=True, help_text="Number of words in the term")
+
+    objects = VocabularyQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['term']
+        verbose_name = "Vocabulary Word"
+        verbose_name_plural = "Vocabulary"
+
+    def __str__(self):
+        return self.term
+
+
+class WordFrequencyQuerySet(models.QuerySet):
+    """
+    QuerySet that keeps the word rollup tables and data versions in sync
+    for bulk writes, which bypass WordFrequency.save() and WordFrequency.delete()
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from . import rollups
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            keys = rollups.keys_for_objects(objs)
+            if kwargs.get('update_conflicts') or kwargs.get('ignore_conflicts'):
+                # Conflicting rows were overwritten or skipped, so the net
+                # change is unknown: recompute the touched rollup cells
+                rollups.refresh_keys(keys)
+            else:
+                rollups.apply_deltas(rollups.deltas_for_objects(created))
+            DataVersion.bump(key[1] for key in keys)
+        return created
+
+    def update(self, **kwargs):
+        from . import rollups
+
+        if not {'date', 'word', 'word_id', 'frequency'} & set(kwargs):
+            return super().update(**kwargs)
+
+        with transaction.atomic(using=self.db):
+            pks = list(self.values_list('pk', flat=True))
+            keys = rollups.keys_for_queryset(self.model.objects.filter(pk__in=pks))
+            rows = super().update(**kwargs)
+            keys |= rollups.keys_for_queryset(self.model.objects.filter(pk__in=pks))
+            rollups.refresh_keys(keys)
+            DataVersion.bump(key[1] for key in keys)
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        from . import rollups
+
+        with transaction.atomic(using=self.db):
+            deltas = rollups.deltas_for_queryset(self, sign=-1)
+            result = super().delete()
+            rollups.apply_deltas(deltas)
+            DataVersion.bump(key[1] for key in deltas)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class WordFrequency(models.Model):
     """
     Model to store word frequency data from MPC meeting minutes analysis
     """
     date = models.DateField(help_text="Date of the MPC meeting")
-    word = models.CharField(max_length=100, help_text="Word from the meeting minutes")
+    word = models.ForeignKey(
+        Vocabulary,
+        on_delete=models.PROTECT,
+        related_name='frequencies',
+        help_text="Word from the meeting minutes"
+    )
     frequency = models.PositiveIntegerField(help_text="Frequency count of the word")
+
+    objects = WordFrequencyQuerySet.as_manager()
     
     class Meta:
         ordering = ['-date', '-frequency']
         unique_together = ['date', 'word']  # Prevent duplicate word entries for same date
+        indexes = [
+            # Keyset pagination of the word list
+            models.Index(fields=['-date', '-frequency', '-id'], name='word_freq_keyset_idx'),
+        ]
         verbose_name = "Word Frequency"
         verbose_name_plural = "Word Frequencies"
     
     def __str__(self):
         return f"{self.word} ({self.frequency}) - {self.date}"
 
+    def save(self, *args, **kwargs):
+        from . import rollups
+
+        with transaction.atomic():
+            deltas = {}
+            if self.pk is not None:
+                previous = WordFrequency.objects.filter(pk=self.pk).values(
+                    'date', 'word', 'frequency'
+                ).first()
+                if previous:
+                    rollups.add_delta(deltas, previous['word'], previous['date'], -previous['frequency'], -1)
+            super().save(*args, **kwargs)
+            rollups.add_delta(deltas, self.word_id, self.date, self.frequency, 1)
+            rollups.apply_deltas(deltas)
+            DataVersion.bump(key[1] for key in deltas)
+
+    def delete(self, *args, **kwargs):
+        from . import rollups
+
+        with transaction.atomic():
+            deltas = rollups.deltas_for_queryset(WordFrequency.objects.filter(pk=self.pk), sign=-1)
+            result = super().delete(*args, **kwargs)
+            rollups.apply_deltas(deltas)
+            DataVersion.bump(key[1] for key in deltas)
+        return result
+
     @property
     def year(self):
         """Get the year from the date"""
@@ -25,4 +152,268 @@ class WordFrequency(models.Model):
     @property
     def month(self):
         """Get the month from the date"""
-        return self.date.month
\ No newline at end of file
+        return self.date.month
+
+
+class WordMonthlyTotal(models.Model):
+    """
+    Rollup of WordFrequency: total frequency of a word in one calendar month.
+    Maintained incrementally by WordFrequency writes, see rollups.py
+    """
+    word = models.ForeignKey(Vocabulary, on_delete=models.CASCADE, related_name='monthly_totals')
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    frequency = models.PositiveBigIntegerField(default=0, help_text="Sum of frequencies for the month")
+    entries = models.PositiveIntegerField(default=0, help_text="Number of WordFrequency rows summed")
+
+    class Meta:
+        ordering = ['-year', 'month', '-frequency']
+        unique_together = ['word', 'year', 'month']
+        indexes = [
+            models.Index(fields=['year', 'month'], name='word_month_period_idx'),
+        ]
+        verbose_name = "Word Monthly Total"
+        verbose_name_plural = "Word Monthly Totals"
+
+    def __str__(self):
+        return f"{self.word} ({self.frequency}) - {self.year}-{self.month:02d}"
+
+
+class WordYearlyTotal(models.Model):
+    """
+    Rollup of WordFrequency: total frequency of a word in one calendar year.
+    Maintained incrementally by WordFrequency writes, see rollups.py
+    """
+    word = models.ForeignKey(Vocabulary, on_delete=models.CASCADE, related_name='yearly_totals')
+    year = models.PositiveSmallIntegerField()
+    frequency = models.PositiveBigIntegerField(default=0, help_text="Sum of frequencies for the year")
+    entries = models.PositiveIntegerField(default=0, help_text="Number of WordFrequency rows summed")
+
+    class Meta:
+        ordering = ['-year', '-frequency']
+        unique_together = ['word', 'year']
+        indexes = [
+            models.Index(fields=['year', '-frequency'], name='word_year_frequency_idx'),
+        ]
+        verbose_name = "Word Yearly Total"
+        verbose_name_plural = "Word Yearly Totals"
+
+    def __str__(self):
+        return f"{self.word} ({self.frequency}) - {self.year}"
+
+
+class DistinctiveWord(models.Model):
+    """
+    Precomputed distinctiveness of a word for one meeting date or one calendar
+    year, relative to the rest of the minutes corpus. Only the top words of each
+    period are stored; see distinctiveness.py and compute_distinctive_words
+    """
+    MEETING = 'meeting'
+    YEAR = 'year'
+    SCOPE_CHOICES = [
+        (MEETING, 'Meeting'),
+        (YEAR, 'Year'),
+    ]
+
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES)
+    year = models.PositiveSmallIntegerField()
+    date = models.DateField(null=True, blank=True, help_text="Meeting date; empty for yearly scores")
+    word = models.ForeignKey(Vocabulary, on_delete=models.CASCADE, related_name='distinctive_scores')
+    frequency = models.PositiveIntegerField(help_text="Frequency of the word in the period")
+    score = models.FloatField(help_text="Log-odds z-score against the rest of the corpus")
+    rank = models.PositiveIntegerField(help_text="1 for the most distinctive word of the period")
+
+    class Meta:
+        ordering = ['scope', '-year', '-date', 'rank']
+        indexes = [
+            models.Index(fields=['scope', 'year', 'rank'], name='distinctive_year_rank_idx'),
+            models.Index(fields=['scope', 'date', 'rank'], name='distinctive_date_rank_idx'),
+        ]
+        verbose_name = "Distinctive Word"
+        verbose_name_plural = "Distinctive Words"
+
+    def __str__(self):
+        return f"{self.word} #{self.rank} ({self.score:.4f}) - {self.date or self.year}"
+
+
+class WordAnomaly(models.Model):
+    """
+    A meeting where a word's frequency spiked compared with the preceding
+    meetings (robust rolling z-score). Refreshed from the ingestion date
+    onwards after every ingest; see anomalies.py
+    """
+    date = models.DateField(help_text="Date of the MPC meeting")
+    word = models.ForeignKey(Vocabulary, on_delete=models.CASCADE, related_name='anomalies')
+    frequency = models.PositiveIntegerField(help_text="Frequency of the word in the meeting")
+    baseline = models.FloatField(help_text="Median frequency over the preceding meetings")
+    score = models.FloatField(help_text="Robust z-score (median / MAD) against the preceding meetings")
+
+    class Meta:
+        ordering = ['-date', '-score']
+        unique_together = ['date', 'word']
+        indexes = [
+            models.Index(fields=['-date', '-score'], name='word_anomaly_date_score_idx'),
+        ]
+        verbose_name = "Word Anomaly"
+        verbose_name_plural = "Word Anomalies"
+
+    def __str__(self):
+        return f"{self.word} ({self.frequency}, z={self.score:.1f}) - {self.date}"
+
+
+class MinutesDocument(models.Model):
+    """
+    A minutes document that has been ingested into WordFrequency,
+    identified by the SHA-256 of its content so re-runs can skip it
+    """
+    content_hash = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the file content")
+    source = models.CharField(max_length=255, help_text="Path the document was ingested from")
+    date = models.DateField(help_text="Date of the MPC meeting")
+    word_count = models.PositiveIntegerField(default=0, help_text="Number of counted words")
+    ingested_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-date']
+        verbose_name = "Minutes Document"
+        verbose_name_plural = "Minutes Documents"
+
+    def __str__(self):
+        return f"{self.source} - {self.date}"
+
+
+class MinutesText(models.Model):
+    """
+    zlib-compressed text of an ingested minutes document, kept for the
+    keyword-in-context search; see concordance.py
+    """
+    document = models.OneToOneField(MinutesDocument, on_delete=models.CASCADE, related_name='text')
+    compressed = models.BinaryField(help_text="zlib-compressed UTF-8 text")
+    length = models.PositiveIntegerField(default=0, help_text="Length of the text in characters")
+
+    class Meta:
+        verbose_name = "Minutes Text"
+        verbose_name_plural = "Minutes Texts"
+
+    def __str__(self):
+        return f"{self.document} ({self.length} characters)"
+
+    @property
+    def text(self):
+        return zlib.decompress(bytes(self.compressed)).decode('utf-8')
+
+
+class IndexTermQuerySet(models.QuerySet):
+    def ids_for(self, terms):
+        """Map terms to index term ids, creating the missing entries"""
+        terms = set(terms)
+        ids = dict(self.filter(term__in=terms).values_list('term', 'id'))
+        missing = terms - ids.keys()
+        if missing:
+            self.bulk_create([IndexTerm(term=term) for term in missing], ignore_conflicts=True)
+            ids.update(self.filter(term__in=missing).values_list('term', 'id'))
+        return ids
+
+
+class IndexTerm(models.Model):
+    """
+    A token of the minutes text store. Unlike Vocabulary, which only holds
+    counted words and phrases, every token is indexed here (stop words and
+    short words included) so phrase searches can match them
+    """
+    term = models.CharField(max_length=100, unique=True, help_text="Token from the stored minutes text")
+
+    objects = IndexTermQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['term']
+        verbose_name = "Index Term"
+        verbose_name_plural = "Index Terms"
+
+    def __str__(self):
+        return self.term
+
+
+class WordPosting(models.Model):
+    """
+    Positional inverted index of the minutes text store: every occurrence of
+    a term in one document, as compressed (token index, character offset)
+    pairs; see concordance.py
+    """
+    term = models.ForeignKey(IndexTerm, on_delete=models.CASCADE, related_name='postings')
+    document = models.ForeignKey(MinutesDocument, on_delete=models.CASCADE, related_name='postings')
+    count = models.PositiveIntegerField(default=0, help_text="Occurrences of the word in the document")
+    positions = models.BinaryField(help_text="zlib-compressed, delta-encoded uint32 positions")
+
+    class Meta:
+        unique_together = ['term', 'document']
+        verbose_name = "Word Posting"
+        verbose_name_plural = "Word Postings"
+
+    def __str__(self):
+        return f"{self.term} x{self.count} - {self.document}"
+
+
+class StatisticsSketch(models.Model):
+    """
+    Persisted sketches behind the approximate word statistics: a HyperLogLog
+    of distinct words and a Space-Saving summary of the heaviest words,
+    updated at ingestion; see sketches.py
+    """
+    name = models.CharField(max_length=50, unique=True)
+    data_version = models.PositiveBigIntegerField(default=0, help_text="DataVersion the sketches reflect")
+    entries = models.PositiveBigIntegerField(default=0, help_text="WordFrequency rows")
+    years = models.JSONField(default=list, help_text="Years with data")
+    distinct_words = models.BinaryField(default=b'', help_text="HyperLogLog registers")
+    heavy_hitters = models.JSONField(default=dict, help_text="Space-Saving counters")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Statistics Sketch"
+        verbose_name_plural = "Statistics Sketches"
+
+    def __str__(self):
+        return f"{self.name} ({self.entries} entries)"
+
+
+class DataVersion(models.Model):
+    """
+    Change counter for WordFrequency data. The 'all' scope is bumped on every
+    write, and one scope per calendar year is bumped when that year changes.
+    Caches and the analytics snapshot are keyed on these versions.
+    """
+    ALL = 'all'
+
+    scope = models.CharField(max_length=20, unique=True, help_text="'all' or a year such as '2024'")
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['scope']
+        verbose_name = "Data Version"
+        verbose_name_plural = "Data Versions"
+
+    def __str__(self):
+        return f"{self.scope} v{self.version}"
+
+    @classmethod
+    def bump(cls, years=()):
+        """
+        Increment the global version and the version of every given year,
+        and rebuild the analytics snapshot once the write commits
+        """
+        from . import matrix
+
+        scopes = {cls.ALL} | {str(year) for year in years}
+        cls.objects.bulk_create(
+            [cls(scope=scope) for scope in scopes],
+            ignore_conflicts=True
+        )
+        cls.objects.filter(scope__in=scopes).update(
+            version=models.F('version') + 1,
+            updated_at=timezone.now()
+        )
+        matrix.rebuild_after_commit()
+
+    @classmethod
+    def current(cls, scope=ALL):
+        return cls.objects.filter(scope=str(scope)).values_list('version', flat=True).first() or 0
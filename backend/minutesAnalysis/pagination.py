@@ -0,0 +1,130 @@
+from base64 import b64decode, b64encode
+from datetime import date
+from urllib import parse
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class WordFrequencyCursorPagination(BasePagination):
+    """
+    Keyset pagination over (date, frequency, id), newest first. The cursor
+    holds the (date, frequency, id) of the row a page continues from, and a
+    page is one range scan of word_freq_keyset_idx, so deep pages cost the
+    same as the first one. DRF's CursorPagination keys on the first ordering
+    field only and pages within a date by an offset capped at 1000 rows,
+    which repeats pages on meetings with many words.
+    """
+    ordering = ('-date', '-frequency', '-id')
+    cursor_query_param = 'cursor'
+    page_size = 500
+    page_size_query_param = 'page_size'
+    max_page_size = 5000
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        if position is not None:
+            queryset = queryset.filter(self.keyset(*position, reverse=reverse))
+        ordering = [field.lstrip('-') for field in self.ordering] if reverse else self.ordering
+        rows = list(queryset.order_by(*ordering)[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        # A cursor means there are rows on the side it came from
+        self.has_next = position is not None if reverse else has_more
+        self.has_previous = has_more if reverse else position is not None
+        self.first = self.key(rows[0]) if rows else position
+        self.last = self.key(rows[-1]) if rows else position
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_next_link(self):
+        if not self.has_next or self.last is None:
+            return None
+        return self.encode_cursor(self.last, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.first is None:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.first, reverse=True)
+
+    @staticmethod
+    def key(row):
+        return row.date, row.frequency, row.id
+
+    @staticmethod
+    def keyset(meeting_date, frequency, pk, reverse=False):
+        """Rows after (date, frequency, id) in the page order, or before it when `reverse`"""
+        if reverse:
+            return (
+                Q(date__gt=meeting_date)
+                | Q(date=meeting_date, frequency__gt=frequency)
+                | Q(date=meeting_date, frequency=frequency, id__gt=pk)
+            )
+        return (
+            Q(date__lt=meeting_date)
+            | Q(date=meeting_date, frequency__lt=frequency)
+            | Q(date=meeting_date, frequency=frequency, id__lt=pk)
+        )
+
+    def decode_cursor(self, request):
+        """((date, frequency, id) or None, reverse) of the ?cursor= parameter"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+        try:
+            tokens = parse.parse_qs(b64decode(encoded.encode('ascii')).decode('ascii'), keep_blank_values=True)
+            position = (
+                date.fromisoformat(tokens['d'][0]),
+                int(tokens['f'][0]),
+                int(tokens['i'][0]),
+            )
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position, reverse):
+        meeting_date, frequency, pk = position
+        tokens = {'d': meeting_date.isoformat(), 'f': frequency, 'i': pk}
+        if reverse:
+            tokens['r'] = 1
+        encoded = b64encode(parse.urlencode(tokens, doseq=True).encode('ascii')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
@@ -0,0 +1,31 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+from .layout import to_svg
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON (?format=ndjson). Streaming views write their rows
+    themselves; this renderer covers the regular responses (errors, lists).
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = data if isinstance(data, list) else [data]
+        return ''.join(json.dumps(row, default=str) + '\n' for row in rows).encode(self.charset)
+
+
+class WordCloudSVGRenderer(BaseRenderer):
+    """Renders a word cloud layout (?format=svg) as an SVG document"""
+    media_type = 'image/svg+xml'
+    format = 'svg'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return to_svg(data or {}).encode(self.charset)
@@ -0,0 +1,201 @@
+"""
+Incremental maintenance of the WordMonthlyTotal / WordYearlyTotal rollups.
+
+Every write to WordFrequency is translated into per-(word id, year, month)
+deltas of (frequency, entries). The deltas are applied to the monthly table
+and folded into the yearly table in a handful of queries, so the read views
+never have to sum the raw rows again.
+"""
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from .models import WordFrequency, WordMonthlyTotal, WordYearlyTotal
+
+BATCH_SIZE = 1000
+
+
+def add_delta(deltas, word_id, date, frequency, entries):
+    """Accumulate a (frequency, entries) change for the month of `date`"""
+    key = (word_id, date.year, date.month)
+    current = deltas.get(key, (0, 0))
+    deltas[key] = (current[0] + frequency, current[1] + entries)
+    return deltas
+
+
+def deltas_for_objects(objs, sign=1):
+    deltas = {}
+    for obj in objs:
+        add_delta(deltas, obj.word_id, obj.date, sign * obj.frequency, sign)
+    return deltas
+
+
+def deltas_for_queryset(queryset, sign=1):
+    """Grouped (word id, year, month) sums of a queryset, as deltas"""
+    rows = queryset.order_by().values('word', 'date__year', 'date__month').annotate(
+        total=Sum('frequency'),
+        rows=Count('id')
+    )
+    return {
+        (row['word'], row['date__year'], row['date__month']): (sign * row['total'], sign * row['rows'])
+        for row in rows
+    }
+
+
+def keys_for_objects(objs):
+    return {(obj.word_id, obj.date.year, obj.date.month) for obj in objs}
+
+
+def keys_for_queryset(queryset):
+    return set(deltas_for_queryset(queryset))
+
+
+def _fetch(model, words, years):
+    return model.objects.select_for_update().filter(word__in=words, year__in=years)
+
+
+def _write_monthly(values):
+    """
+    Store absolute {(word id, year, month): (frequency, entries)} values,
+    deleting cells that dropped to zero entries
+    """
+    if not values:
+        return
+    words = {key[0] for key in values}
+    years = {key[1] for key in values}
+    existing = {
+        (row.word_id, row.year, row.month): row
+        for row in _fetch(WordMonthlyTotal, words, years)
+        if (row.word_id, row.year, row.month) in values
+    }
+    to_create, to_update, to_delete = [], [], []
+    for key, (frequency, entries) in values.items():
+        row = existing.get(key)
+        if entries <= 0:
+            if row is not None:
+                to_delete.append(row.pk)
+        elif row is None:
+            to_create.append(WordMonthlyTotal(
+                word_id=key[0], year=key[1], month=key[2], frequency=frequency, entries=entries
+            ))
+        else:
+            row.frequency, row.entries = frequency, entries
+            to_update.append(row)
+
+    WordMonthlyTotal.objects.filter(pk__in=to_delete).delete()
+    WordMonthlyTotal.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+    WordMonthlyTotal.objects.bulk_update(to_update, ['frequency', 'entries'], batch_size=BATCH_SIZE)
+
+
+def _write_yearly(deltas):
+    """Apply {(word id, year): (frequency, entries)} deltas to the yearly table"""
+    if not deltas:
+        return
+    words = {key[0] for key in deltas}
+    years = {key[1] for key in deltas}
+    existing = {
+        (row.word_id, row.year): row
+        for row in _fetch(WordYearlyTotal, words, years)
+        if (row.word_id, row.year) in deltas
+    }
+    to_create, to_update, to_delete = [], [], []
+    for key, (frequency, entries) in deltas.items():
+        row = existing.get(key)
+        if row is None:
+            if entries > 0:
+                to_create.append(WordYearlyTotal(word_id=key[0], year=key[1], frequency=frequency, entries=entries))
+            continue
+        row.frequency += frequency
+        row.entries += entries
+        if row.entries <= 0:
+            to_delete.append(row.pk)
+        else:
+            to_update.append(row)
+
+    WordYearlyTotal.objects.filter(pk__in=to_delete).delete()
+    WordYearlyTotal.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+    WordYearlyTotal.objects.bulk_update(to_update, ['frequency', 'entries'], batch_size=BATCH_SIZE)
+
+
+def apply_deltas(deltas):
+    """Add (frequency, entries) deltas keyed by (word id, year, month) to both rollups"""
+    deltas = {key: value for key, value in deltas.items() if value != (0, 0)}
+    if not deltas:
+        return
+
+    with transaction.atomic():
+        words = {key[0] for key in deltas}
+        years = {key[1] for key in deltas}
+        current = {
+            (row.word_id, row.year, row.month): (row.frequency, row.entries)
+            for row in _fetch(WordMonthlyTotal, words, years)
+        }
+        monthly = {}
+        yearly = defaultdict(lambda: (0, 0))
+        for key, (frequency, entries) in deltas.items():
+            old_frequency, old_entries = current.get(key, (0, 0))
+            monthly[key] = (old_frequency + frequency, old_entries + entries)
+            year_key = (key[0], key[1])
+            yearly[year_key] = (yearly[year_key][0] + frequency, yearly[year_key][1] + entries)
+
+        _write_monthly(monthly)
+        _write_yearly(yearly)
+
+
+def refresh_keys(keys):
+    """
+    Recompute the given (word id, year, month) cells from the raw rows.
+    Used when the net effect of a write is not known up front
+    (upserts, queryset.update()).
+    """
+    if not keys:
+        return
+
+    with transaction.atomic():
+        words = {key[0] for key in keys}
+        years = {key[1] for key in keys}
+        raw = {
+            key: value
+            for key, value in deltas_for_queryset(
+                WordFrequency.objects.filter(word__in=words, date__year__in=years)
+            ).items()
+            if key in keys
+        }
+        current = {
+            (row.word_id, row.year, row.month): (row.frequency, row.entries)
+            for row in _fetch(WordMonthlyTotal, words, years)
+        }
+        deltas = {}
+        for key in keys:
+            new_frequency, new_entries = raw.get(key, (0, 0))
+            old_frequency, old_entries = current.get(key, (0, 0))
+            deltas[key] = (new_frequency - old_frequency, new_entries - old_entries)
+
+    apply_deltas(deltas)
+
+
+def rebuild():
+    """Recompute both rollup tables from scratch. Returns (monthly, yearly) row counts"""
+    with transaction.atomic():
+        WordMonthlyTotal.objects.all().delete()
+        WordYearlyTotal.objects.all().delete()
+
+        monthly = [
+            WordMonthlyTotal(word_id=word, year=year, month=month, frequency=frequency, entries=entries)
+            for (word, year, month), (frequency, entries)
+            in deltas_for_queryset(WordFrequency.objects.all()).items()
+        ]
+        WordMonthlyTotal.objects.bulk_create(monthly, batch_size=BATCH_SIZE)
+
+        yearly_rows = WordMonthlyTotal.objects.order_by().values('word', 'year').annotate(
+            total=Sum('frequency'),
+            rows=Sum('entries')
+        )
+        yearly = [
+            WordYearlyTotal(word_id=row['word'], year=row['year'], frequency=row['total'], entries=row['rows'])
+            for row in yearly_rows
+        ]
+        WordYearlyTotal.objects.bulk_create(yearly, batch_size=BATCH_SIZE)
+
+    return len(monthly), len(yearly)
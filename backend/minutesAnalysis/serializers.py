@@ -1,7 +1,9 @@
+import calendar
 from rest_framework import serializers
 from .models import WordFrequency
 
 class WordFrequencySerializer(serializers.ModelSerializer):
+    word = serializers.CharField(source='word.term', read_only=True)
     year = serializers.SerializerMethodField()
     month = serializers.SerializerMethodField()
     month_name = serializers.SerializerMethodField()
@@ -25,20 +27,16 @@ class WordFrequencySerializer(serializers.ModelSerializer):
         return obj.date.month
     
     def get_month_name(self, obj):
-        return obj.date.strftime('%B')
-
-class YearlyWordCloudSerializer(serializers.Serializer):
-    """Serializer for yearly word cloud data"""
-    year = serializers.IntegerField()
-    words = serializers.ListField(
-        child=serializers.DictField(
-            child=serializers.CharField()
-        )
-    )
+        return calendar.month_name[obj.date.month]
 
 class MonthlyFrequencySerializer(serializers.Serializer):
     """Serializer for monthly frequency trends"""
     year = serializers.IntegerField()
+    words = serializers.ListField(child=serializers.CharField())
+    months = serializers.ListField(child=serializers.IntegerField())
+    series = serializers.DictField(
+        child=serializers.ListField(child=serializers.IntegerField())
+    )
     monthly_data = serializers.ListField(
         child=serializers.DictField()
     )
\ No newline at end of file
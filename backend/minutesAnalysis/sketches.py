@@ -0,0 +1,207 @@
+"""
+Approximate word statistics from small, persisted sketches.
+
+- HyperLogLog (2**HLL_PRECISION one-byte registers, ~0.8% standard error)
+  estimates the number of distinct words.
+- Space-Saving with SPACE_SAVING_CAPACITY counters tracks the heaviest
+  words; every count is an upper bound, at most `error` above the truth.
+
+Both are stored in one StatisticsSketch row, so /statistics/ reads a single
+row whatever the size of WordFrequency. Ingestion folds in the change of
+every count (new minus previous), so re-ingesting a meeting does not count
+it twice. The row records the DataVersion it reflects: writes made outside
+ingestion (admin, test data commands) leave it behind, and until the next
+ingestion or `rebuild_statistics_sketch` brings it up to date /statistics/
+computes the exact figures instead.
+"""
+import hashlib
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Sum
+
+from .models import DataVersion, StatisticsSketch, WordYearlyTotal
+
+HLL_PRECISION = 14
+SPACE_SAVING_CAPACITY = 1000
+SKETCH_NAME = 'word_statistics'
+
+
+def _hash64(term):
+    return int.from_bytes(hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HyperLogLog:
+    def __init__(self, precision=HLL_PRECISION, registers=None):
+        self.precision = precision
+        size = 1 << precision
+        if registers:
+            self.registers = np.frombuffer(bytes(registers), dtype=np.uint8).copy()
+        else:
+            self.registers = np.zeros(size, dtype=np.uint8)
+
+    def add_many(self, terms):
+        low_bits = 64 - self.precision
+        mask = (1 << low_bits) - 1
+        for term in terms:
+            value = _hash64(term)
+            index = value >> low_bits
+            rank = low_bits - (value & mask).bit_length() + 1
+            if rank > self.registers[index]:
+                self.registers[index] = rank
+
+    def count(self):
+        size = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        empty = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * size and empty:
+            # Small-range correction: linear counting
+            estimate = size * np.log(size / empty)
+        return int(round(estimate))
+
+    def to_bytes(self):
+        return self.registers.tobytes()
+
+
+class SpaceSaving:
+    def __init__(self, capacity=SPACE_SAVING_CAPACITY, items=(), floor=0):
+        self.capacity = capacity
+        # term -> [count, error]
+        self.counters = {term: [count, error] for term, count, error in items}
+        # Largest count ever evicted: no unmonitored term can exceed it
+        self.floor = floor
+
+    def update(self, counts):
+        """
+        Merge exact {term: change} of a batch (Space-Saving merge): a term
+        that is not monitored may already have been counted up to the
+        floor, which becomes its error. Negative changes are subtracted from
+        monitored terms and ignored for the others, whose bound only gets
+        looser. The `capacity` largest counters are kept.
+        """
+        for term, count in counts.items():
+            counter = self.counters.get(term)
+            if counter is not None:
+                counter[0] += count
+                if counter[0] <= 0:
+                    del self.counters[term]
+            elif count > 0:
+                self.counters[term] = [self.floor + count, self.floor]
+        if len(self.counters) > self.capacity:
+            ranked = sorted(self.counters.items(), key=lambda item: item[1][0], reverse=True)
+            self.floor = max(self.floor, ranked[self.capacity][1][0])
+            self.counters = dict(ranked[:self.capacity])
+
+    def top(self, limit=None):
+        """[(term, count, error)] heaviest first"""
+        ranked = sorted(
+            ((term, count, error) for term, (count, error) in self.counters.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        return ranked[:limit] if limit else ranked
+
+    def to_json(self):
+        return {'capacity': self.capacity, 'floor': self.floor, 'items': [list(item) for item in self.top()]}
+
+
+def _single_words(counts):
+    return {term: count for term, count in counts.items() if ' ' not in term and count}
+
+
+def _load_for_update():
+    sketch, _ = StatisticsSketch.objects.select_for_update().get_or_create(name=SKETCH_NAME)
+    return sketch
+
+
+def _space_saving_state(sketch):
+    state = sketch.heavy_hitters or {}
+    return {
+        'capacity': state.get('capacity', SPACE_SAVING_CAPACITY),
+        'items': state.get('items', []),
+        'floor': state.get('floor', 0),
+    }
+
+
+def _removes_words(changes):
+    """Whether a batch took some word out of the corpus altogether"""
+    removed = {term for term, change in changes.items() if change < 0}
+    if not removed:
+        return False
+    remaining = WordYearlyTotal.objects.filter(word__term__in=removed, frequency__gt=0).values_list('word__term', flat=True)
+    return bool(removed - set(remaining))
+
+
+def update(changes, entries_delta, base_version):
+    """
+    Fold one ingestion batch, as {term: new minus previous count}, into the
+    persisted sketch. `base_version` is the DataVersion the batch was
+    written on top of. The sketch is rebuilt from the rollups instead when
+    it was not current at that version, or when the batch removed a word
+    from the corpus (a HyperLogLog cannot forget one).
+    """
+    changes = _single_words(changes)
+    with transaction.atomic():
+        sketch = _load_for_update()
+        if sketch.data_version != base_version or _removes_words(changes):
+            return rebuild()
+
+        distinct = HyperLogLog(registers=sketch.distinct_words)
+        distinct.add_many(term for term, change in changes.items() if change > 0)
+        heavy = SpaceSaving(**_space_saving_state(sketch))
+        heavy.update(changes)
+
+        sketch.distinct_words = distinct.to_bytes()
+        sketch.heavy_hitters = heavy.to_json()
+        sketch.entries = max(0, sketch.entries + entries_delta)
+        sketch.years = sorted(WordYearlyTotal.objects.order_by().values_list('year', flat=True).distinct())
+        sketch.data_version = DataVersion.current()
+        sketch.save()
+    return sketch
+
+
+def rebuild():
+    """Recompute the sketch from the yearly rollups. Returns the sketch"""
+    totals = dict(
+        WordYearlyTotal.objects.filter(word__ngram_size=1)
+        .values('word__term')
+        .annotate(total=Sum('frequency'))
+        .values_list('word__term', 'total')
+    )
+    rollup = WordYearlyTotal.objects.filter(word__ngram_size=1).aggregate(entries=Sum('entries'))
+    years = WordYearlyTotal.objects.order_by().values_list('year', flat=True).distinct()
+
+    distinct = HyperLogLog()
+    distinct.add_many(totals)
+    heavy = SpaceSaving()
+    heavy.update(totals)
+
+    with transaction.atomic():
+        sketch = _load_for_update()
+        sketch.distinct_words = distinct.to_bytes()
+        sketch.heavy_hitters = heavy.to_json()
+        sketch.entries = rollup['entries'] or 0
+        sketch.years = sorted(years)
+        sketch.data_version = DataVersion.current()
+        sketch.save()
+    return sketch
+
+
+def statistics():
+    """
+    Approximate /statistics/ payload, or None when there is no sketch or it
+    is behind the current DataVersion
+    """
+    sketch = StatisticsSketch.objects.filter(name=SKETCH_NAME).first()
+    if sketch is None or sketch.data_version != DataVersion.current():
+        return None
+    heaviest = SpaceSaving(**_space_saving_state(sketch)).top(1)
+    return {
+        'total_entries': sketch.entries,
+        'unique_words': HyperLogLog(registers=sketch.distinct_words).count(),
+        'years_covered': len(sketch.years),
+        'most_frequent_word': heaviest[0][0] if heaviest else None,
+        'highest_frequency': heaviest[0][1] if heaviest else 0,
+        'highest_frequency_error': heaviest[0][2] if heaviest else 0,
+    }
@@ -0,0 +1,292 @@
+import tempfile
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from . import concordance, distinctiveness, ingestion, matrix, sketches
+from .models import DataVersion, DistinctiveWord, IndexTerm, Vocabulary, WordFrequency
+
+
+def add_counts(meeting_date, counts):
+    """Write a meeting's counts the way ingest_minutes does, sketch included"""
+    version = DataVersion.current()
+    single_words = WordFrequency.objects.filter(date=meeting_date, word__ngram_size=1)
+    before = single_words.count()
+    changes = Counter()
+    ingestion.upsert_counts(meeting_date, counts, changes=changes)
+    sketches.update(
+        changes,
+        entries_delta=single_words.count() - before,
+        base_version=version
+    )
+
+
+class CountDocumentsTests(TestCase):
+    def test_worker_pool_matches_serial_counts(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        paths = []
+        for index, text in enumerate(['Inflation eased; the repo rate was held.', 'Growth and inflation rose.']):
+            path = Path(directory.name) / f'minutes_2024-0{index + 1}-08.txt'
+            path.write_text(text)
+            paths.append(path)
+
+        serial = list(ingestion.count_documents(paths))
+        pooled = list(ingestion.count_documents(paths, workers=2, chunk_size=1))
+
+        self.assertEqual(pooled, serial)
+        self.assertEqual(serial[1][1]['inflation'], 1)
+
+
+class StatisticsSketchTests(TestCase):
+    def setUp(self):
+        add_counts(date(2024, 2, 8), {'inflation': 12, 'growth': 5, 'liquidity': 3})
+
+    def test_reingest_does_not_double_count(self):
+        add_counts(date(2024, 2, 8), {'inflation': 12, 'growth': 5, 'liquidity': 3})
+
+        stats = sketches.statistics()
+        self.assertEqual(stats['most_frequent_word'], 'inflation')
+        self.assertEqual(stats['highest_frequency'], 12)
+        self.assertEqual(stats['total_entries'], 3)
+
+    def test_lowered_counts_are_subtracted(self):
+        add_counts(date(2024, 2, 8), {'inflation': 2, 'growth': 5, 'liquidity': 3})
+
+        stats = sketches.statistics()
+        self.assertEqual(stats['most_frequent_word'], 'growth')
+        self.assertEqual(stats['highest_frequency'], 5)
+
+    def test_missing_sketch_is_built_on_next_ingest(self):
+        sketches.StatisticsSketch.objects.all().delete()
+        self.assertIsNone(sketches.statistics())
+
+        add_counts(date(2024, 4, 5), {'inflation': 1})
+
+        stats = sketches.statistics()
+        self.assertEqual(stats['highest_frequency'], 13)
+        self.assertEqual(stats['unique_words'], 3)
+        self.assertEqual(stats['years_covered'], 1)
+
+    def test_writes_outside_ingestion_fall_back_to_exact(self):
+        WordFrequency.objects.create(
+            date=date(2025, 1, 10), word=Vocabulary.objects.create(term='repo'), frequency=40
+        )
+        self.assertIsNone(sketches.statistics())
+
+        response = self.client.get('/api/minutesAnalysis/statistics/')
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['approximate'])
+        self.assertEqual(response.json()['most_frequent_word'], 'repo')
+
+        sketches.rebuild()
+        response = self.client.get('/api/minutesAnalysis/statistics/')
+        self.assertTrue(response.json()['approximate'])
+        self.assertEqual(response.json()['highest_frequency'], 40)
+
+
+class WordSeriesTests(TestCase):
+    def setUp(self):
+        WordFrequency.objects.create(
+            date=date(2024, 3, 1), word=Vocabulary.objects.create(term='repo rate', ngram_size=2), frequency=4
+        )
+        WordFrequency.objects.create(
+            date=date(2025, 1, 10), word=Vocabulary.objects.create(term='inflation'), frequency=9
+        )
+
+    def test_words_of_another_length_are_ignored(self):
+        response = self.client.get('/api/minutesAnalysis/series/', {'words': 'inflation,repo rate', 'n': 2})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['periods'], ['2024-03'])
+        self.assertEqual(data['series'], {'inflation': [0], 'repo rate': [4]})
+
+    def test_single_words_by_year(self):
+        response = self.client.get('/api/minutesAnalysis/series/', {'words': 'inflation', 'granularity': 'year'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['periods'], ['2025'])
+        self.assertEqual(response.json()['series'], {'inflation': [9]})
+
+
+class WordListPaginationTests(TestCase):
+    def setUp(self):
+        # More rows on one date than DRF's cursor offset cutoff (1000) plus a page
+        ingestion.upsert_counts(date(2024, 2, 8), {f'word{index:04d}': index % 3 + 1 for index in range(1600)})
+        ingestion.upsert_counts(date(2024, 4, 5), {'inflation': 7, 'liquidity': 2})
+
+    def test_every_row_appears_once(self):
+        ids = []
+        url = '/api/minutesAnalysis/words/?page_size=500'
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.json())
+            ids.extend(row['id'] for row in pages[-1]['results'])
+            url = pages[-1]['next']
+            self.assertLess(len(pages), 10)
+
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids), set(WordFrequency.objects.values_list('id', flat=True)))
+        self.assertEqual(
+            ids, list(WordFrequency.objects.order_by('-date', '-frequency', '-id').values_list('id', flat=True))
+        )
+
+        previous = self.client.get(pages[-1]['previous']).json()
+        self.assertEqual(previous['results'], pages[-2]['results'])
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/minutesAnalysis/words/', {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+
+class FrequencyMatrixTests(TestCase):
+    def setUp(self):
+        snapshots = tempfile.TemporaryDirectory()
+        self.addCleanup(snapshots.cleanup)
+        self.enterContext(override_settings(MINUTES_SNAPSHOT_DIR=snapshots.name))
+        # Forget the matrix cached by earlier tests
+        matrix._loaded = None
+        ingestion.upsert_counts(date(2024, 2, 8), {'inflation': 12, 'growth': 5, 'repo rate': 30})
+        ingestion.upsert_counts(date(2024, 4, 5), {'inflation': 7, 'liquidity': 2})
+
+    def get(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_requests_do_not_build_the_snapshot(self):
+        self.assertIsNone(matrix.get_matrix())
+        self.get('/api/minutesAnalysis/trends/2024/')
+        self.assertIsNone(matrix.get_matrix())
+
+    def test_snapshot_and_rollups_agree(self):
+        urls = [
+            ('/api/minutesAnalysis/trends/2024/', {'top': 2}),
+            ('/api/minutesAnalysis/trends/2024/', {'words': 'Inflation, LIQUIDITY'}),
+            ('/api/minutesAnalysis/statistics/', {'exact': 1}),
+            ('/api/minutesAnalysis/wordcloud/2024/', {'limit': 2}),
+            ('/api/minutesAnalysis/wordcloud/2024/', {'min_frequency': 5}),
+            ('/api/minutesAnalysis/series/', {'words': 'inflation,growth,repo rate'}),
+            ('/api/minutesAnalysis/series/', {'words': 'inflation', 'granularity': 'quarter', 'normalize': 1}),
+            ('/api/minutesAnalysis/compare/', {
+                'a_from': '2024-01-01', 'a_to': '2024-02-29', 'b_from': '2024-03-01', 'b_to': '2024-12-31'
+            }),
+        ]
+        from_rollups = [self.get(url, **params) for url, params in urls]
+        matrix.build_snapshot()
+        self.assertIsNotNone(matrix.get_matrix())
+        self.assertEqual([self.get(url, **params) for url, params in urls], from_rollups)
+
+        self.assertEqual(from_rollups[0]['words'], ['inflation', 'growth'])
+        self.assertEqual(from_rollups[1]['series']['liquidity'][3], 2)
+        self.assertEqual(from_rollups[2]['total_entries'], 4)
+        self.assertEqual(from_rollups[2]['most_frequent_word'], 'inflation')
+        self.assertEqual(from_rollups[4]['words'], [{'word': 'inflation', 'frequency': 19}, {'word': 'growth', 'frequency': 5}])
+        self.assertEqual(from_rollups[5]['series'], {'inflation': [12, 0, 7], 'growth': [5, 0, 0], 'repo rate': [0, 0, 0]})
+
+    def test_committed_writes_rebuild_the_snapshot(self):
+        matrix.build_snapshot()
+        with self.captureOnCommitCallbacks(execute=True):
+            WordFrequency.objects.create(
+                date=date(2024, 6, 7), word=Vocabulary.objects.create(term='tightening'), frequency=40
+            )
+
+        self.assertIsNotNone(matrix.get_matrix())
+        self.assertEqual(matrix.get_matrix().ranked_words(2024, limit=1), [('tightening', 40)])
+
+    def test_deferred_writes_leave_the_build_to_the_writer(self):
+        with matrix.rebuild_deferred(), self.captureOnCommitCallbacks(execute=True) as callbacks:
+            ingestion.upsert_counts(date(2024, 6, 7), {'tightening': 40})
+
+        self.assertEqual(callbacks, [])
+        self.assertIsNone(matrix.get_matrix())
+
+    def test_snapshot_holds_single_words(self):
+        matrix.build_snapshot()
+        self.assertNotIn('repo rate', matrix.get_matrix().vocabulary)
+        self.assertIn('repo rate', matrix.read_matrix().vocabulary)
+
+
+class ConcordanceTests(TestCase):
+    def setUp(self):
+        documents = [('minutes_2024-02-08.txt', 'abc123', date(2024, 2, 8), 9)]
+        ingestion.record_documents(documents)
+        concordance.store_texts(documents, {
+            'minutes_2024-02-08.txt': 'The MPC voted for the withdrawal of accommodation. CPI is at 5 per cent.'
+        })
+
+    def test_postings_do_not_add_vocabulary(self):
+        self.assertEqual(IndexTerm.objects.filter(term__in=['the', 'of', 'is', 'at']).count(), 4)
+        self.assertFalse(Vocabulary.objects.exists())
+
+    def test_phrases_with_stop_words_are_found(self):
+        response = self.client.get('/api/minutesAnalysis/kwic/', {'q': 'withdrawal of accommodation'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['total'], 1)
+        self.assertEqual(response.json()['hits'][0]['match'], 'withdrawal of accommodation')
+
+
+class DistinctiveWordTests(TestCase):
+    def setUp(self):
+        ingestion.upsert_counts(date(2023, 6, 8), {'inflation': 20, 'growth': 4, 'liquidity': 1})
+        ingestion.upsert_counts(date(2024, 2, 8), {'inflation': 5, 'growth': 15, 'repo': 9})
+        distinctiveness.refresh()
+
+    def test_ranks_have_no_gaps(self):
+        for scope, year in DistinctiveWord.objects.values_list('scope', 'year').distinct():
+            ranks = DistinctiveWord.objects.filter(scope=scope, year=year).values_list('rank', flat=True)
+            self.assertEqual(sorted(ranks), list(range(1, len(ranks) + 1)))
+
+    def test_refresh_replaces_only_the_given_years(self):
+        untouched = set(DistinctiveWord.objects.filter(year=2023).values_list('id', flat=True))
+        ingestion.upsert_counts(date(2024, 2, 8), {'inflation': 5, 'growth': 15, 'tightening': 30})
+
+        distinctiveness.refresh(years={2024})
+
+        self.assertEqual(set(DistinctiveWord.objects.filter(year=2023).values_list('id', flat=True)), untouched)
+        self.assertEqual(
+            DistinctiveWord.objects.get(scope=DistinctiveWord.MEETING, year=2024, rank=1).word.term, 'tightening'
+        )
+        self.assertFalse(DistinctiveWord.objects.filter(word__term='repo').exists())
+
+
+class WordCloudTests(TestCase):
+    def setUp(self):
+        ingestion.upsert_counts(date(2024, 2, 8), {'inflation': 12, 'growth': 5})
+
+    def test_valid_requests_are_tagged(self):
+        response = self.client.get('/api/minutesAnalysis/wordcloud/2024/', {'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['words'], [{'word': 'inflation', 'frequency': 12}])
+
+        cached = self.client.get(
+            '/api/minutesAnalysis/wordcloud/2024/', {'limit': 1}, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    def test_errors_carry_no_etag(self):
+        response = self.client.get('/api/minutesAnalysis/wordcloud/2024/', {'limit': 'x'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_server_errors_carry_no_etag(self):
+        with mock.patch('minutesAnalysis.views.get_matrix', side_effect=RuntimeError('snapshot unreadable')):
+            response = self.client.get('/api/minutesAnalysis/wordcloud/2024/')
+
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_layout_errors_are_json_even_for_svg(self):
+        response = self.client.get('/api/minutesAnalysis/wordcloud/2024/layout/', {'width': 5, 'format': 'svg'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json(), {'error': 'width must be an integer >= 100'})
@@ -0,0 +1,189 @@
+"""
+Tokenizing and counting of minutes documents, kept free of Django so the
+process pool workers of ingestion.count_documents can import it under any
+multiprocessing start method without setting up the ORM.
+"""
+import hashlib
+import re
+import unicodedata
+from collections import Counter, deque
+from datetime import date
+from pathlib import Path
+
+TEXT_SUFFIXES = {'.txt', '.text', '.md'}
+PDF_SUFFIXES = {'.pdf'}
+SUPPORTED_SUFFIXES = TEXT_SUFFIXES | PDF_SUFFIXES
+
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 100  # Vocabulary.term max_length, phrases included
+HASH_BLOCK_SIZE = 1 << 20
+
+MAX_NGRAM = 3
+MIN_PHRASE_COUNT = 2  # phrases seen once in a meeting are dropped
+MAX_TRACKED_PHRASES = 200000  # prune rare phrases beyond this many per document
+
+TOKEN_RE = re.compile(r"[a-z]+(?:['\-][a-z]+)*")
+# Tokens plus the punctuation that ends a phrase window
+PHRASE_TOKEN_RE = re.compile(r"[a-z]+(?:['\-][a-z]+)*|[.;:!?()]")
+HYPHENATED_BREAK_RE = re.compile(r'(?<=[A-Za-z])-[ \t]*\r?\n[ \t]*(?=[A-Za-z])')
+DATE_RE = re.compile(r'(?P<year>(?:19|20)\d{2})[-_.]?(?P<month>\d{2})[-_.]?(?P<day>\d{2})')
+
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had has
+have having he her here hers herself him himself his how i if in into is it its itself just may me
+might more most must my myself no nor not now of off on once only or other our ours ourselves out
+over own per same shall she should so some such than that the their theirs them themselves then there
+these they this those through to too under until up upon very was we were what when where which while
+who whom why will with within would you your yours yourself yourselves
+""".split())
+
+
+def content_hash(path):
+    """SHA-256 of a file, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def meeting_date_from_path(path):
+    """Parse the meeting date from a file name such as 'minutes_2023-02-08.pdf'"""
+    match = DATE_RE.search(Path(path).stem)
+    if not match:
+        return None
+    try:
+        return date(int(match['year']), int(match['month']), int(match['day']))
+    except ValueError:
+        return None
+
+
+def iter_document_files(paths):
+    """Yield supported files from a list of files and directories (recursive)"""
+    for path in map(Path, paths):
+        if path.is_dir():
+            for child in sorted(path.rglob('*')):
+                if child.is_file() and child.suffix.lower() in SUPPORTED_SUFFIXES:
+                    yield child
+        elif path.suffix.lower() in SUPPORTED_SUFFIXES:
+            yield path
+
+
+def iter_text_chunks(path):
+    """Stream the text of a document: lines for text files, pages for PDFs"""
+    path = Path(path)
+    if path.suffix.lower() in PDF_SUFFIXES:
+        try:
+            from pypdf import PdfReader
+        except ImportError as exc:
+            raise RuntimeError('pypdf is required to ingest PDF minutes (pip install pypdf)') from exc
+        for page in PdfReader(path).pages:
+            yield page.extract_text() or ''
+    else:
+        with open(path, encoding='utf-8', errors='replace') as handle:
+            yield from handle
+
+
+def normalize(text):
+    """Fold case and compatibility characters (ligatures, curly quotes) from PDF extraction"""
+    text = unicodedata.normalize('NFKC', text).lower()
+    return text.replace('’', "'").replace('‐', '-').replace('–', '-')
+
+
+def iter_tokens(chunks, boundaries=False):
+    """
+    Yield normalized tokens; words hyphenated across a line break are re-joined.
+    With `boundaries`, None is yielded at sentence and clause punctuation
+    """
+    pattern = PHRASE_TOKEN_RE if boundaries else TOKEN_RE
+    carry = ''
+    for chunk in chunks:
+        text = normalize(chunk)
+        if carry:
+            text = carry + text.lstrip()
+            carry = ''
+        stripped = text.rstrip()
+        if stripped.endswith('-'):
+            # keep the broken word for the next chunk
+            cut = max(stripped.rfind(' '), stripped.rfind('\n')) + 1
+            carry = stripped[cut:-1]
+            text = stripped[:cut]
+        for match in pattern.finditer(text):
+            token = match.group()
+            if len(token) == 1 and not token.isalpha():
+                yield None
+                continue
+            if token.endswith("'s"):
+                token = token[:-2]
+            yield token
+    if carry:
+        yield from TOKEN_RE.findall(carry)
+
+
+def is_countable(token):
+    return MIN_WORD_LENGTH <= len(token) <= MAX_WORD_LENGTH and token not in STOP_WORDS
+
+
+def ngram_size(term):
+    return term.count(' ') + 1
+
+
+def count_words(tokens, max_n=1):
+    """
+    Count countable words and, for max_n > 1, phrases of 2..max_n words.
+    A phrase must start and end with a countable word (stop words may sit in
+    the middle, as in "withdrawal of accommodation") and never spans a None
+    boundary. Phrase counts are pruned whenever more than MAX_TRACKED_PHRASES
+    are held, so memory stays bounded on very large documents.
+    """
+    counts = Counter()
+    phrases = Counter()
+    window = deque(maxlen=max_n)
+    floor = 0
+    for token in tokens:
+        if token is None:
+            window.clear()
+            continue
+        window.append(token)
+        if not is_countable(token):
+            continue
+        counts[token] += 1
+        for n in range(2, len(window) + 1):
+            if is_countable(window[-n]):
+                phrase = ' '.join(window[i] for i in range(len(window) - n, len(window)))
+                if len(phrase) <= MAX_WORD_LENGTH:
+                    phrases[phrase] += 1
+        if len(phrases) > MAX_TRACKED_PHRASES:
+            # Lossy counting: drop the rarest phrases, raising the floor each round
+            floor += 1
+            phrases = Counter({phrase: count for phrase, count in phrases.items() if count > floor})
+
+    counts.update({phrase: count for phrase, count in phrases.items() if count >= MIN_PHRASE_COUNT})
+    return counts
+
+
+def word_total(counts):
+    """Number of single words in a count, leaving phrases out"""
+    return sum(count for term, count in counts.items() if ' ' not in term)
+
+
+def count_document(path, max_n=MAX_NGRAM):
+    return count_words(iter_tokens(iter_text_chunks(path), boundaries=max_n > 1), max_n=max_n)
+
+
+def document_text(chunks):
+    """
+    Text of a document as kept in the minutes text store: compatibility
+    characters folded like normalize() (case is kept) and words hyphenated
+    across a line break re-joined
+    """
+    text = ''.join(chunk if chunk.endswith('\n') else chunk + '\n' for chunk in chunks)
+    text = unicodedata.normalize('NFKC', text).replace('’', "'").replace('‐', '-').replace('–', '-')
+    return HYPHENATED_BREAK_RE.sub('', text)
+
+
+def read_document(path, max_n=MAX_NGRAM):
+    """(counts, stored text) of a document from a single extraction"""
+    chunks = list(iter_text_chunks(path))
+    return count_words(iter_tokens(chunks, boundaries=max_n > 1), max_n=max_n), document_text(chunks)
@@ -3,8 +3,15 @@ from .views import (
     WordFrequencyListAPIView,
     available_years,
     yearly_word_cloud,
+    yearly_word_cloud_layout,
     monthly_frequency_trends,
-    word_statistics
+    word_statistics,
+    word_series,
+    yearly_distinctive_words,
+    meeting_distinctive_words,
+    compare_ranges,
+    word_anomalies,
+    keyword_in_context
 )
 
 urlpatterns = [
@@ -16,10 +23,27 @@ urlpatterns = [
     
     # Get word cloud data for specific year
     path('wordcloud/<int:year>/', yearly_word_cloud, name='yearly-word-cloud'),
+    path('wordcloud/<int:year>/layout/', yearly_word_cloud_layout, name='yearly-word-cloud-layout'),
     
     # Get monthly frequency trends for specific year
     path('trends/<int:year>/', monthly_frequency_trends, name='monthly-frequency-trends'),
     
     # Get general statistics
     path('statistics/', word_statistics, name='word-statistics'),
-]
\ No newline at end of file
+    
+    # Get per-word time series across all years
+    path('series/', word_series, name='word-series'),
+    
+    # Get distinctive words for a year or a single meeting
+    path('distinctive/<int:year>/', yearly_distinctive_words, name='yearly-distinctive-words'),
+    path('distinctive/meetings/<str:meeting_date>/', meeting_distinctive_words, name='meeting-distinctive-words'),
+    
+    # Compare word shares between two arbitrary date windows
+    path('compare/', compare_ranges, name='compare-ranges'),
+    
+    # Get meetings where a word spiked against its recent history
+    path('anomalies/', word_anomalies, name='word-anomalies'),
+    
+    # Keyword-in-context search over the stored minutes text
+    path('kwic/', keyword_in_context, name='keyword-in-context'),
+]
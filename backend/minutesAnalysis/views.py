@@ -1,19 +1,65 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from django.core.cache import cache
 from django.db.models import Sum, Count
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
 from collections import defaultdict
+from functools import wraps
 import calendar
-from .models import WordFrequency
-from .serializers import WordFrequencySerializer, YearlyWordCloudSerializer, MonthlyFrequencySerializer
+import json
+from datetime import date
+import numpy as np
+from .models import DataVersion, DistinctiveWord, WordAnomaly, WordFrequency, WordMonthlyTotal, WordYearlyTotal
+from . import concordance, layout, sketches
+from .matrix import get_matrix
+from .pagination import WordFrequencyCursorPagination
+from .renderers import NDJSONRenderer, WordCloudSVGRenderer
+from .serializers import WordFrequencySerializer, MonthlyFrequencySerializer
+from .tokenizing import MAX_NGRAM
+
+STREAM_CHUNK_SIZE = 2000
+TRUE_VALUES = ('1', 'true', 'yes')
 
 class WordFrequencyListAPIView(generics.ListAPIView):
     """
-    GET /api/minutesAnalysis/words/
-    Returns all word frequency data
+    GET /api/minutesAnalysis/words/?cursor=...&page_size=500
+    Returns word frequency data, newest first, one keyset page at a time.
+
+    GET /api/minutesAnalysis/words/?format=ndjson
+    Streams every row as newline-delimited JSON with constant memory.
     """
-    queryset = WordFrequency.objects.all()
+    queryset = WordFrequency.objects.select_related('word')
     serializer_class = WordFrequencySerializer
+    pagination_class = WordFrequencyCursorPagination
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
+
+    def list(self, request, *args, **kwargs):
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return self.stream_ndjson()
+        return super().list(request, *args, **kwargs)
+
+    def stream_ndjson(self):
+        rows = WordFrequency.objects.order_by('-date', '-frequency', '-id').values_list(
+            'id', 'date', 'word__term', 'frequency'
+        )
+
+        def lines():
+            for pk, meeting_date, word, frequency in rows.iterator(chunk_size=STREAM_CHUNK_SIZE):
+                yield json.dumps({
+                    'id': pk,
+                    'date': meeting_date.isoformat(),
+                    'word': word,
+                    'frequency': frequency,
+                    'year': meeting_date.year,
+                    'month': meeting_date.month,
+                    'month_name': calendar.month_name[meeting_date.month]
+                }) + '\n'
+
+        return StreamingHttpResponse(lines(), content_type=NDJSONRenderer.media_type)
 
 @api_view(['GET'])
 def available_years(request):
@@ -21,39 +67,118 @@ def available_years(request):
     GET /api/minutesAnalysis/years/
     Returns list of available years
     """
-    years = WordFrequency.objects.values_list('date__year', flat=True).distinct().order_by('-date__year')
+    years = WordYearlyTotal.objects.values_list('year', flat=True).distinct().order_by('-year')
     return Response(list(years))
 
+def _int_param(request, name, default, minimum=1):
+    """Read an integer query parameter, raising ValueError when it is invalid"""
+    raw = request.GET.get(name)
+    if raw in (None, ''):
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = None
+    if value is None or value < minimum:
+        raise ValueError(f'{name} must be an integer >= {minimum}')
+    return value
+
+def _ngram_param(request):
+    """?n= term length: 1 for single words, 2..MAX_NGRAM for phrases"""
+    n = _int_param(request, 'n', 1)
+    if n > MAX_NGRAM:
+        raise ValueError(f'n must be between 1 and {MAX_NGRAM}')
+    return n
+
+def _word_cloud_etag(request, year):
+    """
+    ETag from the year's data version and the query parameters; None for
+    invalid parameters, so the 400 response is neither tagged nor answered with 304
+    """
+    try:
+        params = (
+            _int_param(request, 'limit', None),
+            _int_param(request, 'min_frequency', None),
+            _ngram_param(request)
+        )
+    except ValueError:
+        return None
+    return '{}-v{}-{}-{}-{}'.format(year, DataVersion.current(year), *('' if p is None else p for p in params))
+
+def _etag_when_ok(etag_func):
+    """
+    Like @condition(etag_func=...), but only 200 responses are tagged, so
+    errors can never be revalidated into a 304
+    """
+    def decorator(view):
+        @wraps(view)
+        def inner(request, *args, **kwargs):
+            etag = etag_func(request, *args, **kwargs) if request.method in ('GET', 'HEAD') else None
+            if etag is not None:
+                etag = quote_etag(etag)
+                response = get_conditional_response(request, etag=etag)
+                if response is not None:
+                    return response
+            response = view(request, *args, **kwargs)
+            if etag is not None and response.status_code == 200:
+                response.headers.setdefault('ETag', etag)
+            return response
+        return inner
+    return decorator
+
+def _json_error(request, message, code):
+    """Error response rendered as JSON whatever ?format= asked for (an SVG has no room for it)"""
+    request.accepted_renderer = JSONRenderer()
+    request.accepted_media_type = JSONRenderer.media_type
+    return Response({'error': message}, status=code)
+
+@_etag_when_ok(_word_cloud_etag)
 @api_view(['GET'])
 def yearly_word_cloud(request, year):
     """
-    GET /api/minutesAnalysis/wordcloud/{year}/
-    Returns word frequency data for a specific year for word cloud generation
+    GET /api/minutesAnalysis/wordcloud/{year}/?limit=100&min_frequency=5&n=1
+    Returns word frequency data for a specific year for word cloud generation.
+    ?limit keeps only the N most frequent words and ?min_frequency drops
+    words below a yearly total; single words are ranked off the matrix
+    snapshot, phrases (or requests made before the snapshot is built) in
+    SQL. ?n=2 or ?n=3 returns
+    phrases of that many words instead of single words. Responses carry an
+    ETag tied to the year's data version, so unchanged clouds return 304.
     """
     try:
-        # Get all words for the specified year, summed by frequency
-        word_data = WordFrequency.objects.filter(
-            date__year=year
-        ).values('word').annotate(
-            total_frequency=Sum('frequency')
-        ).order_by('-total_frequency')
+        limit = _int_param(request, 'limit', None)
+        min_frequency = _int_param(request, 'min_frequency', None)
+        n = _ngram_param(request)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        matrix = get_matrix() if n == 1 else None
+        if matrix is not None:
+            word_data = matrix.ranked_words(year, limit=limit, minimum=min_frequency or 1)
+        else:
+            # Top-K straight off the (year, -frequency) index of the yearly rollup
+            word_data = WordYearlyTotal.objects.filter(year=year, word__ngram_size=n)
+            if min_frequency is not None:
+                word_data = word_data.filter(frequency__gte=min_frequency)
+            word_data = word_data.order_by('-frequency').values_list('word__term', 'frequency')
+            if limit is not None:
+                word_data = word_data[:limit]
         
-        # Format data for word cloud
+        # Read-only payload of plain values: built directly instead of
+        # running every item through serializer fields
         words = [
             {
-                'word': item['word'],
-                'frequency': item['total_frequency']
+                'word': word,
+                'frequency': frequency
             }
-            for item in word_data
+            for word, frequency in word_data
         ]
         
-        response_data = {
+        return Response({
             'year': year,
             'words': words
-        }
-        
-        serializer = YearlyWordCloudSerializer(response_data)
-        return Response(serializer.data)
+        })
         
     except Exception as e:
         return Response(
@@ -61,87 +186,552 @@ def yearly_word_cloud(request, year):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+LAYOUT_CACHE_TIMEOUT = 60 * 60 * 24
+
+@api_view(['GET'])
+@renderer_classes([*api_settings.DEFAULT_RENDERER_CLASSES, WordCloudSVGRenderer])
+def yearly_word_cloud_layout(request, year):
+    """
+    GET /api/minutesAnalysis/wordcloud/{year}/layout/?width=800&height=600&limit=150&n=1&format=svg
+    Returns a ready-to-draw word cloud for a year: font size, rotation and
+    centre position of every placed word, as JSON or (?format=svg) as an SVG
+    image. Layouts are cached per year, canvas size and data version.
+    """
+    try:
+        width = _int_param(request, 'width', 800, minimum=100)
+        height = _int_param(request, 'height', 600, minimum=100)
+        limit = _int_param(request, 'limit', 150)
+        n = _ngram_param(request)
+        if width > 4000 or height > 4000 or limit > 1000:
+            raise ValueError('width and height must be at most 4000 and limit at most 1000')
+    except ValueError as e:
+        return _json_error(request, str(e), status.HTTP_400_BAD_REQUEST)
+
+    try:
+        key = f'minutes-cloud-layout:{year}:{width}x{height}:{limit}:{n}:v{DataVersion.current(year)}'
+        cloud = cache.get(key)
+        if cloud is None:
+            words = list(
+                WordYearlyTotal.objects.filter(year=year, word__ngram_size=n)
+                .order_by('-frequency')
+                .values_list('word__term', 'frequency')[:limit]
+            )
+            cloud = {
+                'year': year,
+                'width': width,
+                'height': height,
+                'words': layout.layout(words, width, height)
+            }
+            cache.set(key, cloud, LAYOUT_CACHE_TIMEOUT)
+        return Response(cloud)
+
+    except Exception as e:
+        return _json_error(
+            request, f'Failed to lay out word cloud: {str(e)}', status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+def _parse_word_list(raw):
+    """Split a comma separated ?words= value into a clean, de-duplicated list"""
+    words = []
+    for word in raw.split(','):
+        word = word.strip().lower()
+        if word and word not in words:
+            words.append(word)
+    return words
+
+def _monthly_word_matrix(year, words):
+    """
+    Read every (month, word) total of a year from the monthly rollup in a
+    single query and return them as {word: [jan, feb, ..., dec]}.
+    """
+    series = {word: [0] * 12 for word in words}
+    rows = WordMonthlyTotal.objects.filter(
+        year=year,
+        word__term__in=words
+    ).values_list('word__term', 'month', 'frequency').order_by()
+
+    for word, month, frequency in rows:
+        series[word][month - 1] = frequency
+    return series
+
 @api_view(['GET'])
 def monthly_frequency_trends(request, year):
     """
-    GET /api/minutesAnalysis/trends/{year}/
-    Returns monthly word frequency trends for a specific year
+    GET /api/minutesAnalysis/trends/{year}/?top=10&words=inflation,liquidity&n=1
+    Returns monthly word frequency trends for a specific year.
+    By default the top 10 words of the year are used; ?top=N changes that
+    number, ?n=2 or ?n=3 ranks phrases instead of single words and
+    ?words=a,b,c picks the words (or phrases) explicitly.
     """
+    words_param = request.query_params.get('words')
     try:
-        # Get top words for the year (limit to top 10 for readability)
-        top_words = WordFrequency.objects.filter(
-            date__year=year
-        ).values('word').annotate(
-            total_frequency=Sum('frequency')
-        ).order_by('-total_frequency')[:10]
-        
-        top_word_list = [item['word'] for item in top_words]
-        
-        # Get monthly data for these top words
-        monthly_data = []
-        
-        for month in range(1, 13):
-            month_name = calendar.month_name[month]
-            month_words = {}
-            
-            # Get frequency for each top word in this month
-            for word in top_word_list:
-                frequency = WordFrequency.objects.filter(
-                    date__year=year,
-                    date__month=month,
-                    word=word
-                ).aggregate(total=Sum('frequency'))['total'] or 0
-                
-                month_words[word] = frequency
-            
-            monthly_data.append({
+        top = _int_param(request, 'top', 10)
+        n = _ngram_param(request)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        # The matrix holds single words; phrases, and requests made before
+        # the snapshot of the current data is built, read the rollups
+        matrix = get_matrix() if n == 1 else None
+        if words_param:
+            top_word_list = _parse_word_list(words_param)
+        elif matrix is not None:
+            top_word_list = [word for word, _ in matrix.ranked_words(year, limit=top)]
+        else:
+            top_word_list = list(WordYearlyTotal.objects.filter(
+                year=year, word__ngram_size=n
+            ).order_by('-frequency').values_list('word__term', flat=True)[:top])
+
+        if matrix is not None:
+            # Every month x word total in one vectorized pass
+            series = matrix.monthly(year, top_word_list)
+        else:
+            series = _monthly_word_matrix(year, top_word_list)
+
+        monthly_data = [
+            {
                 'month': month,
-                'month_name': month_name,
-                'words': month_words
-            })
-        
+                'month_name': calendar.month_name[month],
+                'words': {word: series[word][month - 1] for word in top_word_list}
+            }
+            for month in range(1, 13)
+        ]
+
         response_data = {
             'year': year,
+            'words': top_word_list,
+            'months': list(range(1, 13)),
+            'series': series,
             'monthly_data': monthly_data
         }
-        
+
         serializer = MonthlyFrequencySerializer(response_data)
         return Response(serializer.data)
-        
+
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch monthly trends: {str(e)}'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+def _exact_statistics():
+    """Single-word statistics from the rollups, when there is no matrix snapshot"""
+    words = WordYearlyTotal.objects.filter(word__ngram_size=1)
+    most_frequent = words.values('word__term').annotate(
+        total_frequency=Sum('frequency')
+    ).order_by('-total_frequency').first()
+    return {
+        'total_entries': words.aggregate(total=Sum('entries'))['total'] or 0,
+        'unique_words': words.values('word').distinct().count(),
+        'years_covered': WordYearlyTotal.objects.values_list('year', flat=True).distinct().count(),
+        'most_frequent_word': most_frequent['word__term'] if most_frequent else None,
+        'highest_frequency': most_frequent['total_frequency'] if most_frequent else 0
+    }
+
 @api_view(['GET'])
 def word_statistics(request):
     """
-    GET /api/minutesAnalysis/statistics/
-    Returns general statistics about the word frequency data
+    GET /api/minutesAnalysis/statistics/?exact=1
+    Returns general statistics about the word frequency data. By default
+    they are read from the persisted HyperLogLog / Space-Saving sketches
+    (one row, approximate); ?exact=1, or a sketch that is missing or behind
+    the current data version, computes them from the full data.
     """
+    exact = request.query_params.get('exact', '').lower() in TRUE_VALUES
     try:
-        total_words = WordFrequency.objects.count()
-        unique_words = WordFrequency.objects.values('word').distinct().count()
-        years_covered = WordFrequency.objects.values_list('date__year', flat=True).distinct().count()
-        
-        # Get most frequent word overall
-        most_frequent = WordFrequency.objects.values('word').annotate(
-            total_frequency=Sum('frequency')
-        ).order_by('-total_frequency').first()
-        
-        stats = {
-            'total_entries': total_words,
-            'unique_words': unique_words,
-            'years_covered': years_covered,
-            'most_frequent_word': most_frequent['word'] if most_frequent else None,
-            'highest_frequency': most_frequent['total_frequency'] if most_frequent else 0
-        }
-        
+        stats = None if exact else sketches.statistics()
+        approximate = stats is not None
+        if stats is None:
+            matrix = get_matrix()
+            stats = matrix.statistics() if matrix is not None else _exact_statistics()
+        stats['approximate'] = approximate
         return Response(stats)
         
     except Exception as e:
         return Response(
             {'error': f'Failed to fetch statistics: {str(e)}'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+GRANULARITIES = ('month', 'quarter', 'year')
+
+def _period_key(year, month, granularity):
+    """Sortable period key and its label for a calendar month"""
+    if granularity == 'year':
+        return (year, 0), str(year)
+    if granularity == 'quarter':
+        quarter = (month - 1) // 3 + 1
+        return (year, quarter), f'{year}-Q{quarter}'
+    return (year, month), f'{year}-{month:02d}'
+
+def _period_range(first, last, granularity):
+    """Every (key, label) from the first to the last (year, month), gaps included"""
+    periods = {}
+    year, month = first
+    while (year, month) <= last:
+        key, label = _period_key(year, month, granularity)
+        periods.setdefault(key, label)
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return periods
+
+@api_view(['GET'])
+def word_series(request):
+    """
+    GET /api/minutesAnalysis/series/?words=inflation,liquidity&granularity=month&normalize=1&n=1
+    Returns aligned, zero-filled frequency series for several words across the
+    whole minutes history, bucketed by month, quarter or year. With ?normalize=1
+    each value is divided by the total count of n-word terms (single words by
+    default, ?n=2 for phrases such as "repo rate") in its period. Single
+    words are read off the matrix snapshot once it is built.
+    """
+    words = _parse_word_list(request.query_params.get('words', ''))
+    granularity = request.query_params.get('granularity', 'month')
+    normalize = request.query_params.get('normalize', '').lower() in TRUE_VALUES
+
+    try:
+        n = _ngram_param(request)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    if not words:
+        return Response(
+            {'error': 'words parameter is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if granularity not in GRANULARITIES:
+        return Response(
+            {'error': f'granularity must be one of: {", ".join(GRANULARITIES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        # Total words per month: the period axis and the normalization base.
+        # Single words are summed off the matrix snapshot when it is built
+        matrix = get_matrix() if n == 1 else None
+        if matrix is not None:
+            monthly_totals = matrix.month_totals()
+        else:
+            monthly_totals = {
+                (year, month): total
+                for year, month, total in WordMonthlyTotal.objects.filter(word__ngram_size=n).order_by().values_list(
+                    'year', 'month'
+                ).annotate(total=Sum('frequency'))
+            }
+        totals = {}
+        months = []
+        for (year, month), total in monthly_totals.items():
+            key, _ = _period_key(year, month, granularity)
+            totals[key] = totals.get(key, 0) + total
+            months.append((year, month))
+
+        if not months:
+            return Response({
+                'granularity': granularity,
+                'normalized': normalize,
+                'n': n,
+                'periods': [],
+                'totals': [],
+                'series': {word: [] for word in words}
+            })
+
+        periods = _period_range(min(months), max(months), granularity)
+        keys = sorted(periods)
+        position = {key: index for index, key in enumerate(keys)}
+        counts = {word: [0] * len(keys) for word in words}
+
+        if matrix is not None:
+            rows = (
+                (word, year, month, frequency)
+                for year in sorted({year for year, _ in months})
+                for word, values in matrix.monthly(year, words).items()
+                for month, frequency in enumerate(values, start=1)
+                if frequency
+            )
+        else:
+            # One query for all requested words, read off the monthly rollup;
+            # words of another length than n are not on this axis
+            rows = WordMonthlyTotal.objects.filter(word__term__in=words, word__ngram_size=n).values_list(
+                'word__term', 'year', 'month', 'frequency'
+            )
+        for word, year, month, frequency in rows:
+            key, _ = _period_key(year, month, granularity)
+            if key in position:
+                counts[word][position[key]] += frequency
+
+        if normalize:
+            series = {
+                word: [
+                    values[index] / totals[key] if totals.get(key) else 0.0
+                    for index, key in enumerate(keys)
+                ]
+                for word, values in counts.items()
+            }
+        else:
+            series = counts
+
+        return Response({
+            'granularity': granularity,
+            'normalized': normalize,
+            'n': n,
+            'periods': [periods[key] for key in keys],
+            'totals': [totals.get(key, 0) for key in keys],
+            'series': series
+        })
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch word series: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+def _distinctive_words(scores, limit):
+    return [
+        {
+            'word': word,
+            'score': score,
+            'frequency': frequency,
+            'rank': rank
+        }
+        for word, score, frequency, rank in scores.order_by('rank').values_list(
+            'word__term', 'score', 'frequency', 'rank'
+        )[:limit]
+    ]
+
+@api_view(['GET'])
+def yearly_distinctive_words(request, year):
+    """
+    GET /api/minutesAnalysis/distinctive/{year}/?limit=50&n=1
+    Returns the words (or ?n=2/3 phrases) most characteristic of a year compared
+    with the whole corpus (log-odds z-score), as precomputed by compute_distinctive_words
+    """
+    try:
+        limit = _int_param(request, 'limit', 50)
+        n = _ngram_param(request)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        scores = DistinctiveWord.objects.filter(scope=DistinctiveWord.YEAR, year=year, word__ngram_size=n)
+        return Response({
+            'year': year,
+            'words': _distinctive_words(scores, limit)
+        })
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch distinctive words: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['GET'])
+def meeting_distinctive_words(request, meeting_date):
+    """
+    GET /api/minutesAnalysis/distinctive/meetings/{YYYY-MM-DD}/?limit=50&n=1
+    Returns the words (or ?n=2/3 phrases) most characteristic of one meeting compared
+    with the whole corpus (log-odds z-score), as precomputed by compute_distinctive_words
+    """
+    try:
+        limit = _int_param(request, 'limit', 50)
+        n = _ngram_param(request)
+        meeting = date.fromisoformat(meeting_date)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        scores = DistinctiveWord.objects.filter(scope=DistinctiveWord.MEETING, date=meeting, word__ngram_size=n)
+        return Response({
+            'date': meeting,
+            'words': _distinctive_words(scores, limit)
+        })
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch distinctive words: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+def _date_param(request, name):
+    """Read a required YYYY-MM-DD query parameter, raising ValueError when it is invalid"""
+    raw = request.query_params.get(name)
+    if not raw:
+        raise ValueError(f'{name} is required (YYYY-MM-DD)')
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be a date in YYYY-MM-DD format')
+
+def _window(start, end, meetings, totals):
+    return {
+        'from': start,
+        'to': end,
+        'meetings': meetings,
+        'total_words': int(totals.sum())
+    }
+
+def _compare_windows(windows, n):
+    """
+    (vocabulary, [(window, totals) per window]) with totals aligned on the
+    vocabulary: from the prefix sums of the matrix for single words, else
+    one grouped query per window over WordFrequency
+    """
+    matrix = get_matrix() if n == 1 else None
+    if matrix is not None:
+        results = []
+        for start, end in windows:
+            totals = matrix.range_totals(start, end)
+            meetings = [meeting.item() for meeting in matrix.dates[matrix.date_rows(start, end)]]
+            results.append((_window(start, end, meetings, totals), totals))
+        return matrix.vocabulary, results
+
+    counts = []
+    for start, end in windows:
+        rows = WordFrequency.objects.filter(date__range=(start, end), word__ngram_size=n)
+        counts.append((
+            start, end,
+            sorted(rows.order_by().values_list('date', flat=True).distinct()),
+            dict(rows.order_by().values_list('word__term').annotate(total=Sum('frequency')))
+        ))
+    vocabulary = sorted(set().union(*(window_counts for _, _, _, window_counts in counts)))
+    results = []
+    for start, end, meetings, window_counts in counts:
+        totals = np.array([window_counts.get(word, 0) for word in vocabulary], dtype=np.int64)
+        results.append((_window(start, end, meetings, totals), totals))
+    return vocabulary, results
+
+@api_view(['GET'])
+def compare_ranges(request):
+    """
+    GET /api/minutesAnalysis/compare/?a_from=2021-10-01&a_to=2022-04-30&b_from=2022-05-01&b_to=2022-12-31&limit=25&n=1
+    Compares two arbitrary date windows (both ends inclusive) and returns the
+    words (or ?n=2/3 phrases) whose share changed most from window A to window B.
+    Single-word window totals come from the prefix-sum index of the frequency matrix.
+    """
+    try:
+        a_from, a_to = _date_param(request, 'a_from'), _date_param(request, 'a_to')
+        b_from, b_to = _date_param(request, 'b_from'), _date_param(request, 'b_to')
+        limit = _int_param(request, 'limit', 25)
+        n = _ngram_param(request)
+        if a_from > a_to or b_from > b_to:
+            raise ValueError('window start must not be after its end')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        vocabulary, ((window_a, totals_a), (window_b, totals_b)) = _compare_windows(
+            [(a_from, a_to), (b_from, b_to)], n
+        )
+
+        share_a = totals_a / window_a['total_words'] if window_a['total_words'] else np.zeros(totals_a.shape)
+        share_b = totals_b / window_b['total_words'] if window_b['total_words'] else np.zeros(totals_b.shape)
+        change = share_b - share_a
+
+        candidates = np.flatnonzero(change)
+        order = candidates[np.argsort(-np.abs(change[candidates]), kind='stable')][:limit]
+        words = [
+            {
+                'word': vocabulary[index],
+                'a_frequency': int(totals_a[index]),
+                'b_frequency': int(totals_b[index]),
+                'a_share': float(share_a[index]),
+                'b_share': float(share_b[index]),
+                'change': float(change[index])
+            }
+            for index in order
+        ]
+
+        return Response({
+            'a': window_a,
+            'b': window_b,
+            'words': words
+        })
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to compare date ranges: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['GET'])
+def word_anomalies(request):
+    """
+    GET /api/minutesAnalysis/anomalies/?since=2022-01-01&until=2022-12-31&words=liquidity&limit=100
+    Returns meetings where a word spiked against the preceding meetings,
+    newest first, as flagged by detect_word_anomalies / ingest_minutes
+    """
+    try:
+        limit = _int_param(request, 'limit', 100)
+        since = _date_param(request, 'since') if request.query_params.get('since') else None
+        until = _date_param(request, 'until') if request.query_params.get('until') else None
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        flagged = WordAnomaly.objects.all()
+        if since:
+            flagged = flagged.filter(date__gte=since)
+        if until:
+            flagged = flagged.filter(date__lte=until)
+        words = _parse_word_list(request.query_params.get('words', ''))
+        if words:
+            flagged = flagged.filter(word__term__in=words)
+
+        anomalies = [
+            {
+                'date': meeting_date,
+                'word': word,
+                'frequency': frequency,
+                'baseline': baseline,
+                'score': score
+            }
+            for meeting_date, word, frequency, baseline, score in flagged.order_by('-date', '-score').values_list(
+                'date', 'word__term', 'frequency', 'baseline', 'score'
+            )[:limit]
+        ]
+
+        return Response({
+            'count': len(anomalies),
+            'anomalies': anomalies
+        })
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch word anomalies: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['GET'])
+def keyword_in_context(request):
+    """
+    GET /api/minutesAnalysis/kwic/?q=repo rate&window=8&limit=50
+    Returns every occurrence of a word or phrase in the stored minutes text
+    with `window` words of context on either side, newest meeting first.
+    Matches are found in the positional index, not by scanning documents.
+    """
+    query = request.query_params.get('q', '').strip()
+    try:
+        window = _int_param(request, 'window', 8)
+        limit = _int_param(request, 'limit', 50)
+        if not query:
+            raise ValueError('q parameter is required')
+        if window > 50 or limit > 500:
+            raise ValueError('window must be at most 50 and limit at most 500')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        total, hits = concordance.search(query, window=window, limit=limit)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to search minutes text: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    return Response({
+        'query': query,
+        'total': total,
+        'hits': hits
+    })
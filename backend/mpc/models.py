@@ -29,11 +29,26 @@ class MPCMember(models.Model):
     name = models.CharField(max_length=100)
     designation = models.CharField(max_length=100)
     joined_date = models.DateField()
+    member = models.ForeignKey(
+        'members.Member',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='roster_entries',
+        help_text="Canonical member, resolved from name on save"
+    )
     # ... maybe profile picture or bio …
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        from members.models import Member
+
+        self.member_id = Member.objects.resolve(self.name)
+        super().save(*args, **kwargs)
+
 class MPCCorrelationGraph(models.Model):
     created_on = models.DateTimeField(auto_now_add=True)
     image = models.ImageField(upload_to='mpc_correlation/')
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('mpcDecision', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DecisionDissent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('decision', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dissents', to='mpcDecision.mpcdecision')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='dissents', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Decision Dissent',
+                'verbose_name_plural': 'Decision Dissents',
+                'unique_together': {('decision', 'member')},
+            },
+        ),
+    ]
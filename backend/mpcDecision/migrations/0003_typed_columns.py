@@ -0,0 +1,108 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:39
+
+import re
+
+from django.db import migrations, models
+
+VOTE_COUNT_RE = re.compile(r'(\d+)\s*[-:]\s*(\d+)')
+MODEL_SCORE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([^\d,;]+)')
+
+
+# Frozen copies of the parsers in mpcDecision.models
+
+def parse_voting_pattern(voting_pattern):
+    match = VOTE_COUNT_RE.search(voting_pattern or '')
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+def score_model(label):
+    label = label.lower()
+    if 'vader' in label:
+        return 'vader'
+    if 'roberta' in label:
+        return 'roberta'
+    if 'bert' in label:
+        return 'finbert'
+    return None
+
+
+def parse_implicit_scores(implicit_dissent_score):
+    scores = {}
+    for value, label in MODEL_SCORE_RE.findall(implicit_dissent_score or ''):
+        model = score_model(label)
+        if model is not None and model not in scores:
+            scores[model] = float(value)
+    return scores
+
+
+def backfill_typed_columns(apps, schema_editor):
+    MPCDecision = apps.get_model('mpcDecision', 'MPCDecision')
+
+    decisions = list(MPCDecision.objects.all())
+    for decision in decisions:
+        decision.votes_for, decision.votes_against = parse_voting_pattern(decision.voting_pattern)
+        scores = parse_implicit_scores(decision.implicit_dissent_score)
+        decision.implicit_dissent_value = next(iter(scores.values()), None)
+        decision.vader_score = scores.get('vader')
+        decision.finbert_score = scores.get('finbert')
+        decision.roberta_score = scores.get('roberta')
+    MPCDecision.objects.bulk_update(decisions, [
+        'votes_for', 'votes_against', 'implicit_dissent_value', 'vader_score', 'finbert_score', 'roberta_score'
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0003_memberprofile'),
+        ('mpcDecision', '0002_decisiondissent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='dissenters',
+            field=models.ManyToManyField(blank=True, related_name='dissented_decisions', through='mpcDecision.DecisionDissent', to='members.member'),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='finbert_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='implicit_dissent_value',
+            field=models.FloatField(blank=True, editable=False, help_text='First score in implicit_dissent_score, used for ordering', null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='roberta_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='vader_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='votes_against',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdecision',
+            name='votes_for',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdecision',
+            index=models.Index(fields=['votes_against', 'date'], name='decision_against_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdecision',
+            index=models.Index(fields=['implicit_dissent_value'], name='decision_implicit_value_idx'),
+        ),
+        migrations.RunPython(backfill_typed_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+import re
+
+from django.db import migrations
+
+# Frozen copies of the score parser in mpcDecision.models
+MODEL_SCORE_RE = re.compile(
+    r'(?:(?<![\d.])(\d+(?:\.\d+)?)\s*(?:to|-|–)\s*)?(?<![\d.])(\d+(?:\.\d+)?)\s*'
+    r'((?:central\s+bank\s+)?(?:vader|roberta|\w*bert))\b',
+    re.IGNORECASE
+)
+
+
+def score_model(label):
+    label = label.lower()
+    if 'vader' in label:
+        return 'vader'
+    if 'roberta' in label:
+        return 'roberta'
+    if 'bert' in label:
+        return 'finbert'
+    return None
+
+
+def parse_implicit_scores(implicit_dissent_score):
+    scores = {}
+    for range_start, value, label in MODEL_SCORE_RE.findall(implicit_dissent_score or ''):
+        model = score_model(label)
+        if not range_start and model is not None and model not in scores:
+            scores[model] = float(value)
+    return scores
+
+
+def reparse_scores(apps, schema_editor):
+    """Re-read the score columns: ranges such as '0 to 1 VADER' used to parse as scores"""
+    MPCDecision = apps.get_model('mpcDecision', 'MPCDecision')
+
+    decisions = list(MPCDecision.objects.all())
+    for decision in decisions:
+        scores = parse_implicit_scores(decision.implicit_dissent_score)
+        decision.implicit_dissent_value = next(iter(scores.values()), None)
+        decision.vader_score = scores.get('vader')
+        decision.finbert_score = scores.get('finbert')
+        decision.roberta_score = scores.get('roberta')
+    MPCDecision.objects.bulk_update(decisions, [
+        'implicit_dissent_value', 'vader_score', 'finbert_score', 'roberta_score'
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcDecision', '0003_typed_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(reparse_scores, migrations.RunPython.noop),
+    ]
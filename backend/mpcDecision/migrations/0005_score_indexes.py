@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0003_memberprofile'),
+        ('mpcDecision', '0004_reparse_implicit_scores'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='mpcdecision',
+            index=models.Index(fields=['vader_score'], name='decision_vader_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdecision',
+            index=models.Index(fields=['finbert_score'], name='decision_finbert_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdecision',
+            index=models.Index(fields=['roberta_score'], name='decision_roberta_score_idx'),
+        ),
+    ]
@@ -1,6 +1,60 @@
 # backend/mpcDecision/models.py
 
-from django.db import models
+import re
+
+from django.db import models, transaction
+
+DISSENT_COUNT_RE = re.compile(r'^\s*\d+\s*:\s*\d+')
+VOTE_COUNT_RE = re.compile(r'(\d+)\s*[-:]\s*(\d+)')
+# A score followed directly by a model name; a leading 'X to' or 'X-' marks a range
+MODEL_SCORE_RE = re.compile(
+    r'(?:(?<![\d.])(\d+(?:\.\d+)?)\s*(?:to|-|–)\s*)?(?<![\d.])(\d+(?:\.\d+)?)\s*'
+    r'((?:central\s+bank\s+)?(?:vader|roberta|\w*bert))\b',
+    re.IGNORECASE
+)
+
+
+def parse_voting_pattern(voting_pattern):
+    """(votes for, votes against) of '5-1 (Majority)' or '5:01 (Majority)', else (None, None)"""
+    match = VOTE_COUNT_RE.search(voting_pattern or '')
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+def score_model(label):
+    """Sentiment model key of a label such as 'VADER', 'finBERT' or 'Central Bank RoBERTA'"""
+    label = label.lower()
+    if 'vader' in label:
+        return 'vader'
+    if 'roberta' in label:
+        return 'roberta'
+    if 'bert' in label:
+        return 'finbert'
+    return None
+
+
+def parse_implicit_scores(implicit_dissent_score):
+    """
+    {model: score} of strings like '0.81 finBERT', in the order they appear.
+    Ranges such as '0 to 1 VADER' are not scores and are skipped
+    """
+    scores = {}
+    for range_start, value, label in MODEL_SCORE_RE.findall(implicit_dissent_score or ''):
+        model = score_model(label)
+        if not range_start and model is not None and model not in scores:
+            scores[model] = float(value)
+    return scores
+
+
+def parse_dissenters(explicit_dissenter):
+    """Names in an explicit_dissenter string: '6:2 A. Name, Other Name' -> ['A. Name', 'Other Name']"""
+    names = DISSENT_COUNT_RE.sub('', explicit_dissenter or '')
+    return [
+        name.strip() for name in names.split(',')
+        if name.strip() and name.strip().upper() not in ('NA', 'N/A', 'NONE')
+    ]
+
 
 class MPCDecision(models.Model):
     # Choices for policy changes
@@ -32,8 +86,74 @@ class MPCDecision(models.Model):
         help_text='Format: "0 to 1 VADER", "0 to 1 finBERT","0 to 1 Centrab Bank RoBERTA", or "6:2 TwoName,AnotherName"'
     )
 
+    # Parsed from the text fields above on save
+    votes_for = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    votes_against = models.PositiveSmallIntegerField(null=True, blank=True, editable=False)
+    implicit_dissent_value = models.FloatField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="First score in implicit_dissent_score, used for ordering"
+    )
+    vader_score = models.FloatField(null=True, blank=True, editable=False)
+    finbert_score = models.FloatField(null=True, blank=True, editable=False)
+    roberta_score = models.FloatField(null=True, blank=True, editable=False)
+    dissenters = models.ManyToManyField(
+        'members.Member',
+        through='DecisionDissent',
+        related_name='dissented_decisions',
+        blank=True
+    )
+
     class Meta:
         ordering = ["-date"]  # Show newest decisions first
+        indexes = [
+            models.Index(fields=["votes_against", "date"], name="decision_against_date_idx"),
+            models.Index(fields=["implicit_dissent_value"], name="decision_implicit_value_idx"),
+            models.Index(fields=["vader_score"], name="decision_vader_score_idx"),
+            models.Index(fields=["finbert_score"], name="decision_finbert_score_idx"),
+            models.Index(fields=["roberta_score"], name="decision_roberta_score_idx"),
+        ]
 
     def __str__(self):
         return f"{self.date} – {self.get_policy_change_display()}"
+
+    def save(self, *args, **kwargs):
+        self.parse_text_fields()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self.sync_dissents()
+
+    def parse_text_fields(self):
+        """Fill the typed vote and score columns from the text fields"""
+        self.votes_for, self.votes_against = parse_voting_pattern(self.voting_pattern)
+        scores = parse_implicit_scores(self.implicit_dissent_score)
+        self.implicit_dissent_value = next(iter(scores.values()), None)
+        self.vader_score = scores.get('vader')
+        self.finbert_score = scores.get('finbert')
+        self.roberta_score = scores.get('roberta')
+
+    def sync_dissents(self):
+        """Replace the DecisionDissent rows with the members named in explicit_dissenter"""
+        from members.models import Member
+
+        member_ids = set(Member.objects.ids_for(parse_dissenters(self.explicit_dissenter)).values())
+        self.dissents.exclude(member_id__in=member_ids).delete()
+        DecisionDissent.objects.bulk_create(
+            [DecisionDissent(decision=self, member_id=member_id) for member_id in member_ids],
+            ignore_conflicts=True
+        )
+
+
+class DecisionDissent(models.Model):
+    """One member's explicit dissent on one decision, derived from explicit_dissenter"""
+    decision = models.ForeignKey(MPCDecision, on_delete=models.CASCADE, related_name='dissents')
+    member = models.ForeignKey('members.Member', on_delete=models.PROTECT, related_name='dissents')
+
+    class Meta:
+        unique_together = ['decision', 'member']
+        verbose_name = "Decision Dissent"
+        verbose_name_plural = "Decision Dissents"
+
+    def __str__(self):
+        return f"{self.member} dissented on {self.decision.date}"
@@ -6,6 +6,7 @@ from .models import MPCDecision
 class MPCDecisionSerializer(serializers.ModelSerializer):
     # We want the string labels for policy_change (e.g. "Rate Hike" instead of "rate_hike")
     policy_change_display = serializers.SerializerMethodField()
+    dissenters = serializers.SerializerMethodField()
 
     class Meta:
         model = MPCDecision
@@ -16,8 +17,19 @@ class MPCDecisionSerializer(serializers.ModelSerializer):
             "policy_change_display",
             "voting_pattern",
             "explicit_dissenter",
+            "dissenters",
             "implicit_dissent_score",
+            "votes_for",
+            "votes_against",
+            "implicit_dissent_value",
+            "vader_score",
+            "finbert_score",
+            "roberta_score",
         ]
 
     def get_policy_change_display(self, obj):
         return obj.get_policy_change_display()
+
+    def get_dissenters(self, obj):
+        # Member ids of the explicit dissenters
+        return [dissent.member_id for dissent in obj.dissents.all()]
@@ -1,3 +1,77 @@
+from datetime import date
+
 from django.test import TestCase
 
-# Create your tests here.
+from members.models import Member
+
+from .models import MPCDecision, parse_implicit_scores
+
+
+class ImplicitScoreTests(TestCase):
+    def test_scores_are_read_next_to_their_model(self):
+        self.assertEqual(
+            parse_implicit_scores('0.81 finBERT, 0.65 VADER; 0.9 Central Bank RoBERTA'),
+            {'finbert': 0.81, 'vader': 0.65, 'roberta': 0.9}
+        )
+        self.assertEqual(parse_implicit_scores('0.75 fibBERT'), {'finbert': 0.75})
+
+    def test_ranges_are_not_scores(self):
+        self.assertEqual(parse_implicit_scores('0 to 1 VADER'), {})
+        self.assertEqual(parse_implicit_scores('0-1 VADER'), {})
+        self.assertEqual(parse_implicit_scores('Scale 0 to 1 VADER: 0.4 VADER'), {'vader': 0.4})
+
+    def test_range_leaves_the_typed_columns_empty(self):
+        decision = MPCDecision.objects.create(
+            date=date(2024, 2, 8),
+            policy_change=MPCDecision.RATE_HOLD,
+            voting_pattern='6-0 (Unanimous)',
+            explicit_dissenter='6:0 NA',
+            implicit_dissent_score='0 to 1 VADER'
+        )
+
+        self.assertIsNone(decision.vader_score)
+        self.assertIsNone(decision.implicit_dissent_value)
+
+
+class DecisionListTests(TestCase):
+    url = '/api/mpc/decisions/'
+
+    def setUp(self):
+        rows = [
+            (date(2022, 6, 8), '5-1 (Majority)', '6:1 Jayanth R. Varma', '0.81 finBERT, 0.2 VADER'),
+            (date(2022, 9, 30), '4-2 (Majority)', '6:2 Jayanth R. Varma, Ashima Goyal', '0.7 VADER'),
+            (date(2023, 2, 8), '6-0 (Unanimous)', '6:0 NA', '0.3 Central Bank RoBERTA, 0.9 VADER'),
+        ]
+        for meeting_date, voting_pattern, dissenter, score in rows:
+            MPCDecision.objects.create(
+                date=meeting_date,
+                policy_change=MPCDecision.RATE_HIKE,
+                voting_pattern=voting_pattern,
+                explicit_dissenter=dissenter,
+                implicit_dissent_score=score
+            )
+
+    def dates(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [row['date'] for row in response.json()]
+
+    def test_dissenter_by_name_and_id(self):
+        self.assertEqual(self.dates(dissenter='Ashima Goyal'), ['2022-09-30'])
+        member_id = Member.objects.find('Jayanth R. Varma')
+        self.assertEqual(self.dates(dissenter=str(member_id)), ['2022-09-30', '2022-06-08'])
+        self.assertEqual(self.dates(dissenter='Nobody Known'), [])
+
+    def test_unanimous_and_votes_against(self):
+        self.assertEqual(self.dates(unanimous='true'), ['2023-02-08'])
+        self.assertEqual(self.dates(unanimous='false'), ['2022-09-30', '2022-06-08'])
+        self.assertEqual(self.dates(min_votes_against=2), ['2022-09-30'])
+        self.assertEqual(self.client.get(self.url, {'min_votes_against': 'x'}).status_code, 400)
+
+    def test_score_range_uses_the_chosen_model(self):
+        # The first score of 2022-06-08 is finBERT 0.81, its VADER score is 0.2
+        self.assertEqual(self.dates(score_model='vader', min_score=0.5), ['2023-02-08', '2022-09-30'])
+        self.assertEqual(self.dates(score_model='vader', max_score=0.5), ['2022-06-08'])
+        self.assertEqual(self.dates(score_model='roberta', max_score=0.5), ['2023-02-08'])
+        self.assertEqual(self.dates(min_score=0.75), ['2022-06-08'])
+        self.assertEqual(self.client.get(self.url, {'score_model': 'bert'}).status_code, 400)
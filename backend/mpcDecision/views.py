@@ -1,27 +1,110 @@
 # backend/mpcDecision/views.py
 
 from rest_framework import generics, filters
+from rest_framework.exceptions import ValidationError
+from members.models import Member
 from .models import MPCDecision
 from .serializers import MPCDecisionSerializer
 
+TRUE_VALUES = {'1', 'true', 'yes'}
+SCORE_MODELS = {'vader': 'vader_score', 'finbert': 'finbert_score', 'roberta': 'roberta_score'}
+
+
+class DecisionOrderingFilter(filters.OrderingFilter):
+    """Orders the free-text columns by their parsed values"""
+    parsed_fields = {
+        "implicit_dissent_score": "implicit_dissent_value",
+        "voting_pattern": "votes_for",
+    }
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        return [
+            ("-" if field.startswith("-") else "") + self.parsed_fields.get(field.lstrip("-"), field.lstrip("-"))
+            for field in ordering
+        ]
+
+
+def _float_param(request, name):
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValidationError({name: 'Must be a number.'})
+
+
 class MPCDecisionListAPIView(generics.ListAPIView):
     """
     GET /api/mpcDecision/decisions/
     Returns a list of all MPCDecision records, ordered by date descending.
     Supports:
       - search on 'date' or 'policy_change'
-      - ordering on any field
+      - ordering on any field (implicit_dissent_score and voting_pattern
+        order numerically by their parsed values)
+      - ?dissenter=<member id or name>: meetings where that member dissented
+      - ?unanimous=true|false, ?min_votes_against=N
+      - ?score_model=vader|finbert|roberta: decisions scored by that model
+      - ?min_score=, ?max_score=: range of the implicit dissent score, or
+        of the ?score_model score when one is given
     """
-    queryset = MPCDecision.objects.all()
     serializer_class = MPCDecisionSerializer
 
     # Enable filtering by search and ordering
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.SearchFilter, DecisionOrderingFilter]
     search_fields = ["date", "policy_change"]  # user can search by date or policy_change
     ordering_fields = [
         "date",
         "policy_change",
         "voting_pattern",
         "implicit_dissent_score",
+        "votes_for",
+        "votes_against",
     ]
     ordering = ["-date"]  # default ordering if none specified
+
+    def get_queryset(self):
+        params = self.request.query_params
+        queryset = MPCDecision.objects.prefetch_related("dissents")
+
+        dissenter = params.get("dissenter")
+        if dissenter:
+            member_id = int(dissenter) if dissenter.isdigit() else Member.objects.find(dissenter)
+            if member_id is None:
+                return queryset.none()
+            queryset = queryset.filter(dissents__member_id=member_id)
+
+        unanimous = params.get("unanimous")
+        if unanimous:
+            if unanimous.lower() in TRUE_VALUES:
+                queryset = queryset.filter(votes_against=0)
+            else:
+                queryset = queryset.filter(votes_against__gt=0)
+
+        min_votes_against = params.get("min_votes_against")
+        if min_votes_against:
+            if not min_votes_against.isdigit():
+                raise ValidationError({"min_votes_against": "Must be a non-negative integer."})
+            queryset = queryset.filter(votes_against__gte=int(min_votes_against))
+
+        # The score range applies to the chosen model's column, else to the
+        # first score of each decision
+        score_field = "implicit_dissent_value"
+        score_model = params.get("score_model")
+        if score_model:
+            if score_model.lower() not in SCORE_MODELS:
+                raise ValidationError({"score_model": f"Choose from {', '.join(SCORE_MODELS)}."})
+            score_field = SCORE_MODELS[score_model.lower()]
+            queryset = queryset.filter(**{f"{score_field}__isnull": False})
+
+        min_score = _float_param(self.request, "min_score")
+        if min_score is not None:
+            queryset = queryset.filter(**{f"{score_field}__gte": min_score})
+        max_score = _float_param(self.request, "max_score")
+        if max_score is not None:
+            queryset = queryset.filter(**{f"{score_field}__lte": max_score})
+
+        return queryset
@@ -0,0 +1,101 @@
+"""
+Forecast accuracy of MPC members, computed with NumPy over the parsed
+*_value columns.
+
+One query loads (name, member type, actual, predicted) for every variable in
+the requested period range. Errors are predicted - actual; per-group count,
+MAE, RMSE and bias come from np.bincount over the group ids, so the cost is
+a few array passes whatever the number of members.
+"""
+import numpy as np
+
+from .models import FORECAST_VARIABLES as VARIABLES, MPCDiscussion
+
+
+def _group_metrics(groups, count, errors):
+    """{metric: array} per group id for the errors, NaN where a row has no error"""
+    valid = ~np.isnan(errors)
+    ids = groups[valid]
+    values = errors[valid]
+    counts = np.bincount(ids, minlength=count)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'count': counts,
+            'mae': np.bincount(ids, weights=np.abs(values), minlength=count) / counts,
+            'rmse': np.sqrt(np.bincount(ids, weights=values ** 2, minlength=count) / counts),
+            'bias': np.bincount(ids, weights=values, minlength=count) / counts,
+        }
+
+
+def _metrics_at(metrics, index):
+    count = int(metrics['count'][index])
+    if not count:
+        return {'count': 0, 'mae': None, 'rmse': None, 'bias': None}
+    return {
+        'count': count,
+        'mae': round(float(metrics['mae'][index]), 4),
+        'rmse': round(float(metrics['rmse'][index]), 4),
+        'bias': round(float(metrics['bias'][index]), 4),
+    }
+
+
+VALUE_FIELDS = [f'{variable}_{kind}_value' for variable in VARIABLES for kind in ('actual', 'predicted')]
+
+
+def summarize(queryset):
+    """{variable: metrics} over all the discussions of a queryset, as one group"""
+    values = np.array(list(queryset.order_by().values_list(*VALUE_FIELDS)), dtype=np.float64)
+    values = values.reshape(-1, len(VALUE_FIELDS))
+    groups = np.zeros(len(values), dtype=np.int64)
+    return {
+        variable: _metrics_at(_group_metrics(groups, 1, values[:, 2 * position + 1] - values[:, 2 * position]), 0)
+        for position, variable in enumerate(VARIABLES)
+    }
+
+
+def compute(start=None, end=None):
+    """
+    Accuracy per member and per member type for discussions with a period in
+    [start, end] (either bound optional)
+    """
+    queryset = MPCDiscussion.objects.filter(period__isnull=False).order_by()
+    if start is not None:
+        queryset = queryset.filter(period__gte=start)
+    if end is not None:
+        queryset = queryset.filter(period__lte=end)
+
+    rows = list(queryset.values_list('name', 'member_type', *VALUE_FIELDS))
+    if not rows:
+        return {'members': [], 'member_types': []}
+
+    names = np.array([row[0] for row in rows])
+    types = np.array([row[1] for row in rows])
+    values = np.array([row[2:] for row in rows], dtype=np.float64)
+
+    member_keys, member_ids = np.unique(np.stack([names, types], axis=1), axis=0, return_inverse=True)
+    type_keys, type_ids = np.unique(types, return_inverse=True)
+    member_ids = member_ids.reshape(-1)
+
+    by_member, by_type = {}, {}
+    for position, variable in enumerate(VARIABLES):
+        errors = values[:, 2 * position + 1] - values[:, 2 * position]
+        by_member[variable] = _group_metrics(member_ids, len(member_keys), errors)
+        by_type[variable] = _group_metrics(type_ids, len(type_keys), errors)
+
+    return {
+        'members': [
+            {
+                'name': str(name),
+                'member_type': str(member_type),
+                **{variable: _metrics_at(by_member[variable], index) for variable in VARIABLES},
+            }
+            for index, (name, member_type) in enumerate(member_keys)
+        ],
+        'member_types': [
+            {
+                'member_type': str(member_type),
+                **{variable: _metrics_at(by_type[variable], index) for variable in VARIABLES},
+            }
+            for index, member_type in enumerate(type_keys)
+        ],
+    }
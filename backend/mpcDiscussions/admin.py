@@ -4,7 +4,8 @@ from .models import MPCDiscussion
 @admin.register(MPCDiscussion)
 class MPCDiscussionAdmin(admin.ModelAdmin):
     list_display = ['name', 'month_year', 'member_type', 'analysis_score', 'created_at']
-    list_filter = ['member_type', 'month_year', 'name']
+    list_filter = ['member_type', 'name']
+    date_hierarchy = 'period'
     search_fields = ['name', 'month_year']
     ordering = ['-created_at']
     
@@ -0,0 +1,100 @@
+"""
+Member-by-member correlation of analysis scores.
+
+Scores are pivoted into a members x months matrix (NaN where a member has
+no discussion that month). Pearson correlations use pairwise-complete
+months and are computed for every pair at once from masked matrix
+products; Spearman correlations rank each pair's common months and reuse
+the same Pearson step on the ranks.
+"""
+import numpy as np
+from django.db.models import Avg
+
+from .models import MPCDiscussion
+
+# Pairs sharing fewer months than this get no correlation
+MIN_OVERLAP = 3
+
+
+def score_matrix(start=None, end=None):
+    """(members, member types, months, members x months scores) for periods in [start, end]"""
+    queryset = MPCDiscussion.objects.filter(period__isnull=False)
+    if start is not None:
+        queryset = queryset.filter(period__gte=start)
+    if end is not None:
+        queryset = queryset.filter(period__lte=end)
+
+    rows = list(
+        queryset.order_by().values('name', 'member_type', 'period').annotate(
+            score=Avg('analysis_score')
+        ).values_list('name', 'member_type', 'period', 'score')
+    )
+    members = sorted({(row[0], row[1]) for row in rows})
+    months = sorted({row[2] for row in rows})
+    member_index = {member: index for index, member in enumerate(members)}
+    month_index = {month: index for index, month in enumerate(months)}
+
+    scores = np.full((len(members), len(months)), np.nan)
+    if rows:
+        scores[
+            [member_index[(row[0], row[1])] for row in rows],
+            [month_index[row[2]] for row in rows],
+        ] = [row[3] for row in rows]
+    return [member[0] for member in members], [member[1] for member in members], months, scores
+
+
+def pearson(scores):
+    """Pairwise-complete Pearson correlations and overlap counts of the rows of `scores`"""
+    present = (~np.isnan(scores)).astype(np.float64)
+    values = np.nan_to_num(scores)
+
+    overlap = present @ present.T
+    sums = values @ present.T             # sum of row i over the months shared with row j
+    squares = (values ** 2) @ present.T
+    products = values @ values.T
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        covariance = products - sums * sums.T / overlap
+        variance = squares - sums ** 2 / overlap
+        correlation = covariance / np.sqrt(variance * variance.T)
+    correlation[(overlap < MIN_OVERLAP) | ~np.isfinite(correlation)] = np.nan
+    return np.clip(correlation, -1.0, 1.0), overlap.astype(np.int64)
+
+
+def _ranks(values):
+    """Ranks starting at 1, ties sharing their average rank"""
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    ends = np.cumsum(counts)
+    return (ends - (counts - 1) / 2)[inverse]
+
+
+def spearman(scores):
+    """Pairwise-complete Spearman correlations of the rows of `scores`"""
+    count = scores.shape[0]
+    present = ~np.isnan(scores)
+    correlation = np.full((count, count), np.nan)
+    for i in range(count):
+        for j in range(i, count):
+            common = present[i] & present[j]
+            if common.sum() < MIN_OVERLAP:
+                continue
+            pair = np.vstack([_ranks(scores[i, common]), _ranks(scores[j, common])])
+            correlation[i, j] = correlation[j, i] = pearson(pair)[0][0, 1]
+    return correlation
+
+
+def _nullable(matrix):
+    return [[None if np.isnan(value) else round(float(value), 4) for value in row] for row in matrix]
+
+
+def compute(start=None, end=None):
+    members, member_types, months, scores = score_matrix(start, end)
+    correlation, overlap = pearson(scores)
+    return {
+        'members': members,
+        'member_types': member_types,
+        'months': [month.strftime('%Y-%m') for month in months],
+        'pearson': _nullable(correlation),
+        'spearman': _nullable(spearman(scores)),
+        'overlap': overlap.tolist(),
+    }
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from mpcDiscussions.models import FORECAST_FIELDS, DiscussionVersion, MPCDiscussion
+
+class Command(BaseCommand):
+    help = 'Re-parse the numeric forecast columns of every MPC discussion from its analysis strings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Rows written per bulk update (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        value_fields = [f'{field}_value' for field in FORECAST_FIELDS]
+
+        self.stdout.write('Parsing forecast values...')
+        parsed = 0
+        batch = []
+        with transaction.atomic():
+            for discussion in MPCDiscussion.objects.only('id', *FORECAST_FIELDS).iterator(chunk_size=batch_size):
+                discussion.parse_forecasts()
+                batch.append(discussion)
+                if len(batch) >= batch_size:
+                    MPCDiscussion.objects.bulk_update(batch, value_fields)
+                    parsed += len(batch)
+                    batch = []
+            MPCDiscussion.objects.bulk_update(batch, value_fields)
+            parsed += len(batch)
+            DiscussionVersion.bump()
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully parsed forecast values for {parsed} discussions')
+        )
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from mpcDiscussions import rollups
+
+class Command(BaseCommand):
+    help = 'Recompute the monthly analysis score averages from MPCDiscussion'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding monthly score averages...')
+        rows = rollups.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully rebuilt {rows} monthly score averages')
+        )
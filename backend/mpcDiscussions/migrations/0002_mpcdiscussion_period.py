@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:30
+
+import calendar
+import re
+from datetime import date
+
+from django.db import migrations, models
+
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_abbr) if name}
+MONTH_YEAR_RE = re.compile(r'([A-Za-z]{3})[A-Za-z]*\.?[\s,\-/]*(\d{4})')
+
+
+def parse_month_year(value):
+    # Frozen copy of mpcDiscussions.models.parse_month_year
+    match = MONTH_YEAR_RE.search(value or '')
+    if not match:
+        return None
+    month = MONTHS.get(match.group(1).lower())
+    return date(int(match.group(2)), month, 1) if month else None
+
+
+def backfill_period(apps, schema_editor):
+    MPCDiscussion = apps.get_model('mpcDiscussions', 'MPCDiscussion')
+
+    discussions = list(MPCDiscussion.objects.only('id', 'month_year'))
+    for discussion in discussions:
+        discussion.period = parse_month_year(discussion.month_year)
+    MPCDiscussion.objects.bulk_update(discussions, ['period'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcDiscussions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='mpcdiscussion',
+            options={'ordering': ['period', 'name'], 'verbose_name': 'MPC Discussion', 'verbose_name_plural': 'MPC Discussions'},
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='period',
+            field=models.DateField(blank=True, editable=False, help_text='First day of the month in month_year, set on save', null=True),
+        ),
+        migrations.RunPython(backfill_period, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='mpcdiscussion',
+            index=models.Index(fields=['member_type', 'period'], name='discussion_type_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdiscussion',
+            index=models.Index(fields=['name', 'period'], name='discussion_name_period_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:32
+
+from django.db import migrations, models
+from django.db.models import Avg, Count
+
+
+def populate_averages(apps, schema_editor):
+    MPCDiscussion = apps.get_model('mpcDiscussions', 'MPCDiscussion')
+    MonthlyScoreAverage = apps.get_model('mpcDiscussions', 'MonthlyScoreAverage')
+
+    rows = MPCDiscussion.objects.order_by().filter(period__isnull=False).values('member_type', 'period').annotate(
+        average=Avg('analysis_score'),
+        count=Count('id')
+    )
+    MonthlyScoreAverage.objects.bulk_create([
+        MonthlyScoreAverage(
+            member_type=row['member_type'],
+            period=row['period'],
+            average_score=row['average'],
+            discussions=row['count']
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcDiscussions', '0002_mpcdiscussion_period'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyScoreAverage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('member_type', models.CharField(choices=[('internal', 'Internal'), ('external', 'External')], max_length=10)),
+                ('period', models.DateField(help_text='First day of the month')),
+                ('average_score', models.FloatField(help_text="Mean analysis score of the month's discussions")),
+                ('discussions', models.PositiveIntegerField(help_text='Number of discussions averaged')),
+            ],
+            options={
+                'verbose_name': 'Monthly Score Average',
+                'verbose_name_plural': 'Monthly Score Averages',
+                'ordering': ['member_type', 'period'],
+                'unique_together': {('member_type', 'period')},
+            },
+        ),
+        migrations.RunPython(populate_averages, migrations.RunPython.noop),
+    ]
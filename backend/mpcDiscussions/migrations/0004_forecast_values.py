@@ -0,0 +1,106 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:33
+
+import re
+
+from django.db import migrations, models
+
+NUMBER = r'[+-]?\d[\d,]*(?:\.\d+)?'
+FORECAST_VALUE_RE = re.compile(
+    rf'^\s*(?:~|approx\.?|about|around)?\s*({NUMBER})\s*%?\s*(?:(?:-|–|to)\s*({NUMBER})\s*%?)?\s*$',
+    re.IGNORECASE
+)
+FORECAST_FIELDS = [
+    f'{variable}_{kind}'
+    for variable in ('inflation', 'growth', 'gdp')
+    for kind in ('actual', 'predicted', 'error')
+]
+
+
+def parse_forecast_value(value):
+    # Frozen copy of mpcDiscussions.models.parse_forecast_value
+    match = FORECAST_VALUE_RE.match(value or '')
+    if not match:
+        return None
+    numbers = [float(number.replace(',', '')) for number in match.groups() if number is not None]
+    return sum(numbers) / len(numbers)
+
+
+def backfill_forecast_values(apps, schema_editor):
+    MPCDiscussion = apps.get_model('mpcDiscussions', 'MPCDiscussion')
+
+    discussions = list(MPCDiscussion.objects.only('id', *FORECAST_FIELDS))
+    for discussion in discussions:
+        for field in FORECAST_FIELDS:
+            setattr(discussion, f'{field}_value', parse_forecast_value(getattr(discussion, field)))
+    MPCDiscussion.objects.bulk_update(
+        discussions, [f'{field}_value' for field in FORECAST_FIELDS], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcDiscussions', '0003_monthlyscoreaverage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscussionVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(default='all', max_length=20, unique=True)),
+                ('version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Discussion Version',
+                'verbose_name_plural': 'Discussion Versions',
+            },
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='gdp_actual_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='gdp_error_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='gdp_predicted_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='growth_actual_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='growth_error_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='growth_predicted_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='inflation_actual_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='inflation_error_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='inflation_predicted_value',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_forecast_values, migrations.RunPython.noop),
+    ]
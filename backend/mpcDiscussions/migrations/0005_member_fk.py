@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('mpcDiscussions', '0004_forecast_values'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='mpcdiscussion',
+            name='member',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Canonical member, resolved from name on save', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='discussions', to='members.member'),
+        ),
+        migrations.AddIndex(
+            model_name='mpcdiscussion',
+            index=models.Index(fields=['member', 'period'], name='discussion_member_period_idx'),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:30
+
+from django.db import migrations, models
+
+
+# The forecast columns became longer, nullable analysis strings in the
+# models before the migrations recorded it
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcDiscussions', '0005_member_fk'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='gdp_actual',
+            field=models.CharField(blank=True, help_text='Actual GDP analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='gdp_error',
+            field=models.CharField(blank=True, help_text='GDP error analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='gdp_predicted',
+            field=models.CharField(blank=True, help_text='Predicted GDP analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='growth_actual',
+            field=models.CharField(blank=True, help_text='Actual growth analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='growth_error',
+            field=models.CharField(blank=True, help_text='Growth error analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='growth_predicted',
+            field=models.CharField(blank=True, help_text='Predicted growth analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='inflation_actual',
+            field=models.CharField(blank=True, help_text='Actual inflation analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='inflation_error',
+            field=models.CharField(blank=True, help_text='Inflation error analysis', max_length=500, null=True),
+        ),
+        migrations.AlterField(
+            model_name='mpcdiscussion',
+            name='inflation_predicted',
+            field=models.CharField(blank=True, help_text='Predicted inflation analysis', max_length=500, null=True),
+        ),
+    ]
@@ -1,4 +1,130 @@
-from django.db import models
+import calendar
+import re
+from datetime import date
+
+from django.db import models, transaction
+from django.utils import timezone
+
+NUMBER = r'[+-]?\d[\d,]*(?:\.\d+)?'
+FORECAST_VALUE_RE = re.compile(
+    rf'^\s*(?:~|approx\.?|about|around)?\s*({NUMBER})\s*%?\s*(?:(?:-|–|to)\s*({NUMBER})\s*%?)?\s*$',
+    re.IGNORECASE
+)
+FORECAST_VARIABLES = ('inflation', 'growth', 'gdp')
+FORECAST_FIELDS = [
+    f'{variable}_{kind}'
+    for variable in FORECAST_VARIABLES
+    for kind in ('actual', 'predicted', 'error')
+]
+MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_abbr) if name}
+MONTH_YEAR_RE = re.compile(r'([A-Za-z]{3})[A-Za-z]*\.?[\s,\-/]*(\d{4})')
+
+
+def parse_month_year(value):
+    """First day of the month for strings like 'Oct 2016' or 'October 2016', else None"""
+    match = MONTH_YEAR_RE.search(value or '')
+    if not match:
+        return None
+    month = MONTHS.get(match.group(1).lower())
+    return date(int(match.group(2)), month, 1) if month else None
+
+
+def parse_forecast_value(value):
+    """
+    Number in a forecast string such as '6.2', '5%', '1,639,697' or a range
+    like '4.5-5.0' (its midpoint). Free text and 'NA' give None.
+    """
+    match = FORECAST_VALUE_RE.match(value or '')
+    if not match:
+        return None
+    numbers = [float(number.replace(',', '')) for number in match.groups() if number is not None]
+    return sum(numbers) / len(numbers)
+
+
+def format_period(period):
+    """'Oct 2016' style label for a period date"""
+    return f"{calendar.month_abbr[period.month]} {period.year}"
+
+
+def _refresh_profiles(member_ids):
+    # Queryset writes send no signals, so member profiles are refreshed here
+    from members import profiles
+
+    profiles.refresh(member_ids)
+
+
+class MPCDiscussionQuerySet(models.QuerySet):
+    """Keeps the derived columns, MonthlyScoreAverage and the member profiles in step with bulk writes"""
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from . import rollups
+
+        from members.models import Member
+
+        objs = list(objs)
+        member_ids = Member.objects.ids_for(obj.name for obj in objs)
+        for obj in objs:
+            obj.period = parse_month_year(obj.month_year)
+            obj.member_id = member_ids.get(obj.name)
+            obj.parse_forecasts()
+
+        with transaction.atomic(using=self.db):
+            # Rows overwritten on conflict leave their old months and members too
+            stored = self.model.objects.filter(pk__in=[obj.pk for obj in objs if obj.pk is not None])
+            keys = rollups.keys_for_queryset(stored)
+            members = set(stored.values_list('member_id', flat=True))
+            created = super().bulk_create(objs, *args, **kwargs)
+            rollups.refresh(keys | {(obj.member_type, obj.period) for obj in objs})
+            DiscussionVersion.bump()
+            _refresh_profiles(members | set(member_ids.values()))
+        return created
+
+    def update(self, **kwargs):
+        from . import rollups
+
+        from members.models import Member
+
+        # Derived columns follow plain values; expressions are left to the caller
+        if isinstance(kwargs.get('month_year'), str):
+            kwargs['period'] = parse_month_year(kwargs['month_year'])
+        if isinstance(kwargs.get('name'), str):
+            kwargs['member_id'] = Member.objects.resolve(kwargs['name'])
+        for field in FORECAST_FIELDS:
+            if field in kwargs and (kwargs[field] is None or isinstance(kwargs[field], str)):
+                kwargs[f'{field}_value'] = parse_forecast_value(kwargs[field])
+
+        with transaction.atomic(using=self.db):
+            pks = list(self.values_list('pk', flat=True))
+            changed = self.model.objects.filter(pk__in=pks)
+            members = set(changed.values_list('member_id', flat=True))
+            if not {'period', 'member_type', 'analysis_score'} & set(kwargs):
+                rows = super().update(**kwargs)
+            else:
+                keys = rollups.keys_for_queryset(changed)
+                rows = super().update(**kwargs)
+                keys |= rollups.keys_for_queryset(changed)
+                rollups.refresh(keys)
+            DiscussionVersion.bump()
+            _refresh_profiles(members | set(changed.values_list('member_id', flat=True)))
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        from . import rollups
+
+        with transaction.atomic(using=self.db):
+            keys = rollups.keys_for_queryset(self)
+            members = set(self.values_list('member_id', flat=True))
+            result = super().delete()
+            rollups.refresh(keys)
+            DiscussionVersion.bump()
+            _refresh_profiles(members)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class MPCDiscussion(models.Model):
     MEMBER_TYPE_CHOICES = [
@@ -10,7 +136,22 @@ class MPCDiscussion(models.Model):
         max_length=20, 
         help_text="Format: 'Oct 2016', 'Jan 2017', etc."
     )
+    period = models.DateField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="First day of the month in month_year, set on save"
+    )
     name = models.CharField(max_length=100, help_text="MPC Member name")
+    member = models.ForeignKey(
+        'members.Member',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='discussions',
+        help_text="Canonical member, resolved from name on save"
+    )
     member_type = models.CharField(
         max_length=10, 
         choices=MEMBER_TYPE_CHOICES,
@@ -32,6 +173,17 @@ class MPCDiscussion(models.Model):
     gdp_predicted = models.CharField(max_length=500, help_text="Predicted GDP analysis", blank=True, null=True)
     gdp_error = models.CharField(max_length=500, help_text="GDP error analysis", blank=True, null=True)
     
+    # Numbers parsed from the analysis strings above, set on save
+    inflation_actual_value = models.FloatField(null=True, blank=True, editable=False)
+    inflation_predicted_value = models.FloatField(null=True, blank=True, editable=False)
+    inflation_error_value = models.FloatField(null=True, blank=True, editable=False)
+    growth_actual_value = models.FloatField(null=True, blank=True, editable=False)
+    growth_predicted_value = models.FloatField(null=True, blank=True, editable=False)
+    growth_error_value = models.FloatField(null=True, blank=True, editable=False)
+    gdp_actual_value = models.FloatField(null=True, blank=True, editable=False)
+    gdp_predicted_value = models.FloatField(null=True, blank=True, editable=False)
+    gdp_error_value = models.FloatField(null=True, blank=True, editable=False)
+    
     # Analysis score for correlation plot
     analysis_score = models.FloatField(
         help_text="Analysis score for correlation plotting",
@@ -39,27 +191,111 @@ class MPCDiscussion(models.Model):
     )
     
     created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = MPCDiscussionQuerySet.as_manager()
     
     class Meta:
-        ordering = ['month_year', 'name']
+        ordering = ['period', 'name']
+        indexes = [
+            models.Index(fields=['member_type', 'period'], name='discussion_type_period_idx'),
+            models.Index(fields=['name', 'period'], name='discussion_name_period_idx'),
+            models.Index(fields=['member', 'period'], name='discussion_member_period_idx'),
+        ]
         verbose_name = "MPC Discussion"
         verbose_name_plural = "MPC Discussions"
     
     def __str__(self):
         return f"{self.name} - {self.month_year} ({self.member_type})"
+
+    def save(self, *args, **kwargs):
+        from members.models import Member
+        from . import rollups
+
+        self.period = parse_month_year(self.month_year)
+        self.member_id = Member.objects.resolve(self.name)
+        self.parse_forecasts()
+        with transaction.atomic():
+            keys = set()
+            if self.pk is not None:
+                keys = rollups.keys_for_queryset(MPCDiscussion.objects.filter(pk=self.pk))
+            super().save(*args, **kwargs)
+            keys.add((self.member_type, self.period))
+            rollups.refresh(keys)
+            DiscussionVersion.bump()
+
+    def parse_forecasts(self):
+        """Fill the *_value columns from the forecast strings"""
+        for field in FORECAST_FIELDS:
+            setattr(self, f'{field}_value', parse_forecast_value(getattr(self, field)))
+
+    def delete(self, *args, **kwargs):
+        from . import rollups
+
+        with transaction.atomic():
+            keys = rollups.keys_for_queryset(MPCDiscussion.objects.filter(pk=self.pk))
+            result = super().delete(*args, **kwargs)
+            rollups.refresh(keys)
+            DiscussionVersion.bump()
+        return result
     
     @property
     def year(self):
-        """Extract year from month_year string"""
-        try:
-            return int(self.month_year.split()[-1])
-        except:
-            return None
+        """Year of the discussion period"""
+        return self.period.year if self.period else None
     
     @property
     def month(self):
-        """Extract month from month_year string"""
-        try:
-            return self.month_year.split()[0]
-        except:
-            return None
\ No newline at end of file
+        """Abbreviated month name of the discussion period, e.g. 'Oct'"""
+        return calendar.month_abbr[self.period.month] if self.period else None
+
+
+
+class MonthlyScoreAverage(models.Model):
+    """
+    Rollup of MPCDiscussion: average analysis score of one member type in one
+    month. Maintained by MPCDiscussion writes, rebuilt with
+    `manage.py rebuild_score_averages`.
+    """
+    member_type = models.CharField(max_length=10, choices=MPCDiscussion.MEMBER_TYPE_CHOICES)
+    period = models.DateField(help_text="First day of the month")
+    average_score = models.FloatField(help_text="Mean analysis score of the month's discussions")
+    discussions = models.PositiveIntegerField(help_text="Number of discussions averaged")
+
+    class Meta:
+        ordering = ['member_type', 'period']
+        unique_together = ['member_type', 'period']
+        verbose_name = "Monthly Score Average"
+        verbose_name_plural = "Monthly Score Averages"
+
+    def __str__(self):
+        return f"{self.member_type} {format_period(self.period)}: {self.average_score:.2f}"
+
+
+
+class DiscussionVersion(models.Model):
+    """
+    Change counter for MPCDiscussion data, bumped on every write. Cached
+    accuracy results are keyed on it.
+    """
+    scope = models.CharField(max_length=20, unique=True, default='all')
+    version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Discussion Version"
+        verbose_name_plural = "Discussion Versions"
+
+    def __str__(self):
+        return f"{self.scope} v{self.version}"
+
+    @classmethod
+    def bump(cls):
+        cls.objects.get_or_create(scope='all')
+        cls.objects.filter(scope='all').update(
+            version=models.F('version') + 1,
+            updated_at=timezone.now()
+        )
+
+    @classmethod
+    def current(cls):
+        return cls.objects.filter(scope='all').values_list('version', flat=True).first() or 0
@@ -0,0 +1,77 @@
+"""
+Maintenance of the MonthlyScoreAverage rollup.
+
+Writes to MPCDiscussion report the (member type, period) months they touch;
+those months are re-averaged from the base table in one grouped query, so
+the correlation plot reads one small row per month instead of every
+discussion.
+"""
+from django.db import transaction
+from django.db.models import Avg, Count, Q
+
+from .models import MonthlyScoreAverage, MPCDiscussion
+
+BATCH_SIZE = 1000
+
+
+def keys_for_queryset(queryset):
+    """(member type, period) months covered by a queryset"""
+    return set(
+        queryset.order_by().filter(period__isnull=False).values_list('member_type', 'period').distinct()
+    )
+
+
+def _averages(queryset):
+    rows = queryset.order_by().filter(period__isnull=False).values('member_type', 'period').annotate(
+        average=Avg('analysis_score'),
+        count=Count('id')
+    )
+    return {(row['member_type'], row['period']): (row['average'], row['count']) for row in rows}
+
+
+def refresh(keys):
+    """Recompute the averages of the given (member type, period) months"""
+    keys = {key for key in keys if key[1] is not None}
+    if not keys:
+        return
+
+    # Filter on the cross product and drop the extra months in Python, which
+    # keeps the query flat however many months are touched
+    condition = Q(member_type__in={key[0] for key in keys}, period__in={key[1] for key in keys})
+
+    with transaction.atomic():
+        values = _averages(MPCDiscussion.objects.filter(condition))
+        existing = {
+            (row.member_type, row.period): row
+            for row in MonthlyScoreAverage.objects.select_for_update().filter(condition)
+        }
+        to_create, to_update, to_delete = [], [], []
+        for key in keys:
+            row = existing.get(key)
+            if key not in values:
+                if row is not None:
+                    to_delete.append(row.pk)
+                continue
+            average, count = values[key]
+            if row is None:
+                to_create.append(MonthlyScoreAverage(
+                    member_type=key[0], period=key[1], average_score=average, discussions=count
+                ))
+            else:
+                row.average_score, row.discussions = average, count
+                to_update.append(row)
+
+        MonthlyScoreAverage.objects.filter(pk__in=to_delete).delete()
+        MonthlyScoreAverage.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+        MonthlyScoreAverage.objects.bulk_update(to_update, ['average_score', 'discussions'], batch_size=BATCH_SIZE)
+
+
+def rebuild():
+    """Recompute the whole table from MPCDiscussion, returning the number of rows"""
+    with transaction.atomic():
+        MonthlyScoreAverage.objects.all().delete()
+        rows = MonthlyScoreAverage.objects.bulk_create([
+            MonthlyScoreAverage(member_type=key[0], period=key[1], average_score=average, discussions=count)
+            for key, (average, count) in _averages(MPCDiscussion.objects.all()).items()
+        ], batch_size=BATCH_SIZE)
+    return len(rows)
@@ -10,7 +10,9 @@ class MPCDiscussionSerializer(serializers.ModelSerializer):
         fields = [
             'id',
             'month_year',
+            'period',
             'name',
+            'member',
             'member_type',
             'analysis_score',
             'inflation_actual',
@@ -0,0 +1,67 @@
+from datetime import date
+
+from django.test import TestCase
+
+from members.models import MemberProfile
+
+from . import correlation
+from .models import MonthlyScoreAverage, MPCDiscussion
+
+
+class CorrelationMatrixTests(TestCase):
+    def setUp(self):
+        months = ['Jan 2024', 'Feb 2024', 'Mar 2024', 'Apr 2024']
+        scores = {
+            ('Ashima Goyal', 'external'): [0.1, 0.2, 0.3, 0.4],
+            # Same name under both member types: two rows of the matrix
+            ('Michael Patra', 'internal'): [0.4, 0.3, 0.2, 0.1],
+            ('Michael Patra', 'external'): [0.2, 0.4, 0.6, 0.8],
+        }
+        for (name, member_type), values in scores.items():
+            for month_year, score in zip(months, values):
+                MPCDiscussion.objects.create(
+                    month_year=month_year, name=name, member_type=member_type, analysis_score=score
+                )
+
+    def test_each_member_type_keeps_its_own_scores(self):
+        members, member_types, months, scores = correlation.score_matrix()
+
+        self.assertEqual(list(zip(members, member_types)), [
+            ('Ashima Goyal', 'external'),
+            ('Michael Patra', 'external'),
+            ('Michael Patra', 'internal'),
+        ])
+        self.assertEqual(scores.tolist(), [
+            [0.1, 0.2, 0.3, 0.4],
+            [0.2, 0.4, 0.6, 0.8],
+            [0.4, 0.3, 0.2, 0.1],
+        ])
+
+    def test_correlations(self):
+        result = correlation.compute()
+
+        self.assertEqual(result['pearson'][0], [1.0, 1.0, -1.0])
+        self.assertEqual(result['spearman'][1], [1.0, 1.0, -1.0])
+        self.assertEqual(result['overlap'][2], [4, 4, 4])
+
+
+class DiscussionBulkCreateTests(TestCase):
+    def test_derived_columns_and_rollups_are_filled(self):
+        MPCDiscussion.objects.bulk_create([
+            MPCDiscussion(
+                month_year='Oct 2016', name='Dr. Urjit R. Patel', member_type='internal',
+                inflation_predicted='4.5-5.0', analysis_score=0.2
+            ),
+            MPCDiscussion(month_year='October 2016', name='Urjit Patel', member_type='internal', analysis_score=0.6),
+        ])
+
+        first, second = MPCDiscussion.objects.order_by('analysis_score')
+        self.assertEqual(first.period, date(2016, 10, 1))
+        self.assertEqual(first.inflation_predicted_value, 4.75)
+        self.assertIsNotNone(first.member_id)
+        self.assertEqual(first.member_id, second.member_id)
+
+        average = MonthlyScoreAverage.objects.get(member_type='internal', period=date(2016, 10, 1))
+        self.assertEqual(average.discussions, 2)
+        self.assertAlmostEqual(average.average_score, 0.4)
+        self.assertEqual(MemberProfile.objects.get(pk=first.member_id).discussions, 2)
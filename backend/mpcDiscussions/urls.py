@@ -5,7 +5,10 @@ from .views import (
     available_members,
     correlation_data,
     member_analysis_data,
-    statistics
+    member_analysis_batch,
+    statistics,
+    forecast_accuracy,
+    correlation_matrix
 )
 
 urlpatterns = [
@@ -21,9 +24,18 @@ urlpatterns = [
     # Get correlation data for internal/external members by year
     path('correlation/<int:year>/<str:member_type>/', correlation_data, name='correlation-data'),
     
+    # Get pairwise score correlations between members
+    path('correlation-matrix/', correlation_matrix, name='correlation-matrix'),
+    
+    # Get analysis data for several members and years in one call
+    path('member-analysis/batch/', member_analysis_batch, name='member-analysis-batch'),
+    
     # Get member analysis data by year and member name
     path('member-analysis/<int:year>/<str:member_name>/', member_analysis_data, name='member-analysis-data'),
     
     # Get general statistics
     path('statistics/', statistics, name='statistics'),
+    
+    # Get forecast accuracy per member and member type
+    path('accuracy/', forecast_accuracy, name='forecast-accuracy'),
 ]
\ No newline at end of file
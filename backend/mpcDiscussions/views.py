@@ -1,14 +1,48 @@
+import calendar
+from datetime import date, datetime
+
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
-from django.db.models import Avg
-from .models import MPCDiscussion
+from django.core.cache import cache
+from django.db.models import Avg, Q
+from . import accuracy, correlation
+from .models import FORECAST_VARIABLES, DiscussionVersion, MonthlyScoreAverage, MPCDiscussion, format_period
 from .serializers import (
     MPCDiscussionSerializer, 
     CorrelationDataSerializer, 
     MemberAnalysisSerializer
 )
 
+ACCURACY_CACHE_TIMEOUT = 60 * 60 * 24
+CORRELATION_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _period_param(request, name):
+    """Optional YYYY-MM (or YYYY-MM-DD) query parameter as the first day of its month"""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    for fmt in ('%Y-%m', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(value, fmt).date().replace(day=1)
+        except ValueError:
+            continue
+    raise ValueError(f'{name} must be a month in YYYY-MM format')
+
+def _year_param(request, name):
+    """Optional four-digit year query parameter"""
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    if not value.isdigit() or len(value) != 4:
+        raise ValueError(f'{name} must be a year such as 2024')
+    return int(value)
+
+def _year_filter(year, end_year=None):
+    """Q object for the periods of calendar years year..end_year, served by the period indexes"""
+    return Q(period__gte=date(year, 1, 1), period__lt=date((end_year or year) + 1, 1, 1))
+
 class MPCDiscussionListAPIView(generics.ListAPIView):
     """
     GET /api/mpcDiscussions/
@@ -23,17 +57,8 @@ def available_years(request):
     GET /api/mpcDiscussions/years/
     Returns list of available years
     """
-    years = MPCDiscussion.objects.values_list('month_year', flat=True).distinct()
-    unique_years = set()
-    
-    for month_year in years:
-        try:
-            year = int(month_year.split()[-1])
-            unique_years.add(year)
-        except:
-            continue
-    
-    return Response(sorted(list(unique_years), reverse=True))
+    years = MPCDiscussion.objects.dates('period', 'year', order='DESC')
+    return Response([year.year for year in years])
 
 @api_view(['GET'])
 def available_members(request):
@@ -48,40 +73,46 @@ def available_members(request):
 def correlation_data(request, year, member_type):
     """
     GET /api/mpcDiscussions/correlation/{year}/{member_type}/
-    Returns correlation data for internal/external members by year
+    Returns monthly average analysis scores for internal/external members by year
+    Optional: ?end_year=2025 to cover year..end_year, ?members=Name A,Name B to
+    average only the given members
     """
     try:
-        # Filter by year and member type
-        discussions = MPCDiscussion.objects.filter(
-            month_year__endswith=str(year),
-            member_type=member_type
-        )
-        
-        # Group by month_year and calculate average analysis score
-        monthly_data = {}
-        for discussion in discussions:
-            month_year = discussion.month_year
-            if month_year not in monthly_data:
-                monthly_data[month_year] = []
-            monthly_data[month_year].append(discussion.analysis_score)
-        
-        # Calculate averages and prepare response
-        correlation_data = []
-        for month_year, scores in monthly_data.items():
-            avg_score = sum(scores) / len(scores) if scores else 0
-            month = month_year.split()[0]
-            
-            correlation_data.append({
-                'month_year': month_year,
-                'analysis_score': round(avg_score, 2),
-                'month': month
-            })
-        
-        # Sort by month order
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+        end_year = int(request.query_params.get('end_year', year))
+        if end_year < year:
+            raise ValueError('end_year must not be before the requested year')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    members = [
+        name.strip() for name in request.query_params.get('members', '').split(',') if name.strip()
+    ]
+
+    try:
+        period_range = _year_filter(year, end_year)
+        if members:
+            # Member subsets cannot use the rollup: average them in one grouped query
+            monthly_scores = MPCDiscussion.objects.filter(
+                period_range,
+                member_type=member_type,
+                name__in=members
+            ).order_by().values('period').annotate(
+                average_score=Avg('analysis_score')
+            ).order_by('period').values_list('period', 'average_score')
+        else:
+            monthly_scores = MonthlyScoreAverage.objects.filter(
+                period_range,
+                member_type=member_type
+            ).order_by('period').values_list('period', 'average_score')
         
-        correlation_data.sort(key=lambda x: month_order.index(x['month']) if x['month'] in month_order else 12)
+        correlation_data = [
+            {
+                'month_year': format_period(period),
+                'analysis_score': round(average_score, 2),
+                'month': calendar.month_abbr[period.month]
+            }
+            for period, average_score in monthly_scores
+        ]
         
         serializer = CorrelationDataSerializer(correlation_data, many=True)
         return Response(serializer.data)
@@ -101,18 +132,16 @@ def member_analysis_data(request, year, member_name):
     try:
         # Filter by year and member name
         discussions = MPCDiscussion.objects.filter(
-            month_year__endswith=str(year),
+            _year_filter(year),
             name=member_name
-        ).order_by('month_year')
+        ).order_by('period')
         
         # Prepare data for response
         analysis_data = []
         for discussion in discussions:
-            month = discussion.month_year.split()[0]
-            
             analysis_data.append({
                 'month_year': discussion.month_year,
-                'month': month,
+                'month': discussion.month,
                 'inflation_actual': discussion.inflation_actual,
                 'inflation_predicted': discussion.inflation_predicted,
                 'inflation_error': discussion.inflation_error,
@@ -124,12 +153,6 @@ def member_analysis_data(request, year, member_name):
                 'gdp_error': discussion.gdp_error,
             })
         
-        # Sort by month order
-        month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 
-                      'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        
-        analysis_data.sort(key=lambda x: month_order.index(x['month']) if x['month'] in month_order else 12)
-        
         serializer = MemberAnalysisSerializer(analysis_data, many=True)
         return Response(serializer.data)
         
@@ -139,6 +162,64 @@ def member_analysis_data(request, year, member_name):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(['GET'])
+def member_analysis_batch(request):
+    """
+    GET /api/mpcDiscussions/member-analysis/batch/?members=Name A,Name B&from=2018&to=2024
+    Returns the analysis series of several members over a range of years
+    Optional: ?fields=inflation,gdp to include only those metrics (default: all)
+    """
+    members = [
+        name.strip() for name in request.query_params.get('members', '').split(',') if name.strip()
+    ]
+    fields = [
+        field.strip() for field in request.query_params.get('fields', '').split(',') if field.strip()
+    ] or list(FORECAST_VARIABLES)
+
+    try:
+        unknown = set(fields) - set(FORECAST_VARIABLES)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}; choose from {', '.join(FORECAST_VARIABLES)}")
+        start_year = _year_param(request, 'from')
+        end_year = _year_param(request, 'to')
+        if start_year and end_year and end_year < start_year:
+            raise ValueError('to must not be before from')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        columns = [f'{field}_{kind}' for field in fields for kind in ('actual', 'predicted', 'error')]
+        discussions = MPCDiscussion.objects.filter(period__isnull=False)
+        if members:
+            discussions = discussions.filter(name__in=members)
+        if start_year:
+            discussions = discussions.filter(period__gte=date(start_year, 1, 1))
+        if end_year:
+            discussions = discussions.filter(period__lt=date(end_year + 1, 1, 1))
+        
+        # One query over the (name, period) index; rows arrive grouped by member
+        series = {}
+        for row in discussions.order_by('name', 'period').values('name', 'member_type', 'month_year', 'period', *columns):
+            member = series.setdefault(row['name'], {
+                'name': row['name'],
+                'member_type': row['member_type'],
+                'series': []
+            })
+            member['series'].append({
+                'month_year': row['month_year'],
+                'month': calendar.month_abbr[row['period'].month],
+                'year': row['period'].year,
+                **{column: row[column] for column in columns}
+            })
+        
+        return Response(list(series.values()))
+        
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to fetch member analysis data: {str(e)}'}, 
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
 @api_view(['GET'])
 def statistics(request):
     """
@@ -151,11 +232,7 @@ def statistics(request):
         internal_members = MPCDiscussion.objects.filter(member_type='internal').values('name').distinct().count()
         external_members = MPCDiscussion.objects.filter(member_type='external').values('name').distinct().count()
         
-        years_covered = len(set([
-            int(month_year.split()[-1]) 
-            for month_year in MPCDiscussion.objects.values_list('month_year', flat=True).distinct()
-            if month_year.split()
-        ]))
+        years_covered = MPCDiscussion.objects.dates('period', 'year').count()
         
         stats = {
             'total_discussions': total_discussions,
@@ -171,4 +248,73 @@ def statistics(request):
         return Response(
             {'error': f'Failed to fetch statistics: {str(e)}'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+@api_view(['GET'])
+def forecast_accuracy(request):
+    """
+    GET /api/mpcDiscussions/accuracy/
+    Returns MAE, RMSE and bias of the inflation, growth and GDP forecasts per
+    member and per member type
+    Optional: ?start=2023-01&end=2024-12 to limit the period range (inclusive)
+    """
+    try:
+        start = _period_param(request, 'start')
+        end = _period_param(request, 'end')
+        if start and end and end < start:
+            raise ValueError('end must not be before start')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        key = f'mpc-accuracy:{start}:{end}:v{DiscussionVersion.current()}'
+        result = cache.get(key)
+        if result is None:
+            result = {
+                'start': start.isoformat() if start else None,
+                'end': end.isoformat() if end else None,
+                **accuracy.compute(start, end),
+            }
+            cache.set(key, result, ACCURACY_CACHE_TIMEOUT)
+        return Response(result)
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to compute forecast accuracy: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@api_view(['GET'])
+def correlation_matrix(request):
+    """
+    GET /api/mpcDiscussions/correlation-matrix/
+    Returns pairwise Pearson and Spearman correlations of the members' monthly
+    analysis scores, with the number of shared months per pair
+    Optional: ?from=2023-01&to=2024-12 to limit the period range (inclusive)
+    """
+    try:
+        start = _period_param(request, 'from')
+        end = _period_param(request, 'to')
+        if start and end and end < start:
+            raise ValueError('to must not be before from')
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        key = f'mpc-correlation-matrix:{start}:{end}:v{DiscussionVersion.current()}'
+        result = cache.get(key)
+        if result is None:
+            result = {
+                'from': start.isoformat() if start else None,
+                'to': end.isoformat() if end else None,
+                'min_overlap': correlation.MIN_OVERLAP,
+                **correlation.compute(start, end),
+            }
+            cache.set(key, result, CORRELATION_CACHE_TIMEOUT)
+        return Response(result)
+
+    except Exception as e:
+        return Response(
+            {'error': f'Failed to compute correlation matrix: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import MemberVoting, DissentYear
+from .models import MemberVoting, DissentYear, MemberVote
 
 @admin.register(MemberVoting)
 class MemberVotingAdmin(admin.ModelAdmin):
@@ -8,10 +8,10 @@ class MemberVotingAdmin(admin.ModelAdmin):
     ordering = ("name",)
     
     # Explicitly define which fields to show in the form
-    fields = ("name", "tenure", "hikes", "cuts", "holds")
+    fields = ("name", "tenure", "hikes", "cuts", "holds", "baseline_hikes", "baseline_cuts", "baseline_holds")
     
-    # Make total_votes read-only since it's a property
-    readonly_fields = ()
+    # The counts are derived from the MemberVote ledger
+    readonly_fields = ("hikes", "cuts", "holds", "baseline_hikes", "baseline_cuts", "baseline_holds")
     
     def total_votes(self, obj):
         return obj.total_votes
@@ -22,4 +22,14 @@ class MemberVotingAdmin(admin.ModelAdmin):
 class DissentYearAdmin(admin.ModelAdmin):
     list_display = ("year", "explicit_count", "implicit_count")
     ordering = ("-year",)
-    fields = ("year", "explicit_count", "implicit_count")
\ No newline at end of file
+    fields = ("year", "explicit_count", "implicit_count", "baseline_explicit", "baseline_implicit")
+    # The counts are derived from the MemberVote ledger
+    readonly_fields = ("explicit_count", "implicit_count", "baseline_explicit", "baseline_implicit")
+
+@admin.register(MemberVote)
+class MemberVoteAdmin(admin.ModelAdmin):
+    list_display = ("decision", "member", "vote", "explicit_dissent", "implicit_dissent")
+    list_filter = ("vote", "explicit_dissent", "implicit_dissent", "year")
+    search_fields = ("member__name",)
+    autocomplete_fields = ("decision", "member")
+    fields = ("decision", "member", "vote", "implicit_dissent")
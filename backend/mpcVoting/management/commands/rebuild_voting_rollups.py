@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from mpcVoting import rollups
+
+class Command(BaseCommand):
+    help = 'Recompute MemberVoting and DissentYear from the MemberVote ledger'
+
+    def handle(self, *args, **options):
+        self.stdout.write('Rebuilding voting rollups...')
+        members, years = rollups.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Successfully rebuilt voting totals for {members} members and dissent counts for {years} years'
+            )
+        )
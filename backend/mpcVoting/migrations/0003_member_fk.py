@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0001_initial'),
+        ('mpcVoting', '0002_alter_dissentyear_options_alter_membervoting_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='membervoting',
+            name='member',
+            field=models.ForeignKey(blank=True, editable=False, help_text='Canonical member, resolved from name on save', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='voting_records', to='members.member'),
+        ),
+    ]
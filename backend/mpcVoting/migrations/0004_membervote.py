@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('members', '0003_memberprofile'),
+        ('mpcDecision', '0003_typed_columns'),
+        ('mpcVoting', '0003_member_fk'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemberVote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vote', models.CharField(choices=[('rate_hike', 'Rate Hike'), ('rate_cut', 'Rate Cut'), ('rate_hold', 'Rate Hold')], max_length=20)),
+                ('implicit_dissent', models.BooleanField(default=False, help_text='Voted with the decision but dissented in the minutes')),
+                ('explicit_dissent', models.BooleanField(default=False, editable=False, help_text='Vote differs from the decision, set on save')),
+                ('year', models.PositiveIntegerField(editable=False, help_text='Year of the meeting, set on save')),
+                ('decision', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='mpcDecision.mpcdecision')),
+                ('member', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='votes', to='members.member')),
+            ],
+            options={
+                'verbose_name': 'Member Vote',
+                'verbose_name_plural': 'Member Votes',
+                'ordering': ['-year', 'member'],
+                'indexes': [models.Index(fields=['member', 'year'], name='member_vote_member_year_idx')],
+                'unique_together': {('decision', 'member')},
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-18 12:51
+
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+VOTE_COLUMNS = {'rate_hike': 'hikes', 'rate_cut': 'cuts', 'rate_hold': 'holds'}
+
+
+def split_baseline(apps, schema_editor):
+    """
+    The counts so far are hand-entered figures plus whatever the ledger has
+    added since 0004; keep the hand-entered part as the baseline
+    """
+    MemberVoting = apps.get_model('mpcVoting', 'MemberVoting')
+    DissentYear = apps.get_model('mpcVoting', 'DissentYear')
+    MemberVote = apps.get_model('mpcVoting', 'MemberVote')
+
+    ledger = {
+        row['member']: row
+        for row in MemberVote.objects.order_by().values('member').annotate(**{
+            column: Count('id', filter=Q(vote=vote)) for vote, column in VOTE_COLUMNS.items()
+        })
+    }
+    # The ledger counts went to the first record of each member
+    seen = set()
+    for record in MemberVoting.objects.order_by('pk'):
+        added = ledger.get(record.member_id) if record.member_id not in seen else None
+        seen.add(record.member_id)
+        for column in VOTE_COLUMNS.values():
+            setattr(record, f'baseline_{column}', max(getattr(record, column) - (added[column] if added else 0), 0))
+        record.save(update_fields=['baseline_hikes', 'baseline_cuts', 'baseline_holds'])
+
+    ledger = {
+        row['year']: row
+        for row in MemberVote.objects.order_by().values('year').annotate(
+            explicit=Count('id', filter=Q(explicit_dissent=True)),
+            implicit=Count('id', filter=Q(explicit_dissent=False, implicit_dissent=True))
+        )
+    }
+    for record in DissentYear.objects.all():
+        added = ledger.get(record.year, {'explicit': 0, 'implicit': 0})
+        record.baseline_explicit = max(record.explicit_count - added['explicit'], 0)
+        record.baseline_implicit = max(record.implicit_count - added['implicit'], 0)
+        record.save(update_fields=['baseline_explicit', 'baseline_implicit'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mpcVoting', '0004_membervote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dissentyear',
+            name='baseline_explicit',
+            field=models.PositiveIntegerField(default=0, help_text='Hand-entered explicit dissents from before the MemberVote ledger'),
+        ),
+        migrations.AddField(
+            model_name='dissentyear',
+            name='baseline_implicit',
+            field=models.PositiveIntegerField(default=0, help_text='Hand-entered implicit dissents from before the MemberVote ledger'),
+        ),
+        migrations.AddField(
+            model_name='membervoting',
+            name='baseline_cuts',
+            field=models.PositiveIntegerField(default=0, help_text='Hand-entered cuts from before the MemberVote ledger'),
+        ),
+        migrations.AddField(
+            model_name='membervoting',
+            name='baseline_hikes',
+            field=models.PositiveIntegerField(default=0, help_text='Hand-entered hikes from before the MemberVote ledger'),
+        ),
+        migrations.AddField(
+            model_name='membervoting',
+            name='baseline_holds',
+            field=models.PositiveIntegerField(default=0, help_text='Hand-entered holds from before the MemberVote ledger'),
+        ),
+        migrations.RunPython(split_baseline, migrations.RunPython.noop),
+    ]
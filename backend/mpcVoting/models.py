@@ -1,14 +1,30 @@
-from django.db import models
+from django.db import models, transaction
+
+from mpcDecision.models import MPCDecision
 
 class MemberVoting(models.Model):
     """
     Stores each MPC member's total Hikes, Cuts, and Holds. 
     TotalVotes is computed as hikes + cuts + holds.
+    The counts are the hand-entered baseline plus a rollup of MemberVote,
+    kept current by every ledger write.
     """
     name = models.CharField(max_length=100)
+    member = models.ForeignKey(
+        'members.Member',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='voting_records',
+        help_text="Canonical member, resolved from name on save"
+    )
     hikes = models.PositiveIntegerField(default=0)
     cuts = models.PositiveIntegerField(default=0)
     holds = models.PositiveIntegerField(default=0)
+    baseline_hikes = models.PositiveIntegerField(default=0, help_text="Hand-entered hikes from before the MemberVote ledger")
+    baseline_cuts = models.PositiveIntegerField(default=0, help_text="Hand-entered cuts from before the MemberVote ledger")
+    baseline_holds = models.PositiveIntegerField(default=0, help_text="Hand-entered holds from before the MemberVote ledger")
     tenure = models.CharField(
         max_length=100, 
         blank=True, 
@@ -28,15 +44,25 @@ class MemberVoting(models.Model):
     def __str__(self):
         return f"{self.name} ({self.total_votes} votes)"
 
+    def save(self, *args, **kwargs):
+        from members.models import Member
+
+        self.member_id = Member.objects.resolve(self.name)
+        super().save(*args, **kwargs)
+
 
 class DissentYear(models.Model):
     """
     Stores the yearly counts of explicit and implicit dissent. 
     We'll show a bar for each year (e.g. 2019, 2020, 2021, 2022, 2023).
+    The counts are the hand-entered baseline plus a rollup of MemberVote,
+    kept current by every ledger write.
     """
     year = models.PositiveIntegerField(unique=True)
     explicit_count = models.PositiveIntegerField(default=0)
     implicit_count = models.PositiveIntegerField(default=0)
+    baseline_explicit = models.PositiveIntegerField(default=0, help_text="Hand-entered explicit dissents from before the MemberVote ledger")
+    baseline_implicit = models.PositiveIntegerField(default=0, help_text="Hand-entered implicit dissents from before the MemberVote ledger")
 
     class Meta:
         ordering = ["year"]  # ascending order: 2019, 2020, …
@@ -44,4 +70,124 @@ class DissentYear(models.Model):
         verbose_name_plural = "Dissent Years"
 
     def __str__(self):
-        return f"{self.year} (Explicit: {self.explicit_count}, Implicit: {self.implicit_count})"
\ No newline at end of file
+        return f"{self.year} (Explicit: {self.explicit_count}, Implicit: {self.implicit_count})"
+
+
+class MemberVoteQuerySet(models.QuerySet):
+    """
+    Keeps the MemberVoting / DissentYear rollups, and through them the
+    member profiles, in step with bulk writes
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from . import rollups
+
+        objs = list(objs)
+        decisions = MPCDecision.objects.in_bulk({vote.decision_id for vote in objs})
+        for vote in objs:
+            vote.decision = decisions[vote.decision_id]
+            vote.derive()
+
+        with transaction.atomic(using=self.db):
+            # Stored votes of these decisions and members may be overwritten
+            # or kept on conflict: take them out and count what is there after
+            touched = self.model.objects.filter(decision__in=decisions, member__in={vote.member_id for vote in objs})
+            deltas = rollups.contributions(touched, sign=-1)
+            created = super().bulk_create(objs, *args, **kwargs)
+            rollups.contributions(touched, deltas=deltas)
+            rollups.apply(deltas)
+        return created
+
+    def update(self, **kwargs):
+        from . import rollups
+
+        if not {'decision', 'decision_id', 'member', 'member_id', 'vote', 'implicit_dissent'} & set(kwargs):
+            return super().update(**kwargs)
+
+        with transaction.atomic(using=self.db):
+            pks = list(self.values_list('pk', flat=True))
+            rollups.apply(rollups.contributions(self.model.objects.filter(pk__in=pks), sign=-1))
+            rows = super().update(**kwargs)
+            votes = list(self.model.objects.filter(pk__in=pks).select_related('decision'))
+            for vote in votes:
+                vote.derive()
+            self.model.objects.bulk_update(votes, ['year', 'explicit_dissent'])
+            rollups.apply(rollups.contributions(self.model.objects.filter(pk__in=pks)))
+        return rows
+
+    update.alters_data = True
+
+    def delete(self):
+        from . import rollups
+
+        with transaction.atomic(using=self.db):
+            deltas = rollups.contributions(self, sign=-1)
+            result = super().delete()
+            rollups.apply(deltas)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+
+class MemberVote(models.Model):
+    """
+    Ledger of how each member voted at each MPC meeting. MemberVoting and
+    DissentYear are derived from it: explicit dissent is a vote that differs
+    from the meeting's decision, implicit dissent is flagged by the analyst
+    on a vote that went with the decision.
+    """
+    decision = models.ForeignKey(MPCDecision, on_delete=models.CASCADE, related_name='votes')
+    member = models.ForeignKey('members.Member', on_delete=models.PROTECT, related_name='votes')
+    vote = models.CharField(max_length=20, choices=MPCDecision.POLICY_CHOICES)
+    implicit_dissent = models.BooleanField(
+        default=False,
+        help_text="Voted with the decision but dissented in the minutes"
+    )
+    explicit_dissent = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Vote differs from the decision, set on save"
+    )
+    year = models.PositiveIntegerField(editable=False, help_text="Year of the meeting, set on save")
+
+    objects = MemberVoteQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-year', 'member']
+        unique_together = ['decision', 'member']
+        indexes = [
+            models.Index(fields=['member', 'year'], name='member_vote_member_year_idx'),
+        ]
+        verbose_name = "Member Vote"
+        verbose_name_plural = "Member Votes"
+
+    def __str__(self):
+        return f"{self.member} voted {self.get_vote_display()} on {self.decision.date}"
+
+    def derive(self):
+        """Set the year and explicit dissent flag from the decision"""
+        self.year = self.decision.date.year
+        self.explicit_dissent = self.vote != self.decision.policy_change
+
+    def save(self, *args, **kwargs):
+        from . import rollups
+
+        with transaction.atomic():
+            deltas = rollups.empty_deltas()
+            if self.pk is not None:
+                deltas = rollups.contributions(MemberVote.objects.filter(pk=self.pk), sign=-1)
+            self.derive()
+            super().save(*args, **kwargs)
+            rollups.add_contribution(deltas, self.member_id, self.vote, self.year,
+                                     self.explicit_dissent, self.implicit_dissent, 1)
+            rollups.apply(deltas)
+
+    def delete(self, *args, **kwargs):
+        from . import rollups
+
+        with transaction.atomic():
+            deltas = rollups.contributions(MemberVote.objects.filter(pk=self.pk), sign=-1)
+            result = super().delete(*args, **kwargs)
+            rollups.apply(deltas)
+        return result
@@ -0,0 +1,145 @@
+"""
+Maintenance of the MemberVoting and DissentYear rollups from the MemberVote ledger.
+
+Every ledger write is turned into deltas: per member (hikes, cuts, holds)
+and per year (explicit, implicit dissents). The deltas are applied with
+F() increments in the transaction of the write, so the /api/mpcVoting/
+endpoints keep reading one small row per member or year. The counts
+entered by hand before the ledger existed are kept in the baseline_*
+columns and added on top.
+"""
+from django.db import transaction
+from django.db.models import Count, F, Q
+
+from mpcDecision.models import MPCDecision
+
+from .models import DissentYear, MemberVote, MemberVoting
+
+VOTE_COLUMNS = {
+    MPCDecision.RATE_HIKE: 'hikes',
+    MPCDecision.RATE_CUT: 'cuts',
+    MPCDecision.RATE_HOLD: 'holds',
+}
+
+
+def empty_deltas():
+    return {'members': {}, 'years': {}}
+
+
+def add_contribution(deltas, member_id, vote, year, explicit_dissent, implicit_dissent, sign):
+    """Accumulate one ledger row, counted `sign` times (+1 written, -1 removed)"""
+    member = deltas['members'].setdefault(member_id, {column: 0 for column in VOTE_COLUMNS.values()})
+    member[VOTE_COLUMNS[vote]] += sign
+    dissent = deltas['years'].setdefault(year, {'explicit_count': 0, 'implicit_count': 0})
+    if explicit_dissent:
+        dissent['explicit_count'] += sign
+    elif implicit_dissent:
+        dissent['implicit_count'] += sign
+    return deltas
+
+
+def contributions(queryset, sign=1, deltas=None):
+    """Deltas of every ledger row in a queryset, added to `deltas` when given"""
+    if deltas is None:
+        deltas = empty_deltas()
+    rows = queryset.order_by().values_list('member', 'vote', 'year', 'explicit_dissent', 'implicit_dissent')
+    for row in rows:
+        add_contribution(deltas, *row, sign)
+    return deltas
+
+
+def _increment(queryset, changes):
+    queryset.update(**{column: F(column) + change for column, change in changes.items() if change})
+
+
+def apply(deltas):
+    """Apply accumulated deltas to MemberVoting and DissentYear, creating missing rows"""
+    from members.models import Member
+
+    member_deltas = {key: value for key, value in deltas['members'].items() if any(value.values())}
+    year_deltas = {key: value for key, value in deltas['years'].items() if any(value.values())}
+    if not member_deltas and not year_deltas:
+        return
+
+    with transaction.atomic():
+        # Members may have several hand-entered records; the ledger counts go to the first
+        records = {}
+        for pk, member_id in MemberVoting.objects.filter(member__in=member_deltas).order_by('-pk').values_list('pk', 'member_id'):
+            records[member_id] = pk
+        for member_id, changes in member_deltas.items():
+            if member_id in records:
+                _increment(MemberVoting.objects.filter(pk=records[member_id]), changes)
+        names = dict(Member.objects.filter(pk__in=set(member_deltas) - set(records)).values_list('pk', 'name'))
+        # bulk_create so MemberVoting.save() does not re-resolve the member from the name
+        MemberVoting.objects.bulk_create([
+            MemberVoting(name=name, member_id=member_id, **member_deltas[member_id])
+            for member_id, name in names.items()
+        ])
+
+        existing = set(DissentYear.objects.filter(year__in=year_deltas).values_list('year', flat=True))
+        for year, changes in year_deltas.items():
+            if year in existing:
+                _increment(DissentYear.objects.filter(year=year), changes)
+        DissentYear.objects.bulk_create([
+            DissentYear(year=year, **changes)
+            for year, changes in year_deltas.items()
+            if year not in existing
+        ])
+
+    _refresh_profiles(member_deltas)
+
+
+def _refresh_profiles(member_ids):
+    # Queryset updates send no signals, so member profiles are refreshed here
+    from members import profiles
+
+    profiles.refresh(member_ids)
+
+
+def resync_decision(decision):
+    """Re-derive the ledger rows of a decision after its date or policy change was edited"""
+    with transaction.atomic():
+        votes = list(decision.votes.all())
+        deltas = contributions(decision.votes.all(), sign=-1)
+        for vote in votes:
+            vote.decision = decision
+            vote.derive()
+            add_contribution(deltas, vote.member_id, vote.vote, vote.year,
+                             vote.explicit_dissent, vote.implicit_dissent, 1)
+        MemberVote.objects.bulk_update(votes, ['year', 'explicit_dissent'])
+        apply(deltas)
+
+
+def rebuild():
+    """
+    Recompute the rollups as baseline plus the whole ledger, returning the
+    number of members and years with votes
+    """
+    with transaction.atomic():
+        votes = list(MemberVote.objects.select_related('decision'))
+        for vote in votes:
+            vote.derive()
+        MemberVote.objects.bulk_update(votes, ['year', 'explicit_dissent'], batch_size=1000)
+
+        MemberVoting.objects.update(hikes=F('baseline_hikes'), cuts=F('baseline_cuts'), holds=F('baseline_holds'))
+        DissentYear.objects.update(explicit_count=F('baseline_explicit'), implicit_count=F('baseline_implicit'))
+
+        totals = empty_deltas()
+        totals['members'] = {
+            row['member']: {column: row[column] for column in VOTE_COLUMNS.values()}
+            for row in MemberVote.objects.order_by().values('member').annotate(**{
+                column: Count('id', filter=Q(vote=vote)) for vote, column in VOTE_COLUMNS.items()
+            })
+        }
+        totals['years'] = {
+            row['year']: {'explicit_count': row['explicit_count'], 'implicit_count': row['implicit_count']}
+            for row in MemberVote.objects.order_by().values('year').annotate(
+                explicit_count=Count('id', filter=Q(explicit_dissent=True)),
+                implicit_count=Count('id', filter=Q(explicit_dissent=False, implicit_dissent=True))
+            )
+        }
+        apply(totals)
+
+    from members import profiles
+    profiles.rebuild()
+    return len(totals['members']), len(totals['years'])
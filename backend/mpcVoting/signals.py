@@ -0,0 +1,23 @@
+"""
+Keeps the MemberVote ledger, and through it the voting rollups, in step with
+edits to the decisions it refers to.
+"""
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from mpcDecision.models import MPCDecision
+
+from . import rollups
+
+
+@receiver(post_save, sender=MPCDecision)
+def resync_votes(sender, instance, raw=False, **kwargs):
+    # A new date or policy change moves the votes' year and dissent flags
+    if not raw and not kwargs.get('created'):
+        rollups.resync_decision(instance)
+
+
+@receiver(pre_delete, sender=MPCDecision)
+def remove_votes(sender, instance, **kwargs):
+    # The cascade deletes the ledger rows without calling MemberVote.delete()
+    rollups.apply(rollups.contributions(instance.votes.all(), sign=-1))
@@ -1,3 +1,52 @@
+from datetime import date
+
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
-# Create your tests here.
+from members.models import Member
+from mpcDecision.models import MPCDecision
+
+from . import rollups
+from .models import DissentYear, MemberVote, MemberVoting
+
+
+class VotingRollupTests(TestCase):
+    def setUp(self):
+        # Counts entered by hand before the ledger existed
+        self.record = MemberVoting.objects.create(
+            name='Dr. Jayanth R. Varma', hikes=3, holds=2, baseline_hikes=3, baseline_holds=2
+        )
+        self.member = Member.objects.get(pk=self.record.member_id)
+        self.year = DissentYear.objects.create(year=2022, explicit_count=4, baseline_explicit=4)
+        self.decision = MPCDecision.objects.create(
+            date=date(2022, 6, 8),
+            policy_change=MPCDecision.RATE_HIKE,
+            voting_pattern='5-1 (Majority)',
+            explicit_dissenter='6:1 Jayanth R. Varma',
+            implicit_dissent_score='0.2 VADER'
+        )
+
+    def test_ledger_votes_add_to_the_baseline(self):
+        MemberVote.objects.create(decision=self.decision, member=self.member, vote=MPCDecision.RATE_HOLD)
+
+        self.record.refresh_from_db()
+        self.year.refresh_from_db()
+        self.assertEqual((self.record.hikes, self.record.holds), (3, 3))
+        self.assertEqual(self.year.explicit_count, 5)
+
+    def test_rebuild_keeps_hand_entered_counts(self):
+        MemberVote.objects.create(decision=self.decision, member=self.member, vote=MPCDecision.RATE_HOLD)
+
+        rollups.rebuild()
+
+        self.record.refresh_from_db()
+        self.year.refresh_from_db()
+        self.assertEqual((self.record.hikes, self.record.cuts, self.record.holds), (3, 0, 3))
+        self.assertEqual((self.year.explicit_count, self.year.implicit_count), (5, 0))
+
+    def test_negative_counts_are_not_clamped(self):
+        vote = MemberVote.objects.create(decision=self.decision, member=self.member, vote=MPCDecision.RATE_CUT)
+        MemberVoting.objects.filter(pk=self.record.pk).update(cuts=0)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            vote.delete()